@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+Gunny Generation API
+
+A small local HTTP service that generates CrewAI projects without the
+Streamlit UI, for CI jobs and other tools. It accepts the same project spec
+the UI builds and returns the project ZIP or its file map.
+
+- Generation runs on a bounded worker pool; when every worker is busy and the
+  queue is full, requests get 503 with Retry-After instead of piling up.
+- Identical requests in flight at the same time share one generation.
+- Results are cached by spec digest and served with content-hash ETags, so
+  clients can revalidate with If-None-Match and get 304.
+
+Endpoints:
+    POST /generate          Project spec (JSON) -> ZIP (default)
+    POST /generate?compression=tar.gz
+                            Archive in another compression mode
+                            (stored, fast, default, max, tar.gz, zstd)
+    POST /generate?format=files
+                            Project spec (JSON) -> {"project_name", "files"}
+    GET  /health            Liveness and pool/cache statistics
+
+Usage:
+    python api_server.py
+    python api_server.py --port 8502 --workers 8 --queue-size 64
+    curl -s -X POST --data @spec.json http://127.0.0.1:8502/generate -o project.zip
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from generators.archive import (
+    archive_filename,
+    archive_mime_type,
+    available_compression_modes,
+    build_archive,
+)
+from generators.project_generator import generate_project_structure
+from utils.artifact_store import MIB, ArtifactStore
+from utils.catalog import get_tool_cache_ttls, get_tools_catalog
+from utils.constants import DEFAULT_CREW_CONFIG
+from utils.validators import validate_complete_configuration
+
+FORMATS = {"zip": "application/zip", "files": "application/json"}
+MAX_BODY_BYTES = 5 * MIB
+CACHE_SESSION = "api"
+
+# Spec fields passed through to generate_project_structure, with their defaults
+SPEC_DEFAULTS: Dict[str, Any] = {
+    "description": "",
+    "crew_config": DEFAULT_CREW_CONFIG,
+    "tools_by_agent": {},
+    "env_vars": {},
+    "python_version": "3.10",
+    "generation_mode": "complete_project",
+    "enable_langsmith": False,
+    "langsmith_project": "my-crew-project",
+    "enable_local_tracing": False,
+    "enable_tool_cache": False,
+    "tool_cache_ttls": None,
+    "enable_llm_cache": False,
+    "lazy_tool_imports": False,
+    "selected_tools": [],
+    "knowledge_sources": [],
+    "embedder": None,
+}
+
+
+# JSON types of the spec fields; (container, item type) for lists and objects
+SPEC_TYPES: Dict[str, Any] = {
+    "project_name": str,
+    "agents": (list, dict),
+    "tasks": (list, dict),
+    "description": str,
+    "crew_config": dict,
+    "tools_by_agent": (dict, list),
+    "env_vars": (dict, str),
+    "python_version": str,
+    "generation_mode": str,
+    "enable_langsmith": bool,
+    "langsmith_project": str,
+    "enable_local_tracing": bool,
+    "enable_tool_cache": bool,
+    "tool_cache_ttls": (dict, int),
+    "enable_llm_cache": bool,
+    "lazy_tool_imports": bool,
+    "selected_tools": (list, str),
+    "knowledge_sources": (list, dict),
+    "embedder": dict,
+}
+JSON_TYPE_NAMES = {str: "a string", bool: "a boolean", int: "an integer", dict: "an object", list: "an array"}
+JSON_TYPE_PLURALS = {str: "strings", int: "integers", dict: "objects", list: "arrays"}
+
+
+class ServiceOverloaded(Exception):
+    """Raised when the worker pool and its queue are full."""
+
+
+class SpecError(ValueError):
+    """Raised for a malformed or invalid project spec."""
+
+    def __init__(self, message: str, details: Any = None):
+        super().__init__(message)
+        self.details = details
+
+
+def _is_json_type(value: Any, expected: type) -> bool:
+    # bool is a subclass of int, but not a JSON integer
+    return isinstance(value, expected) and not (expected is int and isinstance(value, bool))
+
+
+def spec_type_errors(config: Dict[str, Any]) -> List[str]:
+    """
+    Check the JSON types of spec fields (null is accepted for optional fields).
+
+    Returns:
+        One message per field of the wrong type
+    """
+    errors = []
+    for field, expected in SPEC_TYPES.items():
+        value = config.get(field)
+        if value is None and field in SPEC_DEFAULTS:
+            continue
+        container, item = expected if isinstance(expected, tuple) else (expected, None)
+        if not _is_json_type(value, container):
+            errors.append(f"{field} must be {JSON_TYPE_NAMES[container]}")
+        elif item is not None:
+            items = value.values() if container is dict else value
+            if not all(_is_json_type(entry, item) for entry in items):
+                errors.append(f"{field} must be {JSON_TYPE_NAMES[container]} of {JSON_TYPE_PLURALS[item]}")
+    return errors
+
+
+def normalize_spec(spec: Any) -> Dict[str, Any]:
+    """
+    Validate a project spec and fill in defaults.
+
+    Args:
+        spec: Decoded JSON request body
+
+    Returns:
+        Keyword arguments for generate_project_structure (without tools_catalog)
+
+    Raises:
+        SpecError: If required fields are missing, fields have the wrong type or
+            the configuration is invalid
+    """
+    if not isinstance(spec, dict):
+        raise SpecError("Request body must be a JSON object")
+    missing = [field for field in ("project_name", "agents", "tasks") if not spec.get(field)]
+    if missing:
+        raise SpecError(f"Missing required field(s): {', '.join(missing)}")
+    unknown = sorted(set(spec) - set(SPEC_DEFAULTS) - {"project_name", "agents", "tasks"})
+    if unknown:
+        raise SpecError(f"Unknown field(s): {', '.join(unknown)}")
+
+    type_errors = spec_type_errors(spec)
+    if type_errors:
+        raise SpecError("Invalid field type(s)", type_errors)
+
+    config = {
+        "project_name": spec["project_name"],
+        "agents": spec["agents"],
+        "tasks": spec["tasks"],
+        **{field: spec.get(field, default) for field, default in SPEC_DEFAULTS.items()},
+    }
+    if config["enable_tool_cache"] and config["tool_cache_ttls"] is None:
+        tools = {tool for tools in config["tools_by_agent"].values() for tool in tools}
+        config["tool_cache_ttls"] = get_tool_cache_ttls(sorted(tools))
+    try:
+        is_valid, errors = validate_complete_configuration(
+            config["project_name"], config["agents"], config["tasks"], config["crew_config"]
+        )
+    except (TypeError, AttributeError) as e:
+        # A nested field (e.g. an agent's max_iter) has the wrong type
+        raise SpecError(f"Invalid field type: {e}") from e
+    if not is_valid:
+        raise SpecError("Invalid configuration", errors)
+    return config
+
+
+def spec_digest(config: Dict[str, Any], output_format: str) -> str:
+    """Hash a normalized spec and output format into a cache key."""
+    payload = json.dumps([config, output_format], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def etag_for(body: bytes) -> str:
+    """Strong ETag derived from the response body."""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+class GenerationService:
+    """Bounded, coalescing, caching front end to the project generators."""
+
+    def __init__(self, workers: int, queue_size: int, cache_bytes: int = 64 * MIB, cache_ttl: float = 600.0):
+        """
+        Args:
+            workers: Generator threads
+            queue_size: Generations allowed to wait for a worker
+            cache_bytes: In-memory budget for cached responses
+            cache_ttl: Seconds a cached response stays valid without being used
+        """
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gunny-generate")
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._cache = ArtifactStore(
+            session_budget_bytes=cache_bytes,
+            memory_budget_bytes=cache_bytes,
+            spill_threshold_bytes=cache_bytes,
+            ttl_seconds=cache_ttl,
+        )
+        self._stats = {"requests": 0, "generated": 0, "coalesced": 0, "cached": 0, "rejected": 0}
+        self.workers = workers
+        self.queue_size = queue_size
+
+    def generate(self, config: Dict[str, Any], output_format: str, compression: str = "default") -> bytes:
+        """
+        Get the response body for a normalized spec, generating it if needed.
+
+        Raises:
+            ServiceOverloaded: If no worker or queue slot is free
+            SpecError: If generation fails on a wrong-typed nested field
+        """
+        if output_format == "zip":
+            output_format = f"zip:{compression}"
+        key = spec_digest(config, output_format)
+        with self._lock:
+            self._stats["requests"] += 1
+        body = self._cache.get(CACHE_SESSION, key)
+        if body is not None:
+            with self._lock:
+                self._stats["cached"] += 1
+            return body
+
+        with self._lock:
+            future = self._inflight.get(key)
+            submitted = future is None
+            if not submitted:
+                self._stats["coalesced"] += 1
+            else:
+                if not self._slots.acquire(blocking=False):
+                    self._stats["rejected"] += 1
+                    raise ServiceOverloaded()
+                future = self._pool.submit(self._build, config, output_format)
+                self._inflight[key] = future
+        if submitted:
+            # Outside the lock: the callback runs right away if the future is already done
+            future.add_done_callback(lambda done: self._finish(key, done))
+        return future.result()
+
+    def _build(self, config: Dict[str, Any], output_format: str) -> bytes:
+        try:
+            files = generate_project_structure(**config, tools_catalog=get_tools_catalog())
+        except (TypeError, AttributeError) as e:
+            # Only the spec varies, so these come from wrong-typed nested fields
+            raise SpecError(f"Invalid field type: {e}") from e
+        if output_format.startswith("zip:"):
+            return build_archive(files, config["project_name"], mode=output_format.split(":", 1)[1])
+        return json.dumps({"project_name": config["project_name"], "files": files}).encode("utf-8")
+
+    def _finish(self, key: str, future: Future) -> None:
+        self._slots.release()
+        succeeded = future.exception() is None
+        if succeeded:
+            self._cache.put(CACHE_SESSION, key, future.result())
+        with self._lock:
+            self._inflight.pop(key, None)
+            self._stats["generated"] += int(succeeded)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return request counters and cache usage."""
+        with self._lock:
+            stats = {**self._stats, "inflight": len(self._inflight)}
+        cache = self._cache.stats()
+        return {
+            **stats,
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "cache_entries": cache["entries"],
+            "cache_bytes": cache["memory_bytes"],
+        }
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True)
+        self._cache.close()
+
+
+class GenerationHandler(BaseHTTPRequestHandler):
+    """HTTP front end; the GenerationService is attached to the server."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "GunnyAPI"
+
+    def do_GET(self):
+        if urlparse(self.path).path == "/health":
+            self._send_json(200, {"status": "ok", **self.server.service.stats()})
+        else:
+            self._send_json(404, {"error": "Not found"})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != "/generate":
+            self._send_json(404, {"error": "Not found"})
+            return
+
+        query = parse_qs(url.query)
+        output_format = query.get("format", ["zip"])[0]
+        if output_format not in FORMATS:
+            self._send_json(400, {"error": f"format must be one of: {', '.join(FORMATS)}"})
+            return
+        compression = query.get("compression", ["default"])[0]
+        if compression not in available_compression_modes():
+            self._send_json(400, {"error": f"compression must be one of: {', '.join(available_compression_modes())}"})
+            return
+
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            self._send_json(413, {"error": "Request body too large"})
+            self.close_connection = True
+            return
+
+        try:
+            config = normalize_spec(json.loads(self.rfile.read(length) or b"null"))
+            body = self.server.service.generate(config, output_format, compression)
+        except json.JSONDecodeError as e:
+            self._send_json(400, {"error": f"Invalid JSON: {e}"})
+            return
+        except SpecError as e:
+            self._send_json(422, {"error": str(e), "details": e.details})
+            return
+        except ServiceOverloaded:
+            self._send_json(503, {"error": "Generation queue is full"}, {"Retry-After": "1"})
+            return
+        except Exception as e:
+            self._send_json(500, {"error": f"Generation failed: {e}"})
+            return
+
+        etag = etag_for(body)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag in [tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")]:
+            self._send(304, b"", None, headers)
+            return
+        content_type = FORMATS[output_format]
+        if output_format == "zip":
+            filename = archive_filename(config["project_name"], compression)
+            headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+            content_type = archive_mime_type(compression)
+        self._send(200, body, content_type, headers)
+
+    def _send_json(self, status: int, payload: Dict[str, Any], headers: Dict[str, str] = None) -> None:
+        self._send(status, json.dumps(payload).encode("utf-8"), "application/json", headers or {})
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Dict[str, str]) -> None:
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def create_server(
+    host: str,
+    port: int,
+    workers: int,
+    queue_size: int,
+    verbose: bool = False,
+) -> Tuple[ThreadingHTTPServer, GenerationService]:
+    """
+    Build the HTTP server and its generation service (not yet serving).
+
+    Returns:
+        Tuple of (server, service)
+    """
+    service = GenerationService(workers, queue_size)
+    server = ThreadingHTTPServer((host, port), GenerationHandler)
+    server.daemon_threads = True
+    server.service = service
+    server.verbose = verbose
+    return server, service
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve Gunny's project generators over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=8502, help="Port to listen on (default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4, help="Generator threads (default: %(default)s)")
+    parser.add_argument("--queue-size", type=int, default=64, help="Generations that may wait for a worker (default: %(default)s)")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    server, service = create_server(args.host, args.port, args.workers, args.queue_size, args.verbose)
+    print(f"🚀 Gunny generation API on http://{args.host}:{args.port} ({args.workers} workers)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,28 +4,31 @@ Gunny - a CrewAI Companion
 A Streamlit application for creating complete CrewAI projects with all configuration options.
 """
 
+import json
+import threading
 import streamlit as st
 from typing import Dict, List, Any
 from utils.constants import (
     PROCESS_TYPES,
     DEFAULT_CREW_CONFIG,
-    KNOWLEDGE_SOURCE_TYPES,
-    EMBEDDER_PROVIDERS,
-    ENTERPRISE_APPS,
     ENV_VARIABLES,
-    TOOLS_CATALOG,
     TESTED_CREWAI_VERSIONS,
     LATEST_TESTED_VERSION,
 )
-from utils.validators import validate_complete_configuration, check_required_env_vars
-from utils.version_checker import get_version_info
-from generators.project_generator import (
-    generate_project_structure,
-    create_zip_file,
-    generate_project_summary,
+from utils.catalog import (
+    get_tools_catalog,
+    get_tool_count,
+    get_env_vars_for_tools,
+    get_embedder_config,
+    get_embedder_default_model,
+    get_embedder_providers,
+    get_local_embedder_config,
+    get_local_embedder_providers,
+    get_tool_cache_ttls,
+    get_knowledge_source_types,
+    get_enterprise_apps,
 )
-from generators.yaml_generator import generate_agents_yaml, generate_tasks_yaml
-from generators.python_generator import generate_crew_py, generate_main_py
+from utils.validators import validate_complete_configuration, check_required_env_vars
 from ui.components import (
     agent_configuration_form,
     task_configuration_form,
@@ -33,7 +36,26 @@ from ui.components import (
     code_preview,
     validation_messages,
 )
-from ui.icons import get_icon, icon_inline, icon_tab, icon_button, get_favicon_svg
+from ui.icons import get_icon, icon_inline, icon_tab, icon_button, get_favicon_svg, inject_icon_sprite
+from ui.theme import inject_theme
+from ui.session import (
+    get_cached_version_info,
+    get_artifact_store,
+    get_knowledge_store,
+    current_session_id,
+    is_session_active,
+    config_digest,
+    release_upload,
+)
+from utils.knowledge_store import (
+    KNOWLEDGE_FILE_TYPES,
+    MAX_BUNDLE_BYTES,
+    MIB,
+    KnowledgeStoreFull,
+    knowledge_archive_entries,
+    knowledge_source_type,
+    unique_knowledge_name,
+)
 
 # Page configuration
 st.set_page_config(
@@ -43,413 +65,9 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Custom dark mode styling
-st.markdown(
-    """
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Outfit:wght@300;400;500;600;700&family=Fira+Code:wght@400;500;600&display=swap');
-
-    :root {
-        --background: oklch(0.1649 0.0352 281.8285);
-        --foreground: oklch(0.9513 0.0074 260.7315);
-        --card: oklch(0.2542 0.0611 281.1423);
-        --card-foreground: oklch(0.9513 0.0074 260.7315);
-        --popover: oklch(0.2542 0.0611 281.1423);
-        --popover-foreground: oklch(0.9513 0.0074 260.7315);
-        --primary: #ec4899;
-        --primary-foreground: oklch(1.0000 0 0);
-        --secondary: oklch(0.2542 0.0611 281.1423);
-        --secondary-foreground: oklch(0.9513 0.0074 260.7315);
-        --muted: oklch(0.2123 0.0522 280.9917);
-        --muted-foreground: oklch(0.6245 0.0500 278.1046);
-        --accent: oklch(0.8903 0.1739 171.2690);
-        --accent-foreground: oklch(0.1649 0.0352 281.8285);
-        --destructive: oklch(0.6535 0.2348 34.0370);
-        --destructive-foreground: oklch(1.0000 0 0);
-        --border: oklch(0.3279 0.0832 280.7890);
-        --input: oklch(0.3279 0.0832 280.7890);
-        --ring: #ec4899;
-        --sidebar: oklch(0.1649 0.0352 281.8285);
-        --sidebar-foreground: oklch(0.9513 0.0074 260.7315);
-        --sidebar-primary: #ec4899;
-        --sidebar-accent: oklch(0.8903 0.1739 171.2690);
-        --sidebar-border: oklch(0.3279 0.0832 280.7890);
-        --font-sans: 'Outfit', sans-serif;
-        --font-mono: 'Fira Code', monospace;
-        --radius: 0.5rem;
-        --shadow-sm: 0px 4px 8px -2px hsl(0 0% 0% / 0.10), 0px 1px 2px -3px hsl(0 0% 0% / 0.10);
-        --shadow-md: 0px 4px 8px -2px hsl(0 0% 0% / 0.10), 0px 2px 4px -3px hsl(0 0% 0% / 0.10);
-        --shadow-lg: 0px 4px 8px -2px hsl(0 0% 0% / 0.10), 0px 4px 6px -3px hsl(0 0% 0% / 0.10);
-        --spacing-xs: 0.5rem;
-        --spacing-sm: 0.75rem;
-        --spacing-md: 1rem;
-        --spacing-lg: 1.5rem;
-        --spacing-xl: 2rem;
-        --spacing-2xl: 3rem;
-    }
-
-    /* Global font and background */
-    html, body, [class*="css"], .stApp {
-        font-family: var(--font-sans) !important;
-        background-color: var(--background) !important;
-        color: var(--foreground) !important;
-    }
-
-    /* Headings */
-    h1 {
-        font-family: var(--font-sans) !important;
-        color: var(--foreground) !important;
-        font-weight: 600 !important;
-        margin-bottom: var(--spacing-md) !important;
-        padding-bottom: var(--spacing-sm) !important;
-    }
-
-    h2, h3 {
-        font-family: var(--font-sans) !important;
-        color: var(--foreground) !important;
-        font-weight: 600 !important;
-        margin-top: var(--spacing-md) !important;
-        margin-bottom: var(--spacing-sm) !important;
-    }
-
-    h4, h5, h6 {
-        font-family: var(--font-sans) !important;
-        color: var(--foreground) !important;
-        font-weight: 600 !important;
-    }
-
-    /* Main content area */
-    .main .block-container {
-        background-color: var(--background) !important;
-        padding: var(--spacing-md) var(--spacing-sm) !important;
-        max-width: 1400px !important;
-    }
-
-    /* Sidebar */
-    [data-testid="stSidebar"] {
-        background-color: var(--sidebar) !important;
-        border-right: 1px solid var(--sidebar-border) !important;
-        padding: var(--spacing-md) var(--spacing-sm) !important;
-    }
-
-    [data-testid="stSidebar"] * {
-        color: var(--sidebar-foreground) !important;
-    }
-
-    /* Cards and containers */
-    [data-testid="stExpander"],
-    [data-testid="stAlert"] {
-        background-color: var(--card) !important;
-        border-radius: var(--radius) !important;
-        border: 1px solid var(--border) !important;
-        box-shadow: var(--shadow-sm) !important;
-        color: var(--card-foreground) !important;
-        margin-bottom: var(--spacing-sm) !important;
-    }
-
-    [data-testid="stExpander"] > div {
-        padding: var(--spacing-md) !important;
-    }
-
-    [data-testid="stExpanderDetails"] {
-        padding: var(--spacing-sm) var(--spacing-md) !important;
-    }
-
-    .stTabs [data-baseweb="tab-panel"] {
-        background-color: var(--card) !important;
-        border-radius: var(--radius) !important;
-        border: 1px solid var(--border) !important;
-        box-shadow: var(--shadow-sm) !important;
-        color: var(--card-foreground) !important;
-        padding: var(--spacing-md) !important;
-        margin-top: var(--spacing-md) !important;
-    }
-
-    /* Tabs */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 0.5rem;
-        background-color: transparent !important;
-        border-bottom: none !important;
-        width: 100% !important;
-        display: flex !important;
-    }
-
-    .stTabs [data-baseweb="tab"] {
-        background-color: var(--muted) !important;
-        color: var(--muted-foreground) !important;
-        border-radius: var(--radius) !important;
-        padding: 0.5rem 1rem !important;
-        font-weight: 500 !important;
-        border: 1px solid var(--border) !important;
-        flex: 1 !important;
-        text-align: center !important;
-    }
-
-    .stTabs [aria-selected="true"] {
-        background-color: var(--primary) !important;
-        color: var(--primary-foreground) !important;
-        border-color: var(--primary) !important;
-    }
-
-    /* Hide tab borders and underlines */
-    .stTabs [data-baseweb="tab-border"] {
-        display: none !important;
-    }
-
-    .stTabs [data-baseweb="tab-highlight"] {
-        display: none !important;
-    }
-
-    .stTabs::after,
-    .stTabs::before,
-    .stTabs [data-baseweb="tab-list"]::after,
-    .stTabs [data-baseweb="tab-list"]::before {
-        display: none !important;
-    }
-
-    /* Input fields */
-    .stTextInput, .stTextArea, .stNumberInput, .stSelectbox {
-        margin-bottom: var(--spacing-sm) !important;
-    }
-
-    .stTextInput input,
-    .stTextArea textarea,
-    .stNumberInput input,
-    .stSelectbox select {
-        background-color: var(--input) !important;
-        color: var(--foreground) !important;
-        border: 1px solid var(--border) !important;
-        border-radius: var(--radius) !important;
-        font-family: var(--font-sans) !important;
-        padding: var(--spacing-sm) var(--spacing-md) !important;
-    }
-
-    .stTextInput input:focus,
-    .stTextArea textarea:focus,
-    .stNumberInput input:focus,
-    .stSelectbox select:focus {
-        border-color: var(--ring) !important;
-        box-shadow: 0 0 0 2px var(--ring) !important;
-        outline: none !important;
-    }
-
-    /* Buttons */
-    .stButton, .stDownloadButton {
-        margin: var(--spacing-xs) var(--spacing-xs) !important;
-    }
-
-    .stButton button {
-        background-color: var(--primary) !important;
-        color: white !important;
-        border: none !important;
-        border-radius: var(--radius) !important;
-        padding: 0.75rem !important;
-        font-weight: 700 !important;
-        font-family: var(--font-sans) !important;
-        box-shadow: var(--shadow-sm) !important;
-        transition: all 0.2s ease !important;
-        display: flex !important;
-        align-items: center !important;
-        justify-content: center !important;
-        font-size: 2rem !important;
-        min-height: 3rem !important;
-        width: 100% !important;
-        line-height: 1 !important;
-    }
-
-    .stButton button p {
-        color: white !important;
-        margin: 0 !important;
-        padding: 0 !important;
-    }
-
-    .stButton button:hover {
-        background-color: var(--accent) !important;
-        color: var(--accent-foreground) !important;
-        box-shadow: var(--shadow-md) !important;
-        transform: translateY(-1px) !important;
-    }
-
-    .stDownloadButton button {
-        background-color: var(--accent) !important;
-        color: var(--accent-foreground) !important;
-    }
-
-    /* Metrics */
-    [data-testid="stMetric"] {
-        background-color: var(--card) !important;
-        padding: var(--spacing-sm) !important;
-        border-radius: var(--radius) !important;
-        border: 1px solid var(--border) !important;
-        margin: var(--spacing-sm) 0 !important;
-    }
-
-    [data-testid="stMetricValue"] {
-        color: var(--primary) !important;
-        font-weight: 700 !important;
-    }
-
-    [data-testid="stMetricLabel"] {
-        color: var(--muted-foreground) !important;
-        font-weight: 500 !important;
-    }
-
-    /* Info/Success/Warning/Error boxes */
-    .stAlert {
-        border-radius: var(--radius) !important;
-        padding: var(--spacing-sm) var(--spacing-md) !important;
-        margin: var(--spacing-sm) 0 !important;
-    }
-
-    [data-baseweb="notification"] {
-        background-color: var(--card) !important;
-        border-left: 4px solid var(--primary) !important;
-    }
-
-    /* Sidebar info text styling - smaller and lighter */
-    [data-testid="stSidebar"] .stAlert p {
-        font-size: 0.85rem !important;
-        font-weight: 400 !important;
-        line-height: 1.5 !important;
-    }
-
-    /* Code blocks */
-    code {
-        font-family: var(--font-mono) !important;
-        background-color: var(--muted) !important;
-        color: var(--foreground) !important;
-        border-radius: calc(var(--radius) - 2px) !important;
-        padding: 0.2rem 0.5rem !important;
-    }
-
-    pre {
-        font-family: var(--font-mono) !important;
-        background-color: var(--muted) !important;
-        color: var(--foreground) !important;
-        border-radius: var(--radius) !important;
-        padding: var(--spacing-sm) var(--spacing-md) !important;
-        margin: var(--spacing-sm) 0 !important;
-        overflow-x: auto !important;
-    }
-
-    /* Checkbox and radio */
-    .stCheckbox, .stRadio {
-        padding: var(--spacing-xs) 0 !important;
-        margin: var(--spacing-xs) 0 !important;
-    }
-
-    .stCheckbox label,
-    .stRadio label {
-        color: var(--foreground) !important;
-        font-family: var(--font-sans) !important;
-    }
-
-    /* Radio button custom styling - brand pink */
-    .stRadio [role="radio"][aria-checked="true"]::before {
-        background-color: var(--primary) !important;
-    }
-
-    .stRadio [role="radio"]::before {
-        border-color: var(--primary) !important;
-    }
-
-    /* Remove white center dot from selected radio buttons */
-    .stRadio [role="radio"][aria-checked="true"]::after {
-        display: none !important;
-    }
-
-    /* Ensure transparent background for all radio inner elements */
-    .stRadio [role="radio"]::after {
-        background-color: transparent !important;
-    }
-
-    /* Dataframe */
-    [data-testid="stDataFrame"] {
-        border-radius: var(--radius) !important;
-        overflow: hidden !important;
-        box-shadow: var(--shadow-sm) !important;
-    }
-
-    /* Multiselect */
-    .stMultiSelect [data-baseweb="tag"] {
-        background-color: var(--primary) !important;
-        color: var(--primary-foreground) !important;
-        border-radius: calc(var(--radius) - 2px) !important;
-        padding: var(--spacing-xs) var(--spacing-sm) !important;
-        margin: var(--spacing-xs) !important;
-    }
-
-    /* Columns */
-    [data-testid="column"] {
-        padding: 0 var(--spacing-xs) !important;
-    }
-
-    /* Slider */
-    .stSlider [data-baseweb="slider"] {
-        background-color: var(--muted) !important;
-    }
-
-    .stSlider [role="slider"] {
-        background-color: var(--primary) !important;
-    }
-
-    /* Scrollbar */
-    ::-webkit-scrollbar {
-        width: 10px;
-        height: 10px;
-    }
-
-    ::-webkit-scrollbar-track {
-        background: var(--background);
-    }
-
-    ::-webkit-scrollbar-thumb {
-        background: var(--muted);
-        border-radius: var(--radius);
-    }
-
-    ::-webkit-scrollbar-thumb:hover {
-        background: var(--primary);
-    }
-
-    /* Links */
-    a {
-        color: var(--primary) !important;
-        text-decoration: none !important;
-    }
-
-    a:hover {
-        color: var(--accent) !important;
-        text-decoration: underline !important;
-    }
-
-    /* Divider */
-    hr {
-        border-color: var(--border) !important;
-        margin: var(--spacing-md) 0 !important;
-    }
-
-    /* Remove Streamlit branding elements */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-
-    /* Spinner */
-    .stSpinner > div {
-        border-top-color: var(--primary) !important;
-    }
-
-    /* Section Container - Card-like styling for section groups */
-    .section-container {
-        background: oklch(0.28 0.065 281);
-        border-radius: var(--radius);
-        padding: var(--space-md);
-        margin-bottom: var(--space-lg);
-        border: 1px solid var(--border);
-    }
-</style>
-""",
-    unsafe_allow_html=True,
-)
+# Custom dark mode styling (static/theme.css) and icon sprite (static/icons.svg)
+inject_theme()
+inject_icon_sprite()
 
 # Initialize session state
 if "agents" not in st.session_state:
@@ -464,11 +82,20 @@ if "tools_by_agent" not in st.session_state:
     st.session_state.tools_by_agent = {}
 if "knowledge_sources" not in st.session_state:
     st.session_state.knowledge_sources = []
+if "knowledge_files" not in st.session_state:
+    st.session_state.knowledge_files = []
+if "knowledge_upload_key" not in st.session_state:
+    st.session_state.knowledge_upload_key = 0
 if "env_vars" not in st.session_state:
     st.session_state.env_vars = {}
 if "generation_mode" not in st.session_state:
     st.session_state.generation_mode = "core_files"
 
+# Drop the artifacts, uploads and bundles of ended sessions on every rerun,
+# whichever tab is in use and whether or not the configuration is valid
+get_artifact_store().maybe_sweep(is_session_active)
+get_knowledge_store().sweep(is_session_active)
+
 # Header - Brand box matching tabs width
 st.markdown(
     """
@@ -499,11 +126,12 @@ with st.sidebar:
     st.metric("Tasks", len(st.session_state.tasks))
     st.markdown("---")
 
-    # CrewAI Version Check
+    # CrewAI Version Check (cached per process, re-detected when packages change)
     try:
-        version, is_compatible, message = get_version_info(
+        version, is_compatible, message = get_cached_version_info(
             TESTED_CREWAI_VERSIONS,
-            LATEST_TESTED_VERSION
+            LATEST_TESTED_VERSION,
+            refresh=st.button("🔄 Re-check CrewAI version", key="refresh_version_check"),
         )
 
         if message:
@@ -523,7 +151,7 @@ with st.sidebar:
     )
 
 # Main tabs
-tool_count = sum(len(tools) for tools in TOOLS_CATALOG.values())
+tool_count = get_tool_count()
 tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs(
     [
         "Project Info",
@@ -576,7 +204,7 @@ with tab1:
         if x == "core_files"
         else "Complete Project",
         index=0 if st.session_state.generation_mode == "core_files" else 1,
-        help="Core Files: generates only agents.yaml, tasks.yaml, crew.py, main.py for existing projects. Complete Project: generates full project structure with all boilerplate.",
+        help="Core Files: generates only agents.yaml, tasks.yaml, crew.py, main.py and the modules main.py uses (batch, shard and startup benchmark runners) for existing projects. Complete Project: generates full project structure with all boilerplate.",
         horizontal=True,
     )
     st.session_state.generation_mode = generation_mode
@@ -592,17 +220,18 @@ with tab1:
         st.code(
             f"""
 {project_name}/
+├── knowledge/
+│   └── README.md
 └── src/{project_name}/
     ├── main.py
     ├── crew.py
+    ├── batch.py, shard_runner.py, startup_benchmark.py
     ├── config/
     │   ├── agents.yaml
     │   └── tasks.yaml
-    ├── tools/ {tool_files_note}
-    │   ├── __init__.py
-    │   └── custom_tool.py (+ tool stubs)
-    └── knowledge/
-        └── README.md
+    └── tools/ {tool_files_note}
+        ├── __init__.py
+        └── custom_tool.py (+ tool stubs)
 """,
             language="text",
         )
@@ -618,18 +247,19 @@ with tab1:
 ├── .env
 ├── README.md
 ├── pyproject.toml
+├── knowledge/
+│   └── README.md
 └── src/{project_name}/
     ├── __init__.py
     ├── main.py
     ├── crew.py
+    ├── batch.py, shard_runner.py, startup_benchmark.py
     ├── config/
     │   ├── agents.yaml
     │   └── tasks.yaml
-    ├── tools/ {tool_files_note}
-    │   ├── __init__.py
-    │   └── custom_tool.py (+ tool stubs)
-    └── knowledge/
-        └── README.md
+    └── tools/ {tool_files_note}
+        ├── __init__.py
+        └── custom_tool.py (+ tool stubs)
 """,
             language="text",
         )
@@ -640,25 +270,6 @@ with tab2:
     st.markdown("Configure your AI agents with roles, goals, and capabilities.")
 
     # Agent management buttons
-    st.markdown(
-        """<style>
-        button[key="add_agent_btn"], button[key="remove_agent_btn"] {
-            height: 3rem !important;
-            min-height: 3rem !important;
-            max-height: 3rem !important;
-            padding: 0.75rem !important;
-        }
-        button[key="add_agent_btn"] p, button[key="remove_agent_btn"] p {
-            font-size: 1.5rem !important;
-            font-weight: 700 !important;
-            color: white !important;
-            line-height: 1 !important;
-            margin: 0 !important;
-            padding: 0 !important;
-        }
-        </style>""",
-        unsafe_allow_html=True
-    )
     col1, col2, col3 = st.columns([0.3, 0.3, 4.4])
     with col1:
         if st.button("➕", key="add_agent_btn", help="Add Agent", use_container_width=True):
@@ -719,25 +330,6 @@ with tab3:
     ]
 
     # Task management buttons
-    st.markdown(
-        """<style>
-        button[key="add_task_btn"], button[key="remove_task_btn"] {
-            height: 3rem !important;
-            min-height: 3rem !important;
-            max-height: 3rem !important;
-            padding: 0.75rem !important;
-        }
-        button[key="add_task_btn"] p, button[key="remove_task_btn"] p {
-            font-size: 1.5rem !important;
-            font-weight: 700 !important;
-            color: white !important;
-            line-height: 1 !important;
-            margin: 0 !important;
-            padding: 0 !important;
-        }
-        </style>""",
-        unsafe_allow_html=True
-    )
     col1, col2, col3 = st.columns([0.3, 0.3, 4.4])
     with col1:
         if st.button("➕", key="add_task_btn", help="Add Task", use_container_width=True):
@@ -802,6 +394,25 @@ with tab4:
     )
     st.session_state.crew_config["cache"] = cache
 
+    enable_tool_cache = st.checkbox(
+        "Persist Tool Cache Across Runs",
+        value=st.session_state.get("enable_tool_cache", False),
+        disabled=not cache,
+        help="Keep tool results in a local SQLite cache (.tool_cache/) keyed by tool and arguments, "
+        "with a TTL per tool category, so repeated runs and batch jobs skip duplicate search and "
+        "scrape calls; show hit rates with `python main.py tool_cache_stats`",
+    )
+    st.session_state.enable_tool_cache = enable_tool_cache
+
+    enable_llm_cache = st.checkbox(
+        "Cache LLM Responses",
+        value=st.session_state.get("enable_llm_cache", False),
+        help="Record LLM responses locally (.llm_cache/), keyed by model, prompt and parameters, so re-runs, "
+        "`train`, `test` and `replay` are near-instant and deterministic; set CREW_LLM_CACHE to "
+        "record, replay or passthrough",
+    )
+    st.session_state.enable_llm_cache = enable_llm_cache
+
     st.markdown("---")
 
     st.subheader("Observability & Tracing")
@@ -838,6 +449,14 @@ with tab4:
 
         st.info("Get your free API key at: https://smith.langchain.com")
 
+    enable_local_tracing = st.checkbox(
+        "Enable Local Tracing",
+        value=st.session_state.get("enable_local_tracing", False),
+        help="Record task, tool and LLM latency, tokens, retries and cache hits as JSONL in traces/ "
+        "(no external service); summarize with `python main.py trace_summary`",
+    )
+    st.session_state.enable_local_tracing = enable_local_tracing
+
     st.markdown("---")
 
     st.subheader("Advanced Settings")
@@ -867,6 +486,15 @@ with tab4:
     else:
         st.session_state.crew_config["max_rpm"] = None
 
+    lazy_tool_imports = st.checkbox(
+        "Import Tools Lazily",
+        value=st.session_state.get("lazy_tool_imports", False),
+        help="Import each tool inside the agent method that uses it instead of at the top of crew.py, "
+        "so importing the crew (and main.py commands that never build it) stays fast; "
+        "measure with `python main.py startup_benchmark`",
+    )
+    st.session_state.lazy_tool_imports = lazy_tool_imports
+
     st.markdown("---")
 
     # Hierarchical Process Settings
@@ -904,6 +532,58 @@ with tab6:
     st.markdown("Add knowledge sources for your agents.")
     st.markdown("---")
 
+    st.subheader("Knowledge Files")
+
+    # Uploads are copied to disk in chunks and deduplicated by content hash;
+    # the session keeps only {"name", "digest", "size"} for each file.
+    # Streamlit buffers an upload in memory until it is copied and released,
+    # so files are taken one at a time, each capped by server.maxUploadSize
+    upload = st.file_uploader(
+        "Upload a file to bundle into knowledge/",
+        type=sorted(KNOWLEDGE_FILE_TYPES),
+        key=f"knowledge_upload_{st.session_state.knowledge_upload_key}",
+        help=(
+            "Files are added to the project's knowledge/ directory in the download, "
+            f"up to {MAX_BUNDLE_BYTES // MIB} MiB in total"
+        ),
+    )
+    if upload is not None:
+        known = {entry["digest"]: entry["name"] for entry in st.session_state.knowledge_files}
+        try:
+            entry = get_knowledge_store().add(current_session_id(), upload.name, upload)
+        except KnowledgeStoreFull as e:
+            st.error(f"{upload.name}: {e}")
+            entry = None
+        release_upload(upload)
+        if entry is not None and entry["digest"] in known:
+            st.info(f"{upload.name} is already uploaded as {known[entry['digest']]}")
+        elif entry is not None:
+            entry["name"] = unique_knowledge_name(entry["name"], set(known.values()))
+            st.session_state.knowledge_files.append(entry)
+            st.session_state.knowledge_sources.append({
+                "type": knowledge_source_type(entry["name"]),
+                "config": {"path": f"knowledge/{entry['name']}"},
+                "upload": entry["digest"],
+            })
+        # A new uploader key clears the widget for the next file
+        st.session_state.knowledge_upload_key += 1
+        st.rerun()
+
+    for entry in st.session_state.knowledge_files:
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            st.markdown(f"`knowledge/{entry['name']}` ({entry['size'] / (1024 * 1024):.1f} MiB)")
+        with col2:
+            if st.button("Remove", key=f"knowledge_file_{entry['digest'][:16]}_remove_btn"):
+                get_knowledge_store().release(current_session_id(), entry["digest"])
+                st.session_state.knowledge_files.remove(entry)
+                st.session_state.knowledge_sources = [
+                    source for source in st.session_state.knowledge_sources
+                    if source.get("upload") != entry["digest"]
+                ]
+                st.rerun()
+
+    st.markdown("---")
     st.subheader("Knowledge Sources")
 
     col1, col2 = st.columns([1, 3])
@@ -920,10 +600,11 @@ with tab6:
     if len(st.session_state.knowledge_sources) > 0:
         for i, source in enumerate(st.session_state.knowledge_sources):
             with st.expander(f"Knowledge Source {i + 1}", expanded=True):
+                knowledge_source_types = get_knowledge_source_types()
                 source_type = st.selectbox(
                     "Source Type",
-                    options=KNOWLEDGE_SOURCE_TYPES,
-                    index=KNOWLEDGE_SOURCE_TYPES.index(source.get("type", "String")),
+                    options=knowledge_source_types,
+                    index=knowledge_source_types.index(source.get("type", "String")),
                     key=f"knowledge_{i}_type",
                 )
                 source["type"] = source_type
@@ -963,35 +644,86 @@ with tab6:
     st.session_state.use_embedder = use_embedder
 
     if use_embedder:
-        embedder_provider = st.selectbox(
-            "Embedder Provider",
-            options=EMBEDDER_PROVIDERS,
-            help="Vector embedding provider",
+        embedder_local = st.checkbox(
+            "Run embeddings locally (no network)",
+            value=st.session_state.get("embedder_local", False),
+            help="Knowledge retrieval and memory embed text on the machine running the crew",
         )
-        st.session_state.embedder_provider = embedder_provider
+        st.session_state.embedder_local = embedder_local
+
+        if embedder_local:
+            local_providers = get_local_embedder_providers()
+            current_provider = st.session_state.get("embedder_provider", "sentence_transformer")
+            embedder_provider = st.selectbox(
+                "Local Embedder",
+                options=local_providers,
+                index=local_providers.index(current_provider) if current_provider in local_providers else 0,
+                help="sentence_transformer and onnx load a model directory from disk; ollama uses a local Ollama server",
+            )
+            st.session_state.embedder_provider = embedder_provider
+
+            default_model = get_local_embedder_config(embedder_provider)["config"]["model"]
+            embedder_model = st.text_input(
+                "Model Name" if embedder_provider == "ollama" else "Model Path",
+                value=st.session_state.get("embedder_model", ""),
+                placeholder=default_model,
+                help="Ollama model name" if embedder_provider == "ollama" else "Model directory, relative to the project root",
+            )
+            st.session_state.embedder_model = embedder_model
+
+            col1, col2 = st.columns(2)
+            with col1:
+                embedder_batch_size = st.number_input(
+                    "Batch Size",
+                    min_value=1,
+                    max_value=1024,
+                    value=st.session_state.get("embedder_batch_size", 32),
+                    help="Texts embedded per model call",
+                )
+                st.session_state.embedder_batch_size = embedder_batch_size
+            with col2:
+                embedder_threads = st.number_input(
+                    "Threads",
+                    min_value=0,
+                    max_value=256,
+                    value=st.session_state.get("embedder_threads", 0),
+                    help="CPU threads for inference (0 = runtime default)",
+                )
+                st.session_state.embedder_threads = embedder_threads
+
+            st.caption(
+                "Knowledge retrieval and crew memory (when enabled) use this embedder. "
+                "The generated project includes tests/test_local_embeddings.py, an offline smoke test."
+            )
+        else:
+            embedder_providers = get_embedder_providers()
+            current_provider = st.session_state.get("embedder_provider", "openai")
+            embedder_provider = st.selectbox(
+                "Embedder Provider",
+                options=embedder_providers,
+                index=embedder_providers.index(current_provider if current_provider in embedder_providers else "openai"),
+                help="Vector embedding provider",
+            )
+            st.session_state.embedder_provider = embedder_provider
+
+            default_model = get_embedder_default_model(embedder_provider) or ""
+            embedder_model = st.text_input(
+                "Embedding Model",
+                value=st.session_state.get("embedder_model", ""),
+                placeholder=default_model or "Provider default",
+                help="Leave empty to use the provider's default model",
+            )
+            st.session_state.embedder_model = embedder_model
 
 # Tab 7: ENV Configuration
 with tab7:
     st.header("Environment Variables")
 
-    # Helper: Extract env vars from selected tools
-    def get_tool_env_vars(selected_tools: List[str]) -> Dict[str, List[str]]:
-        """Get environment variables required by selected tools with tool names."""
-        tool_env_map = {}
-        for category, tools in TOOLS_CATALOG.items():
-            for tool in tools:
-                if tool["name"] in selected_tools and tool.get("env_vars"):
-                    for env_var in tool["env_vars"]:
-                        if env_var not in tool_env_map:
-                            tool_env_map[env_var] = []
-                        tool_env_map[env_var].append(tool["name"])
-        return tool_env_map
-
     # Section 1: Auto-Detected from Tools
     st.markdown('<div class="section-container">', unsafe_allow_html=True)
     st.subheader("Auto-Detected from Tools")
 
-    tool_env_vars = get_tool_env_vars(st.session_state.selected_tools)
+    tool_env_vars = get_env_vars_for_tools(st.session_state.selected_tools)
 
     if tool_env_vars:
         st.info(f"Detected {len(tool_env_vars)} environment variable(s) required by selected tools")
@@ -1104,7 +836,7 @@ with tab7:
 
     enterprise_apps = st.multiselect(
         "Enterprise App Integrations",
-        options=ENTERPRISE_APPS,
+        options=get_enterprise_apps(),
         help="Select enterprise applications to integrate",
     )
     st.session_state.enterprise_apps = enterprise_apps
@@ -1138,48 +870,175 @@ with tab8:
         validation_messages(errors)
 
         if is_valid:
-            # Generate project files for download button
-            project_files = generate_project_structure(
-                project_name,
-                st.session_state.project_description,
-                st.session_state.agents,
-                st.session_state.tasks,
-                st.session_state.crew_config,
-                st.session_state.tools_by_agent,
-                st.session_state.env_vars,
-                st.session_state.get("python_version", "3.10"),
-                st.session_state.generation_mode,
-                st.session_state.get("enable_langsmith", False),
-                st.session_state.get("langsmith_project", "my-crew-project"),
-                st.session_state.get("selected_tools", []),
-                TOOLS_CATALOG,
+            # Generators (and PyYAML) load only once there is something to generate
+            from generators.project_generator import (
+                generate_project_structure,
+                archive_digest,
+                generate_project_summary,
+            )
+            from generators.archive import (
+                COMPRESSION_LABELS,
+                archive_filename,
+                archive_mime_type,
+                available_compression_modes,
+                build_archive,
             )
 
-            # Create ZIP file
-            zip_data = create_zip_file(project_files, project_name)
+            # Generated artifacts live in the bounded artifact store, keyed by a
+            # digest of the configuration, so unchanged configs are not regenerated
+            artifact_store = get_artifact_store()
+            session_id = current_session_id()
+
+            embedder_config = None
+            if st.session_state.get("use_embedder") and st.session_state.get("embedder_local"):
+                local_providers = get_local_embedder_providers()
+                provider = st.session_state.get("embedder_provider")
+                embedder_config = get_local_embedder_config(
+                    provider if provider in local_providers else local_providers[0],
+                    st.session_state.get("embedder_model") or None,
+                    batch_size=int(st.session_state.get("embedder_batch_size", 32)),
+                    threads=int(st.session_state.get("embedder_threads", 0)) or None,
+                )
+            elif st.session_state.get("use_embedder"):
+                embedder_config = get_embedder_config(
+                    st.session_state.get("embedder_provider", "openai"),
+                    st.session_state.get("embedder_model") or None,
+                )
+
+            # The persistent tool cache backs CrewAI's cache, so it needs cache enabled
+            use_tool_cache = bool(
+                st.session_state.get("enable_tool_cache") and st.session_state.crew_config.get("cache", True)
+            )
+            tool_cache_ttls = None
+            if use_tool_cache:
+                selected = {tool for tools in st.session_state.tools_by_agent.values() for tool in tools}
+                tool_cache_ttls = get_tool_cache_ttls(sorted(selected))
+
+            generation_config = {
+                "project_name": project_name,
+                "description": st.session_state.project_description,
+                "agents": st.session_state.agents,
+                "tasks": st.session_state.tasks,
+                "crew_config": st.session_state.crew_config,
+                "tools_by_agent": st.session_state.tools_by_agent,
+                "env_vars": st.session_state.env_vars,
+                "python_version": st.session_state.get("python_version", "3.10"),
+                "generation_mode": st.session_state.generation_mode,
+                "enable_langsmith": st.session_state.get("enable_langsmith", False),
+                "langsmith_project": st.session_state.get("langsmith_project", "my-crew-project"),
+                "enable_local_tracing": st.session_state.get("enable_local_tracing", False),
+                "enable_tool_cache": use_tool_cache,
+                "tool_cache_ttls": tool_cache_ttls,
+                "enable_llm_cache": st.session_state.get("enable_llm_cache", False),
+                "lazy_tool_imports": st.session_state.get("lazy_tool_imports", False),
+                "selected_tools": st.session_state.get("selected_tools", []),
+                "knowledge_sources": st.session_state.knowledge_sources,
+                "embedder": embedder_config,
+            }
+            digest = config_digest(generation_config)
+
+            cached_files = artifact_store.get(session_id, "project_files", version=digest)
+            if cached_files is not None:
+                project_files = json.loads(cached_files)
+            else:
+                project_files = generate_project_structure(
+                    **generation_config, tools_catalog=get_tools_catalog()
+                )
+                artifact_store.put(session_id, "project_files", json.dumps(project_files), version=digest)
+
+            compression = st.selectbox(
+                "Archive format",
+                options=available_compression_modes(),
+                index=available_compression_modes().index("default"),
+                format_func=lambda mode: COMPRESSION_LABELS[mode],
+                key="compression_mode",
+                help="Stored is fastest for small text projects; tar.gz and zstd give the smallest downloads.",
+            )
 
             # Customize filename based on mode
-            if st.session_state.generation_mode == "core_files":
-                zip_filename = f"{project_name}_core.zip"
+            suffix = "_core" if st.session_state.generation_mode == "core_files" else ""
+            zip_filename = archive_filename(project_name, compression, suffix)
+
+            knowledge_files = st.session_state.knowledge_files
+            knowledge_bytes = sum(entry["size"] for entry in knowledge_files)
+            if knowledge_files and knowledge_bytes <= MAX_BUNDLE_BYTES:
+                # Bundles with uploads are written to disk, streaming each
+                # knowledge file from the store, only when the download is
+                # clicked (Streamlit runs the data callable on its own thread
+                # and holds the result in memory while serving it)
+                from generators.archive import write_archive
+
+                knowledge_store = get_knowledge_store()
+                bundle_digest = config_digest(
+                    {"config": digest, "knowledge": knowledge_files, "compression": compression}
+                )
+                archive_path = knowledge_store.archive_path(
+                    session_id, f"{bundle_digest[:16]}-{zip_filename}"
+                )
+                entries = knowledge_archive_entries(knowledge_files, knowledge_store, "knowledge")
+
+                def build_bundle(
+                    archive_path=archive_path,
+                    files={**project_files, **entries},
+                    project_name=project_name,
+                    compression=compression,
+                    session_id=session_id,
+                ) -> bytes:
+                    if not archive_path.exists():
+                        partial_path = archive_path.with_name(f"{archive_path.name}.{threading.get_ident()}.part")
+                        with open(partial_path, "wb") as f:
+                            write_archive(files, project_name, f, mode=compression)
+                        partial_path.replace(archive_path)
+                        artifact_store.put(
+                            session_id, "bundle_digest", archive_digest(archive_path), version=archive_path.name
+                        )
+                    return archive_path.read_bytes()
+
+                zip_data = build_bundle
+                zip_digest = artifact_store.get(session_id, "bundle_digest", version=archive_path.name)
             else:
-                zip_filename = f"{project_name}.zip"
+                if knowledge_files:
+                    st.warning(
+                        f"Your knowledge files total {knowledge_bytes / MIB:.0f} MiB, more than the "
+                        f"{MAX_BUNDLE_BYTES // MIB} MiB that fit in one download. The project includes "
+                        "their knowledge sources; copy the files into `knowledge/` yourself."
+                    )
+                archive_key = f"project_archive_{compression}"
+                zip_data = artifact_store.get(session_id, archive_key, version=digest)
+                if zip_data is None:
+                    zip_data = build_archive(project_files, project_name, mode=compression)
+                    artifact_store.put(session_id, archive_key, zip_data, version=digest)
+                zip_digest = archive_digest(zip_data)
 
             # Download button at top
             st.download_button(
-                label="Download ZIP",
+                label="Download ZIP" if zip_filename.endswith(".zip") else "Download Archive",
                 data=zip_data,
                 file_name=zip_filename,
-                mime="application/zip",
+                mime=archive_mime_type(compression),
                 use_container_width=True,
                 type="primary",
             )
+            # Archives are byte-reproducible, so the same config always has the same digest
+            if zip_digest is not None:
+                st.caption(f"SHA-256: `{zip_digest}`")
+            else:
+                st.caption("The archive (with knowledge files) is built when you click download.")
 
             # Customize success message based on mode
+            # Python modules at the top of the package (crew.py, main.py, batch.py, ...)
+            src_prefix = f"src/{project_name}/"
+            module_files = sorted(
+                path[len(src_prefix):]
+                for path in project_files
+                if path.startswith(src_prefix) and "/" not in path[len(src_prefix):] and path.endswith(".py")
+            )
             if st.session_state.generation_mode == "core_files":
                 tool_count = len(st.session_state.get("selected_tools", []))
                 tool_msg = f" + {tool_count} tool stubs" if tool_count > 0 else " + tool template"
                 st.success(
-                    f"Core files generated successfully! Download includes: agents.yaml, tasks.yaml, crew.py, main.py{tool_msg}, and knowledge directory"
+                    f"Core files generated successfully! Download includes: agents.yaml, tasks.yaml, "
+                    f"{', '.join(module_files)}{tool_msg}, and knowledge directory"
                 )
             else:
                 tool_count = len(st.session_state.get("selected_tools", []))
@@ -1211,7 +1070,8 @@ with tab8:
 
             st.markdown("---")
 
-            # Generate preview
+            # Preview the generated files
+            src_dir = f"src/{project_name}"
             col1, col2 = st.columns(2)
 
             with col1:
@@ -1219,16 +1079,14 @@ with tab8:
                     f"<h3>{icon_inline('file', 20)} agents.yaml</h3>",
                     unsafe_allow_html=True,
                 )
-                agents_yaml = generate_agents_yaml(st.session_state.agents)
-                st.code(agents_yaml, language="yaml")
+                st.code(project_files[f"{src_dir}/config/agents.yaml"], language="yaml")
 
             with col2:
                 st.markdown(
                     f"<h3>{icon_inline('file', 20)} tasks.yaml</h3>",
                     unsafe_allow_html=True,
                 )
-                tasks_yaml = generate_tasks_yaml(st.session_state.tasks)
-                st.code(tasks_yaml, language="yaml")
+                st.code(project_files[f"{src_dir}/config/tasks.yaml"], language="yaml")
 
             st.markdown("---")
 
@@ -1239,23 +1097,14 @@ with tab8:
                     f"<h3>{icon_inline('code', 20)} crew.py</h3>",
                     unsafe_allow_html=True,
                 )
-                crew_py = generate_crew_py(
-                    project_name,
-                    st.session_state.agents,
-                    st.session_state.tasks,
-                    st.session_state.crew_config,
-                    st.session_state.tools_by_agent,
-                )
-                st.code(crew_py, language="python")
+                st.code(project_files[f"{src_dir}/crew.py"], language="python")
 
             with col4:
                 st.markdown(
                     f"<h3>{icon_inline('code', 20)} main.py</h3>",
                     unsafe_allow_html=True,
                 )
-                input_vars = []  # Extract from descriptions
-                main_py = generate_main_py(project_name, input_vars)
-                st.code(main_py, language="python")
+                st.code(project_files[f"{src_dir}/main.py"], language="python")
 
             st.markdown("---")
 
@@ -1308,15 +1157,16 @@ Traces will appear in your LangSmith dashboard for debugging and monitoring.
             )
 
             if st.session_state.generation_mode == "core_files":
+                module_list = ", ".join(f"`{name}`" for name in module_files)
                 st.markdown(f"""
 1. **Extract the ZIP file** to your existing CrewAI project
 2. **Copy the files** to your project structure:
    - Place `agents.yaml` and `tasks.yaml` in your `config/` directory
-   - Place `crew.py` and `main.py` in your source directory
+   - Place the Python modules ({module_list}) in your source directory
    - Copy the `tools/` directory with generated tool stubs
-   - Copy the `knowledge/` directory for RAG data sources
+   - Copy the `knowledge/` directory to your project root (next to `pyproject.toml`) for RAG data sources
 3. **Review generated tool stubs** in `tools/` directory and configure as needed
-4. **Add knowledge base files** to `knowledge/` directory (PDFs, text files, etc.)
+4. **Add knowledge base files** to the root `knowledge/` directory (PDFs, text files, etc.)
 5. **Update imports** in your code if needed
 6. **Configure your `.env`** file with required API keys
 7. **Run your crew:**
@@ -1336,7 +1186,7 @@ Traces will appear in your LangSmith dashboard for debugging and monitoring.
    crewai install
    ```
 4. **Review generated tool stubs** in `src/{project_name}/tools/` directory
-5. **Add knowledge base files** to `src/{project_name}/knowledge/` directory (optional)
+5. **Add knowledge base files** to the `knowledge/` directory at the project root (optional)
 6. **Configure environment variables:**
    - Edit the `.env` file with your API keys
 7. **Run your crew:**
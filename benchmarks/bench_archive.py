@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Archive Compression Benchmark for Gunny
+
+Builds project archives in every available compression mode and reports
+archive size, compression ratio and build time, so the size/time trade-off of
+each mode can be compared. Bundles can include synthetic knowledge files
+(compressible text plus incompressible binary, like PDFs and images) and are
+run both single-threaded and with parallel deflate.
+
+Usage:
+    python -m benchmarks.bench_archive
+    python -m benchmarks.bench_archive --agents 10 --knowledge-mb 0,16,64 --workers 1,8
+    python -m benchmarks.bench_archive --compare bench_archive.json
+"""
+
+import argparse
+import os
+import random
+import sys
+from typing import Any, Dict, List
+
+from benchmarks.common import (
+    LOREM,
+    build_synthetic_crew,
+    compare_results,
+    run_metadata,
+    time_call,
+    write_results,
+)
+from generators.archive import available_compression_modes, build_archive
+from generators.project_generator import generate_project_structure
+from utils.catalog import get_tools_catalog
+
+DEFAULT_KNOWLEDGE_MB = [0, 16, 64]
+
+
+def knowledge_files(total_mb: int, binary_share: float = 0.25) -> Dict[str, bytes]:
+    """
+    Build deterministic synthetic knowledge files.
+
+    Args:
+        total_mb: Total size in MiB (0 for none)
+        binary_share: Fraction of the bytes that are incompressible
+
+    Returns:
+        Dictionary mapping knowledge file paths to contents
+    """
+    if total_mb <= 0:
+        return {}
+    total = total_mb * 1024 * 1024
+    binary_size = int(total * binary_share)
+    text_size = total - binary_size
+    words = LOREM.split()
+    rng = random.Random(0)
+    text = " ".join(rng.choice(words) for _ in range(text_size // 5)).encode("utf-8")[:text_size]
+    return {
+        "knowledge/corpus.txt": text,
+        "knowledge/scans.bin": rng.randbytes(binary_size),
+    }
+
+
+def run_benchmarks(
+    agents: int,
+    knowledge_sizes: List[int],
+    workers: List[int],
+    modes: List[str],
+    repeat: int,
+) -> List[Dict[str, Any]]:
+    """
+    Build an archive for every knowledge size, mode and worker count.
+
+    Returns:
+        List of result rows
+    """
+    crew = build_synthetic_crew(agents)
+    name = crew["project_name"]
+    project_files = generate_project_structure(
+        name,
+        crew["description"],
+        crew["agents"],
+        crew["tasks"],
+        crew["crew_config"],
+        crew["tools_by_agent"],
+        crew["env_vars"],
+        generation_mode="complete_project",
+        selected_tools=crew["selected_tools"],
+        tools_catalog=get_tools_catalog(),
+    )
+
+    results = []
+    for knowledge_mb in knowledge_sizes:
+        files = {**project_files, **knowledge_files(knowledge_mb)}
+        input_bytes = sum(
+            len(content.encode("utf-8")) if isinstance(content, str) else len(content)
+            for content in files.values()
+        )
+        for mode in modes:
+            # Only deflate modes use the thread count
+            mode_workers = workers if mode in ("fast", "default", "max") else workers[:1]
+            for worker_count in mode_workers:
+                func = lambda: build_archive(files, name, mode=mode, workers=worker_count)  # noqa: E731
+                archive_bytes = len(func())
+                row = {
+                    "knowledge_mb": knowledge_mb,
+                    "mode": mode,
+                    "workers": worker_count,
+                    "input_bytes": input_bytes,
+                    "archive_bytes": archive_bytes,
+                    "ratio": archive_bytes / input_bytes,
+                    **time_call(func, repeat),
+                }
+                row["throughput_mib_s"] = input_bytes / row["median_s"] / (1024 * 1024)
+                results.append(row)
+                print(
+                    f"{knowledge_mb:>5} MiB  {mode:<8} {worker_count:>2} workers  "
+                    f"median {row['median_s'] * 1000:>9.1f} ms  "
+                    f"size {archive_bytes / 1024:>10.1f} KiB  ratio {row['ratio']:.3f}",
+                    file=sys.stderr,
+                )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Gunny's archive compression modes.")
+    parser.add_argument("--agents", type=int, default=10, help="Agents in the synthetic crew (default: %(default)s)")
+    parser.add_argument(
+        "--knowledge-mb",
+        default=",".join(str(size) for size in DEFAULT_KNOWLEDGE_MB),
+        help="Comma-separated knowledge bundle sizes in MiB (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--workers",
+        default=f"1,{os.cpu_count() or 1}",
+        help="Comma-separated deflate thread counts (default: %(default)s)",
+    )
+    parser.add_argument("--mode", action="append", default=[], help="Only run this mode (repeatable)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (default: %(default)s)")
+    parser.add_argument("--output", default=None, help="Write JSON results to this file (default: stdout)")
+    parser.add_argument("--compare", default=None, help="Baseline JSON file to compare median timings against")
+    args = parser.parse_args()
+
+    knowledge_sizes = [int(size) for size in args.knowledge_mb.split(",") if size.strip()]
+    workers = sorted({int(count) for count in args.workers.split(",") if count.strip()})
+    modes = args.mode or available_compression_modes()
+    results = run_benchmarks(args.agents, knowledge_sizes, workers, modes, args.repeat)
+
+    write_results(
+        {
+            "meta": {
+                **run_metadata("archive"),
+                "agents": args.agents,
+                "repeat": args.repeat,
+                "cpu_count": os.cpu_count(),
+            },
+            "results": results,
+        },
+        args.output,
+    )
+
+    if args.compare:
+        compare_results(results, args.compare, ["knowledge_mb", "mode", "workers"], "median_s")
+
+
+if __name__ == "__main__":
+    main()
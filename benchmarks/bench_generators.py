@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Generator Benchmark Suite for Gunny
+
+Times every project generator against synthetic crews of growing size and
+records peak memory. Results are emitted as JSON so runs from different
+commits can be compared.
+
+Usage:
+    python -m benchmarks.bench_generators
+    python -m benchmarks.bench_generators --sizes 1,10,100 --repeat 3 --output bench.json
+    python -m benchmarks.bench_generators --compare bench.json
+"""
+
+import argparse
+import sys
+from typing import Any, Callable, Dict, List
+
+from benchmarks.common import (
+    build_synthetic_crew,
+    compare_results,
+    peak_memory,
+    run_metadata,
+    time_call,
+    write_results,
+)
+from generators.project_generator import (
+    create_zip_file,
+    extract_input_variables,
+    generate_project_structure,
+)
+from generators.python_generator import generate_crew_py, generate_main_py, generate_tool_stubs
+from generators.yaml_generator import generate_agents_yaml, generate_tasks_yaml
+from utils.catalog import get_tools_catalog
+
+DEFAULT_SIZES = [1, 10, 100, 1000, 5000]
+
+
+def generator_cases(crew: Dict[str, Any]) -> Dict[str, Callable[[], Any]]:
+    """
+    Build the zero-argument callables to benchmark for one synthetic crew.
+
+    Args:
+        crew: Synthetic crew from build_synthetic_crew
+
+    Returns:
+        Dictionary mapping generator name to callable
+    """
+    name = crew["project_name"]
+    input_vars = extract_input_variables(crew["agents"], crew["tasks"])
+    files = generate_project_structure(
+        name,
+        crew["description"],
+        crew["agents"],
+        crew["tasks"],
+        crew["crew_config"],
+        crew["tools_by_agent"],
+        crew["env_vars"],
+        generation_mode="complete_project",
+        selected_tools=crew["selected_tools"],
+        tools_catalog=get_tools_catalog(),
+    )
+
+    return {
+        "generate_agents_yaml": lambda: generate_agents_yaml(crew["agents"]),
+        "generate_tasks_yaml": lambda: generate_tasks_yaml(crew["tasks"]),
+        "generate_crew_py": lambda: generate_crew_py(
+            name, crew["agents"], crew["tasks"], crew["crew_config"], crew["tools_by_agent"]
+        ),
+        "generate_main_py": lambda: generate_main_py(name, input_vars),
+        "generate_tool_stubs": lambda: generate_tool_stubs(crew["selected_tools"], get_tools_catalog()),
+        "create_zip_file": lambda: create_zip_file(files, name),
+    }
+
+
+def run_benchmarks(
+    sizes: List[int],
+    repeat: int,
+    text_length: int,
+    tools_per_agent: int,
+    generators: List[str],
+) -> List[Dict[str, Any]]:
+    """
+    Run every selected generator for every crew size.
+
+    Returns:
+        List of result rows (one per size/generator pair)
+    """
+    results = []
+    for size in sizes:
+        crew = build_synthetic_crew(
+            size, tools_per_agent=tools_per_agent, text_length=text_length
+        )
+        cases = generator_cases(crew)
+        for generator, func in cases.items():
+            if generators and generator not in generators:
+                continue
+            output = func()
+            timings = time_call(func, repeat)
+            row = {
+                "size": size,
+                "generator": generator,
+                "agents": len(crew["agents"]),
+                "tasks": len(crew["tasks"]),
+                "tools": len(crew["selected_tools"]),
+                "output_bytes": _output_size(output),
+                "peak_bytes": peak_memory(func),
+                **timings,
+            }
+            results.append(row)
+            print(
+                f"{size:>6} agents  {generator:<22} "
+                f"median {row['median_s'] * 1000:>10.2f} ms  "
+                f"peak {row['peak_bytes'] / 1024:>10.1f} KiB",
+                file=sys.stderr,
+            )
+    return results
+
+
+def _output_size(output: Any) -> int:
+    """Return the size in bytes of a generator's output."""
+    if isinstance(output, bytes):
+        return len(output)
+    if isinstance(output, str):
+        return len(output.encode("utf-8"))
+    if isinstance(output, list):
+        return sum(len(content.encode("utf-8")) for _, content in output)
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Gunny's project generators.")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Comma-separated agent counts (default: %(default)s)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case (default: %(default)s)")
+    parser.add_argument("--text-length", type=int, default=400, help="Length of long text fields (default: %(default)s)")
+    parser.add_argument("--tools-per-agent", type=int, default=3, help="Tools assigned to each agent (default: %(default)s)")
+    parser.add_argument("--generator", action="append", default=[], help="Only run this generator (repeatable)")
+    parser.add_argument("--output", default=None, help="Write JSON results to this file (default: stdout)")
+    parser.add_argument("--compare", default=None, help="Baseline JSON file to compare median timings against")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    results = run_benchmarks(sizes, args.repeat, args.text_length, args.tools_per_agent, args.generator)
+
+    write_results(
+        {
+            "meta": {
+                **run_metadata("generators"),
+                "repeat": args.repeat,
+                "text_length": args.text_length,
+                "tools_per_agent": args.tools_per_agent,
+            },
+            "results": results,
+        },
+        args.output,
+    )
+
+    if args.compare:
+        compare_results(results, args.compare, ["size", "generator"], "median_s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,711 @@
+#!/usr/bin/env python3
+"""
+Multi-Session Load Test for Gunny
+
+Starts Gunny on localhost (or targets an instance you already run), opens
+many concurrent browser-like sessions over Streamlit's WebSocket protocol,
+and has each one build a realistic project through the UI and download the
+ZIP. Reports throughput, tail latency and the server's resident memory
+growth per session. With --knowledge-mb, one more session uploads that much
+incompressible knowledge and downloads the bundle, and the server's peak
+memory is checked against the container limit.
+
+Everything runs against localhost; no external network access is needed.
+
+Usage:
+    python -m benchmarks.bench_load
+    python -m benchmarks.bench_load --sessions 50 --concurrency 10 --output load.json
+    python -m benchmarks.bench_load --url http://localhost:8501 --server-pid 12345
+    python -m benchmarks.bench_load --sessions 5 --knowledge-mb 128
+
+When targeting an existing instance, start it with
+``--server.enableXsrfProtection false`` so the harness can open sessions
+without a browser cookie.
+"""
+
+import argparse
+import asyncio
+import base64
+import io
+import os
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+import zipfile
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from benchmarks.common import compare_results, percentile, run_metadata, write_results
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STREAM_PATH = "/_stcore/stream"
+HEALTH_PATH = "/_stcore/health"
+CONTAINER_MEMORY_LIMIT = 512 * 1024 * 1024  # docker-compose.yml memory limit
+
+
+# ---------------------------------------------------------------------------
+# Minimal WebSocket client (RFC 6455) - keeps the harness free of extra deps
+# ---------------------------------------------------------------------------
+
+async def _ws_connect(host: str, port: int, path: str) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """Open a WebSocket connection using the 'streamlit' subprotocol."""
+    reader, writer = await asyncio.open_connection(host, port, limit=2 ** 24)
+    key = base64.b64encode(os.urandom(16)).decode()
+    request = (
+        f"GET {path} HTTP/1.1\r\n"
+        f"Host: {host}:{port}\r\n"
+        "Upgrade: websocket\r\n"
+        "Connection: Upgrade\r\n"
+        f"Sec-WebSocket-Key: {key}\r\n"
+        "Sec-WebSocket-Version: 13\r\n"
+        "Sec-WebSocket-Protocol: streamlit\r\n"
+        "\r\n"
+    )
+    writer.write(request.encode())
+    await writer.drain()
+
+    header = await reader.readuntil(b"\r\n\r\n")
+    status_line = header.split(b"\r\n", 1)[0].decode(errors="replace")
+    if " 101 " not in status_line:
+        writer.close()
+        raise ConnectionError(f"WebSocket handshake failed: {status_line}")
+    return reader, writer
+
+
+async def _ws_send(writer: asyncio.StreamWriter, payload: bytes, opcode: int = 0x2) -> None:
+    """Send one masked frame (client frames must be masked)."""
+    mask = os.urandom(4)
+    length = len(payload)
+    if length < 126:
+        header = struct.pack("!BB", 0x80 | opcode, 0x80 | length)
+    elif length < 2 ** 16:
+        header = struct.pack("!BBH", 0x80 | opcode, 0x80 | 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 0x80 | 127, length)
+    masked = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+    writer.write(header + mask + masked)
+    await writer.drain()
+
+
+async def _ws_recv(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> Optional[bytes]:
+    """Receive one complete message, answering pings. Returns None on close."""
+    chunks = []
+    while True:
+        first, second = await reader.readexactly(2)
+        fin = first & 0x80
+        opcode = first & 0x0F
+        length = second & 0x7F
+        if length == 126:
+            (length,) = struct.unpack("!H", await reader.readexactly(2))
+        elif length == 127:
+            (length,) = struct.unpack("!Q", await reader.readexactly(8))
+        mask = await reader.readexactly(4) if second & 0x80 else None
+        data = await reader.readexactly(length)
+        if mask:
+            data = bytes(b ^ mask[i % 4] for i, b in enumerate(data))
+
+        if opcode == 0x8:  # close
+            return None
+        if opcode == 0x9:  # ping
+            await _ws_send(writer, data, opcode=0xA)
+            continue
+        if opcode == 0xA:  # pong
+            continue
+        chunks.append(data)
+        if fin:
+            return b"".join(chunks)
+
+
+def _put_multipart(url: str, name: str, data: bytes) -> None:
+    """PUT one file as multipart/form-data, the way st.file_uploader sends it."""
+    boundary = uuid.uuid4().hex
+    head = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="UploadedFile"; filename="{name}"\r\n'
+        "Content-Type: application/octet-stream\r\n\r\n"
+    ).encode()
+    body = head + data + f"\r\n--{boundary}--\r\n".encode()
+    request = urllib.request.Request(
+        url, data=body, method="PUT",
+        headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+    )
+    with urllib.request.urlopen(request, timeout=120):
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Browser-like Streamlit session
+# ---------------------------------------------------------------------------
+
+class StreamlitSession:
+    """
+    A headless browser tab speaking Streamlit's protobuf protocol.
+
+    Keeps the latest value of every widget it has set (like the frontend does)
+    and records the widgets and download URLs rendered by each rerun.
+    """
+
+    def __init__(self, base_url: str):
+        parsed = urlparse(base_url)
+        self.base_url = base_url.rstrip("/")
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 80
+        self.path_prefix = parsed.path.rstrip("/")
+        self.widget_values: Dict[str, Any] = {}
+        self.widgets: List[Tuple[str, str, str]] = []  # (element type, id, label)
+        self.download_urls: List[str] = []
+        self.deferred_file_ids: List[str] = []
+        self.rerun_latencies: List[float] = []
+        self.session_id = ""
+        self._reader = None
+        self._writer = None
+
+    async def connect(self) -> None:
+        self._reader, self._writer = await _ws_connect(
+            self.host, self.port, self.path_prefix + STREAM_PATH
+        )
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            try:
+                await _ws_send(self._writer, b"", opcode=0x8)
+            except ConnectionError:
+                pass
+            self._writer.close()
+            self._writer = None
+
+    def find(self, element_type: str, key: Optional[str] = None, label: Optional[str] = None) -> str:
+        """Return the widget id matching a user key (id suffix) or label."""
+        for kind, widget_id, widget_label in self.widgets:
+            if kind != element_type:
+                continue
+            if key is not None and widget_id.endswith(f"-{key}"):
+                return widget_id
+            if label is not None and widget_label == label:
+                return widget_id
+        raise LookupError(f"No {element_type} with key={key!r} label={label!r}")
+
+    async def rerun(self, updates: Optional[Dict[str, Any]] = None, trigger: Optional[str] = None) -> float:
+        """
+        Send a rerun with updated widget values and wait until the script finishes.
+
+        Args:
+            updates: Widget id -> new value (str, bool or FileUploaderState)
+            trigger: Widget id of a button to click for this rerun only
+
+        Returns:
+            Rerun round-trip latency in seconds
+        """
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        self.widget_values.update(updates or {})
+        msg = BackMsg()
+        msg.rerun_script.SetInParent()
+        states = msg.rerun_script.widget_states
+        for widget_id, value in self.widget_values.items():
+            state = states.widgets.add()
+            state.id = widget_id
+            if isinstance(value, bool):
+                state.bool_value = value
+            elif isinstance(value, str):
+                state.string_value = value
+            else:
+                state.file_uploader_state_value.CopyFrom(value)
+        if trigger:
+            state = states.widgets.add()
+            state.id = trigger
+            state.trigger_value = True
+
+        start = time.perf_counter()
+        await _ws_send(self._writer, msg.SerializeToString())
+
+        widgets = []
+        downloads = []
+        deferred = []
+        while True:
+            forward = await self._receive()
+            kind = forward.WhichOneof("type")
+            if kind == "new_session":
+                # Sent at the start of every script run, including st.rerun()
+                self.session_id = forward.new_session.initialize.session_id
+                widgets, downloads, deferred = [], [], []
+            elif kind == "delta" and forward.delta.WhichOneof("type") == "new_element":
+                element = forward.delta.new_element
+                element_type = element.WhichOneof("type")
+                proto = getattr(element, element_type) if element_type else None
+                if proto is not None and getattr(proto, "id", ""):
+                    widgets.append((element_type, proto.id, getattr(proto, "label", "")))
+                if element_type == "download_button" and element.download_button.url:
+                    downloads.append(element.download_button.url)
+                if element_type == "download_button" and element.download_button.deferred_file_id:
+                    deferred.append(element.download_button.deferred_file_id)
+                if element_type == "exception":
+                    raise RuntimeError(f"App raised: {element.exception.message}")
+            elif kind == "script_finished":
+                if forward.script_finished == ForwardMsg.FINISHED_SUCCESSFULLY:
+                    break
+                if forward.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    raise RuntimeError("App failed to compile")
+
+        latency = time.perf_counter() - start
+        self.widgets = widgets
+        self.download_urls = downloads
+        self.deferred_file_ids = deferred
+        self.rerun_latencies.append(latency)
+        return latency
+
+    async def _receive(self):
+        """Receive and parse the next ForwardMsg."""
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        raw = await _ws_recv(self._reader, self._writer)
+        if raw is None:
+            raise ConnectionError("Server closed the session")
+        forward = ForwardMsg()
+        forward.ParseFromString(raw)
+        return forward
+
+    async def _request(self, msg, response_type: str, request_id: str, id_field: str):
+        """Send a BackMsg and wait for the ForwardMsg answering it."""
+        await _ws_send(self._writer, msg.SerializeToString())
+        while True:
+            forward = await self._receive()
+            if forward.WhichOneof("type") == response_type:
+                response = getattr(forward, response_type)
+                if getattr(response, id_field) == request_id:
+                    return response
+
+    async def upload(self, widget_id: str, name: str, data: bytes) -> float:
+        """
+        Upload a file into a file_uploader widget, like the frontend does.
+
+        Asks for an upload URL, PUTs the file as multipart form data, then
+        reruns with the widget pointing at it.
+
+        Returns:
+            Upload plus rerun latency in seconds
+        """
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.Common_pb2 import FileUploaderState
+
+        start = time.perf_counter()
+        request_id = uuid.uuid4().hex
+        msg = BackMsg()
+        msg.file_urls_request.request_id = request_id
+        msg.file_urls_request.file_names.append(name)
+        msg.file_urls_request.session_id = self.session_id
+        response = await self._request(msg, "file_urls_response", request_id, "response_id")
+        if response.error_msg:
+            raise RuntimeError(f"Upload refused: {response.error_msg}")
+        file_urls = response.file_urls[0]
+
+        upload_url = file_urls.upload_url
+        full_url = upload_url if upload_url.startswith("http") else f"{self.base_url}{upload_url}"
+        await asyncio.to_thread(_put_multipart, full_url, name, data)
+
+        state = FileUploaderState()
+        info = state.uploaded_file_info.add()
+        info.name = name
+        info.size = len(data)
+        info.file_id = file_urls.file_id
+        info.file_urls.CopyFrom(file_urls)
+        await self.rerun({widget_id: state})
+        # The app resets the uploader (new key) after taking the file
+        self.widget_values.pop(widget_id, None)
+        return time.perf_counter() - start
+
+    async def deferred_download_url(self, file_id: str) -> str:
+        """Ask the server to run a deferred download_button callable and return its URL."""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+
+        request_id = uuid.uuid4().hex
+        msg = BackMsg()
+        msg.backend_operation_request.request_id = request_id
+        msg.backend_operation_request.session_id = self.session_id
+        msg.backend_operation_request.deferred_file.file_id = file_id
+        response = await self._request(msg, "backend_operation_response", request_id, "request_id")
+        if response.error_msg:
+            raise RuntimeError(f"Deferred download failed: {response.error_msg}")
+        return response.deferred_file.url
+
+    def download(self, url: str) -> Tuple[bytes, float]:
+        """Fetch a media URL (blocking) and return (body, latency)."""
+        full_url = url if url.startswith("http") else f"{self.base_url}{url}"
+        start = time.perf_counter()
+        with urllib.request.urlopen(full_url, timeout=30) as response:
+            body = response.read()
+        return body, time.perf_counter() - start
+
+
+async def build_project(session: StreamlitSession, index: int, n_agents: int, n_tasks: int, n_tools: int) -> None:
+    """Fill in a realistic project (name, agents, tasks, tools) through the UI."""
+    await session.rerun({session.find("text_input", label="Project Name *"): f"load_crew_{index}"})
+
+    for i in range(n_agents):
+        await session.rerun(trigger=session.find("button", key="add_agent_btn"))
+        await session.rerun({
+            session.find("text_input", key=f"agent_{i}_role"): f"Analyst {i}",
+            session.find("text_area", key=f"agent_{i}_goal"): f"Analyse {{topic}} from angle {i}",
+            session.find("text_area", key=f"agent_{i}_backstory"): f"Veteran analyst number {i}. " * 20,
+        })
+
+    for i in range(n_tasks):
+        await session.rerun(trigger=session.find("button", key="add_task_btn"))
+        await session.rerun({
+            session.find("text_area", key=f"task_{i}_description"): f"Research {{topic}} part {i}. " * 10,
+            session.find("text_area", key=f"task_{i}_expected_output"): f"A report for part {i}",
+        })
+
+    tool_boxes = [widget_id for kind, widget_id, _ in session.widgets if kind == "checkbox" and "-tool_" in widget_id]
+    if tool_boxes[:n_tools]:
+        await session.rerun({widget_id: True for widget_id in tool_boxes[:n_tools]})
+
+
+async def simulate_user(base_url: str, index: int, n_agents: int, n_tasks: int, n_tools: int) -> Dict[str, Any]:
+    """
+    Build and download one realistic project through the UI.
+
+    Returns:
+        Per-session stats (rerun latencies, download latency and size)
+    """
+    session = StreamlitSession(base_url)
+    start = time.perf_counter()
+    await session.connect()
+    await session.rerun()
+    await build_project(session, index, n_agents, n_tasks, n_tools)
+
+    if not session.download_urls:
+        raise RuntimeError("Project did not produce a download button")
+    body, download_latency = await asyncio.to_thread(session.download, session.download_urls[0])
+    with zipfile.ZipFile(io.BytesIO(body)) as archive:
+        file_count = len(archive.namelist())
+
+    return {
+        "session": session,
+        "rerun_latencies": session.rerun_latencies,
+        "download_latency": download_latency,
+        "zip_bytes": len(body),
+        "zip_files": file_count,
+        "total_s": time.perf_counter() - start,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Server management and memory accounting
+# ---------------------------------------------------------------------------
+
+def read_rss(pid: int) -> Optional[int]:
+    """Return the resident set size of a process in bytes (Linux /proc), or None."""
+    try:
+        with open(f"/proc/{pid}/status", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return None
+
+
+class RssSampler:
+    """Sample a process's RSS in a background thread and keep the peak."""
+
+    def __init__(self, pid: Optional[int], interval: float = 0.1):
+        self.pid = pid
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            rss = read_rss(self.pid) if self.pid else None
+            if rss:
+                self.peak = max(self.peak, rss)
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_health(base_url: str, timeout: float) -> float:
+    """Poll the health endpoint until it answers. Returns seconds waited."""
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        try:
+            with urllib.request.urlopen(base_url + HEALTH_PATH, timeout=2):
+                return time.perf_counter() - start
+        except (urllib.error.URLError, ConnectionError, OSError):
+            time.sleep(0.2)
+    raise TimeoutError(f"Gunny did not become healthy within {timeout}s")
+
+
+def start_server(port: int) -> subprocess.Popen:
+    """Start Gunny on localhost with XSRF disabled so the harness can connect."""
+    command = [
+        sys.executable, "-m", "streamlit", "run", os.path.join(ROOT_DIR, "app.py"),
+        "--server.port", str(port),
+        "--server.address", "127.0.0.1",
+        "--server.headless", "true",
+        "--server.enableXsrfProtection", "false",
+        "--server.fileWatcherType", "none",
+        "--browser.gatherUsageStats", "false",
+    ]
+    return subprocess.Popen(
+        command, cwd=ROOT_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+
+async def run_load(
+    base_url: str,
+    server_pid: Optional[int],
+    sessions: int,
+    concurrency: int,
+    n_agents: int,
+    n_tasks: int,
+    n_tools: int,
+) -> Dict[str, Any]:
+    """
+    Warm up with one session, then run `sessions` users with bounded concurrency.
+
+    Sessions stay connected until every user has finished, so the memory
+    reading reflects that many open (idle) tabs.
+    """
+    warmup = await simulate_user(base_url, -1, n_agents, n_tasks, n_tools)
+    await warmup["session"].close()
+    await asyncio.sleep(0.5)
+    rss_before = read_rss(server_pid) if server_pid else None
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    failures: List[str] = []
+
+    async def bounded(index: int):
+        async with semaphore:
+            try:
+                return await simulate_user(base_url, index, n_agents, n_tasks, n_tools)
+            except Exception as e:  # noqa: BLE001 - report and keep the run going
+                failures.append(f"session {index}: {e}")
+                return None
+
+    with RssSampler(server_pid) as sampler:
+        start = time.perf_counter()
+        outcomes = await asyncio.gather(*(bounded(i) for i in range(sessions)))
+        wall = time.perf_counter() - start
+        rss_open = read_rss(server_pid) if server_pid else None
+
+    completed = [outcome for outcome in outcomes if outcome]
+    for outcome in completed:
+        await outcome["session"].close()
+    await asyncio.sleep(1.0)
+    rss_closed = read_rss(server_pid) if server_pid else None
+
+    reruns = [latency for outcome in completed for latency in outcome["rerun_latencies"]]
+    downloads = [outcome["download_latency"] for outcome in completed]
+    totals = [outcome["total_s"] for outcome in completed]
+
+    per_session = None
+    if rss_before and rss_open and completed:
+        per_session = (rss_open - rss_before) / len(completed)
+
+    result = {
+        "sessions": sessions,
+        "concurrency": concurrency,
+        "completed": len(completed),
+        "failed": len(failures),
+        "wall_s": wall,
+        "sessions_per_s": len(completed) / wall if wall else 0.0,
+        "reruns_per_s": len(reruns) / wall if wall else 0.0,
+        "rerun_p50_s": percentile(reruns, 50),
+        "rerun_p95_s": percentile(reruns, 95),
+        "rerun_p99_s": percentile(reruns, 99),
+        "download_p50_s": percentile(downloads, 50),
+        "download_p99_s": percentile(downloads, 99),
+        "session_p50_s": percentile(totals, 50),
+        "session_p99_s": percentile(totals, 99),
+        "zip_bytes": completed[0]["zip_bytes"] if completed else 0,
+        "rss_before_bytes": rss_before,
+        "rss_open_bytes": rss_open,
+        "rss_peak_bytes": sampler.peak or None,
+        "rss_after_close_bytes": rss_closed,
+        "rss_per_session_bytes": per_session,
+        "estimated_sessions_in_512m": (
+            int((CONTAINER_MEMORY_LIMIT - rss_before) / per_session)
+            if per_session and per_session > 0 and rss_before else None
+        ),
+        "errors": failures[:10],
+    }
+    return result
+
+
+async def run_knowledge_bundle(
+    base_url: str,
+    server_pid: Optional[int],
+    knowledge_mb: int,
+    file_mb: int,
+) -> Dict[str, Any]:
+    """
+    Upload `knowledge_mb` of incompressible knowledge files in one session and download the bundle.
+
+    Random bytes do not compress, so the archive is as large as the corpus.
+    Corpora above the app's bundle limit are downloaded without their files.
+
+    Returns:
+        Upload and download latencies, archive size, whether the files were
+        bundled, and the server's peak RSS against the container limit
+    """
+    session = StreamlitSession(base_url)
+    uploads: List[float] = []
+    with RssSampler(server_pid) as sampler:
+        await session.connect()
+        await session.rerun()
+        await build_project(session, 0, 1, 1, 0)
+
+        remaining = knowledge_mb * 1024 * 1024
+        index = 0
+        while remaining > 0:
+            size = min(remaining, file_mb * 1024 * 1024)
+            uploader = session.find("file_uploader", label="Upload a file to bundle into knowledge/")
+            uploads.append(await session.upload(uploader, f"corpus_{index}.txt", os.urandom(size)))
+            remaining -= size
+            index += 1
+
+        start = time.perf_counter()
+        if session.deferred_file_ids:
+            url = await session.deferred_download_url(session.deferred_file_ids[0])
+        elif session.download_urls:
+            url = session.download_urls[0]
+        else:
+            raise RuntimeError("Project did not produce a download button")
+        body, _ = await asyncio.to_thread(session.download, url)
+        download_latency = time.perf_counter() - start
+        with zipfile.ZipFile(io.BytesIO(body)) as archive:
+            bundled = sum(1 for name in archive.namelist() if "/knowledge/corpus_" in name)
+        # Streamlit frees the served bytes after the session's next reruns
+        await session.rerun()
+        await session.close()
+
+    peak = sampler.peak or None
+    return {
+        "knowledge_mb": knowledge_mb,
+        "files": index,
+        "bundled_files": bundled,
+        "zip_bytes": len(body),
+        "upload_p50_s": percentile(uploads, 50),
+        "download_s": download_latency,
+        "rss_peak_bytes": peak,
+        "within_limit": peak < CONTAINER_MEMORY_LIMIT if peak else None,
+    }
+
+
+def _mib(value: Optional[float]) -> str:
+    return f"{value / (1024 * 1024):.1f} MiB" if value else "n/a"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test a local Gunny instance with concurrent sessions.")
+    parser.add_argument("--sessions", type=int, default=20, help="Total simulated users (default: %(default)s)")
+    parser.add_argument("--concurrency", type=int, default=5, help="Users active at once (default: %(default)s)")
+    parser.add_argument("--agents", type=int, default=3, help="Agents each user creates (default: %(default)s)")
+    parser.add_argument("--tasks", type=int, default=3, help="Tasks each user creates (default: %(default)s)")
+    parser.add_argument("--tools", type=int, default=5, help="Tools each user selects (default: %(default)s)")
+    parser.add_argument("--url", default=None, help="Target an already running instance (localhost only)")
+    parser.add_argument("--server-pid", type=int, default=None, help="PID of --url's server, for memory accounting")
+    parser.add_argument("--startup-timeout", type=float, default=60.0, help="Seconds to wait for health (default: %(default)s)")
+    parser.add_argument("--knowledge-mb", type=int, default=0,
+                        help="Also upload this much knowledge in one session and download its bundle (default: off)")
+    parser.add_argument("--knowledge-file-mb", type=int, default=64,
+                        help="Size of each uploaded knowledge file, below server.maxUploadSize (default: %(default)s)")
+    parser.add_argument("--output", default=None, help="Write JSON results to this file (default: stdout)")
+    parser.add_argument("--compare", default=None, help="Baseline JSON file to compare rerun p95 against")
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        host = urlparse(args.url).hostname
+        if host not in ("localhost", "127.0.0.1", "::1"):
+            parser.error("--url must point at localhost")
+        base_url, server_pid = args.url.rstrip("/"), args.server_pid
+        startup_s = None
+    else:
+        port = _free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        server = start_server(port)
+        server_pid = server.pid
+
+    try:
+        if server is not None:
+            startup_s = wait_for_health(base_url, args.startup_timeout)
+            print(f"Gunny healthy after {startup_s:.2f}s on {base_url}", file=sys.stderr)
+        result = asyncio.run(run_load(
+            base_url, server_pid, args.sessions, args.concurrency,
+            args.agents, args.tasks, args.tools,
+        ))
+        if args.knowledge_mb:
+            result["knowledge_bundle"] = asyncio.run(run_knowledge_bundle(
+                base_url, server_pid, args.knowledge_mb, args.knowledge_file_mb,
+            ))
+    finally:
+        if server is not None:
+            server.terminate()
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+
+    result["startup_s"] = startup_s
+    print(
+        f"{result['completed']}/{result['sessions']} sessions  "
+        f"{result['sessions_per_s']:.2f} sessions/s  {result['reruns_per_s']:.1f} reruns/s  "
+        f"rerun p95 {result['rerun_p95_s'] * 1000:.0f} ms  p99 {result['rerun_p99_s'] * 1000:.0f} ms  "
+        f"RSS/session {_mib(result['rss_per_session_bytes'])}  peak {_mib(result['rss_peak_bytes'])}",
+        file=sys.stderr,
+    )
+    bundle = result.get("knowledge_bundle")
+    if bundle:
+        print(
+            f"knowledge {bundle['knowledge_mb']} MiB in {bundle['files']} file(s)  "
+            f"bundled {bundle['bundled_files']}  archive {_mib(bundle['zip_bytes'])}  "
+            f"download {bundle['download_s']:.2f}s  peak RSS {_mib(bundle['rss_peak_bytes'])} "
+            f"(limit {_mib(CONTAINER_MEMORY_LIMIT)})",
+            file=sys.stderr,
+        )
+
+    write_results(
+        {
+            "meta": {
+                **run_metadata("load"),
+                "agents": args.agents,
+                "tasks": args.tasks,
+                "tools": args.tools,
+            },
+            "results": [result],
+        },
+        args.output,
+    )
+
+    if args.compare:
+        compare_results([result], args.compare, ["sessions", "concurrency"], "rerun_p95_s")
+
+    if result["failed"] or (bundle and bundle["within_limit"] is False):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
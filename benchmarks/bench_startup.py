@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Startup Import-Time Budget for Gunny
+
+Profiles the imports app.py performs at startup with ``python -X importtime``
+in fresh interpreters, reports the slowest modules, and fails when the cold
+start exceeds its budget or when a dependency that should load lazily (CrewAI,
+the project generators, PyYAML) is imported at startup. Optionally starts the
+server and times how long it takes to become healthy and to render the first
+page, which bounds the container health-check start period.
+
+Usage:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --budget-ms 1500 --server --output startup.json
+    python -m benchmarks.bench_startup --compare startup.json
+"""
+
+import argparse
+import ast
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from benchmarks.bench_load import StreamlitSession, _free_port, start_server, wait_for_health
+from benchmarks.common import compare_results, run_metadata, write_results
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must not be imported until they are actually used
+DEFAULT_LAZY_MODULES = ["crewai", "crewai_tools", "generators", "yaml"]
+
+DEFAULT_IMPORT_BUDGET_MS = 1500
+DEFAULT_SERVER_BUDGET_S = 15.0
+
+
+def startup_imports(app_path: str = os.path.join(ROOT_DIR, "app.py")) -> List[str]:
+    """
+    List the modules app.py imports at module level (i.e. on every cold start).
+
+    Args:
+        app_path: Path to the Streamlit script
+
+    Returns:
+        Module names in import order
+    """
+    with open(app_path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=app_path)
+
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            modules.append(node.module)
+    return [module for module in dict.fromkeys(modules) if module != "__future__"]
+
+
+def profile_imports(modules: List[str]) -> Dict[str, Any]:
+    """
+    Import `modules` in a fresh interpreter under ``-X importtime``.
+
+    Returns:
+        Dictionary with total_s (sum of top-level cumulative times), wall_s,
+        and modules: name -> {"self_s", "cumulative_s"}
+    """
+    code = "; ".join(f"import {module}" for module in modules) or "pass"
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT_DIR, capture_output=True, text=True, check=False,
+    )
+    wall_s = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(f"Import failed:\n{result.stderr[-2000:]}")
+
+    timings: Dict[str, Dict[str, float]] = {}
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_field, cumulative_field, name = line[len("import time:"):].split("|", 2)
+        self_us, cumulative_us = int(self_field), int(cumulative_field)
+        name = name[1:]  # nesting is shown as two extra spaces per level
+        if not name.startswith(" "):
+            total_us += cumulative_us
+        timings[name.strip()] = {
+            "self_s": self_us / 1e6,
+            "cumulative_s": cumulative_us / 1e6,
+        }
+    return {"total_s": total_us / 1e6, "wall_s": wall_s, "modules": timings}
+
+
+def lazy_violations(imported: List[str], lazy_modules: List[str]) -> List[str]:
+    """Return the imported modules that belong to a package meant to load lazily."""
+    return sorted(
+        name for name in imported
+        if any(name == lazy or name.startswith(lazy + ".") for lazy in lazy_modules)
+    )
+
+
+def measure_server(timeout: float) -> Dict[str, float]:
+    """
+    Start Gunny and time health and the first full page render.
+
+    Returns:
+        Dictionary with health_s (spawn to healthy) and first_render_s
+        (spawn to the first script run finishing)
+    """
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    start = time.perf_counter()
+    server = start_server(port)
+    try:
+        health_s = wait_for_health(base_url, timeout)
+
+        async def first_render() -> None:
+            session = StreamlitSession(base_url)
+            await session.connect()
+            try:
+                await session.rerun()
+            finally:
+                await session.close()
+
+        asyncio.run(first_render())
+        first_render_s = time.perf_counter() - start
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+    return {"health_s": health_s, "first_render_s": first_render_s}
+
+
+def run_startup(repeat: int, lazy_modules: List[str], top: int) -> Dict[str, Any]:
+    """
+    Profile app.py's startup imports `repeat` times and summarise them.
+
+    Returns:
+        Result row with median/min import time, the slowest modules of the
+        median run and any lazy-loading violations
+    """
+    modules = startup_imports()
+    baseline = statistics.median(profile_imports([])["wall_s"] for _ in range(repeat))
+    runs = sorted((profile_imports(modules) for _ in range(repeat)), key=lambda run: run["total_s"])
+    median_run = runs[len(runs) // 2]
+
+    slowest = sorted(
+        median_run["modules"].items(), key=lambda item: item[1]["self_s"], reverse=True
+    )[:top]
+    return {
+        "case": "app_imports",
+        "startup_modules": modules,
+        "import_median_s": median_run["total_s"],
+        "import_min_s": runs[0]["total_s"],
+        "wall_median_s": statistics.median(run["wall_s"] for run in runs),
+        "interpreter_s": baseline,
+        "modules_imported": len(median_run["modules"]),
+        "slowest_modules": [{"module": name, **timing} for name, timing in slowest],
+        "lazy_violations": lazy_violations(list(median_run["modules"]), lazy_modules),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile Gunny's startup imports and enforce a cold-start budget.")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters to profile (default: %(default)s)")
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules to report (default: %(default)s)")
+    parser.add_argument(
+        "--budget-ms", type=float, default=DEFAULT_IMPORT_BUDGET_MS,
+        help="Maximum median import time of app.py's startup imports (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--lazy", action="append", default=None,
+        help=f"Package that must not load at startup (repeatable, default: {', '.join(DEFAULT_LAZY_MODULES)})",
+    )
+    parser.add_argument("--server", action="store_true", help="Also time server health and first render")
+    parser.add_argument(
+        "--server-budget-s", type=float, default=DEFAULT_SERVER_BUDGET_S,
+        help="Maximum seconds from spawn to first render with --server (default: %(default)s)",
+    )
+    parser.add_argument("--output", default=None, help="Write JSON results to this file (default: stdout)")
+    parser.add_argument("--compare", default=None, help="Baseline JSON file to compare median import time against")
+    args = parser.parse_args()
+
+    lazy_modules = args.lazy or DEFAULT_LAZY_MODULES
+    result = run_startup(args.repeat, lazy_modules, args.top)
+    if args.server:
+        result.update(measure_server(timeout=max(60.0, args.server_budget_s * 2)))
+
+    for entry in result["slowest_modules"]:
+        print(
+            f"  {entry['module']:<50} self {entry['self_s'] * 1000:>8.1f} ms  "
+            f"cumulative {entry['cumulative_s'] * 1000:>8.1f} ms",
+            file=sys.stderr,
+        )
+    print(
+        f"Startup imports: median {result['import_median_s'] * 1000:.0f} ms "
+        f"(budget {args.budget_ms:.0f} ms), interpreter {result['interpreter_s'] * 1000:.0f} ms",
+        file=sys.stderr,
+    )
+    if args.server:
+        print(
+            f"Server: healthy after {result['health_s']:.2f}s, first render after "
+            f"{result['first_render_s']:.2f}s (budget {args.server_budget_s:.0f}s)",
+            file=sys.stderr,
+        )
+
+    write_results(
+        {
+            "meta": {
+                **run_metadata("startup"),
+                "repeat": args.repeat,
+                "budget_ms": args.budget_ms,
+                "lazy_modules": lazy_modules,
+            },
+            "results": [result],
+        },
+        args.output,
+    )
+
+    if args.compare:
+        compare_results([result], args.compare, ["case"], "import_median_s")
+
+    failures = []
+    if result["import_median_s"] * 1000 > args.budget_ms:
+        failures.append(f"startup imports take {result['import_median_s'] * 1000:.0f} ms (budget {args.budget_ms:.0f} ms)")
+    if result["lazy_violations"]:
+        failures.append(f"imported at startup but should load lazily: {', '.join(result['lazy_violations'])}")
+    if args.server and result["first_render_s"] > args.server_budget_s:
+        failures.append(f"first render after {result['first_render_s']:.1f}s (budget {args.server_budget_s:.0f}s)")
+    for failure in failures:
+        print(f"❌ {failure}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
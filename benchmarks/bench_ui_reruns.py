@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Headless UI Rerun Benchmark for Gunny
+
+Drives app.py through Streamlit's app testing harness (no browser, no
+network), populates N agents, M tasks and K selected tools, then simulates
+an edit in every tab and records the wall time and element counts of each
+rerun.
+
+Usage:
+    python -m benchmarks.bench_ui_reruns
+    python -m benchmarks.bench_ui_reruns --agents 20 --tasks 20 --tools 30 --repeat 3
+    python -m benchmarks.bench_ui_reruns --output ui.json --compare ui_baseline.json
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+from benchmarks.common import (
+    all_tool_names,
+    build_synthetic_crew,
+    compare_results,
+    run_metadata,
+    write_results,
+)
+
+# Keep the harness fully offline and quiet
+os.environ.setdefault("STREAMLIT_BROWSER_GATHER_USAGE_STATS", "false")
+os.environ.setdefault("STREAMLIT_GLOBAL_SHOW_WARNING_ON_DIRECT_EXECUTION", "false")
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+
+def count_elements(app_test) -> Dict[str, int]:
+    """
+    Walk the rendered element tree and count nodes and payload size.
+
+    Args:
+        app_test: An AppTest instance after run()
+
+    Returns:
+        Dictionary with element count, serialized proto bytes and markdown bytes
+    """
+    elements = 0
+    proto_bytes = 0
+    stack = [app_test._tree]
+    while stack:
+        node = stack.pop()
+        elements += 1
+        proto = getattr(node, "proto", None)
+        if proto is not None and hasattr(proto, "ByteSize"):
+            proto_bytes += proto.ByteSize()
+        children = getattr(node, "children", None)
+        if isinstance(children, dict):
+            stack.extend(children.values())
+
+    markdown_bytes = sum(len(md.value.encode("utf-8")) for md in app_test.markdown)
+    return {
+        "elements": elements,
+        "proto_bytes": proto_bytes,
+        "markdown_bytes": markdown_bytes,
+    }
+
+
+def populate_session(app_test, n_agents: int, n_tasks: int, n_tools: int, text_length: int) -> None:
+    """
+    Seed session state with a synthetic crew before the first run.
+
+    Args:
+        app_test: A fresh AppTest instance
+        n_agents: Number of agents
+        n_tasks: Number of tasks (distributed round-robin over agents)
+        n_tools: Number of tools to select in the Tools tab
+        text_length: Approximate length of long text fields
+    """
+    crew = build_synthetic_crew(max(1, n_agents), text_length=text_length)
+    agents = crew["agents"][:n_agents]
+    roles = [agent["role"] for agent in agents]
+
+    tasks = []
+    for i in range(n_tasks if roles else 0):
+        template = crew["tasks"][i % len(crew["tasks"])]
+        tasks.append({
+            **template,
+            "name": f"task_{i + 1:05d}",
+            "agent": roles[i % len(roles)],
+            "context": None,
+        })
+
+    app_test.session_state["project_name"] = crew["project_name"]
+    app_test.session_state["project_description"] = crew["description"]
+    app_test.session_state["agents"] = agents
+    app_test.session_state["tasks"] = tasks
+    app_test.session_state["selected_tools"] = all_tool_names()[:n_tools]
+    app_test.session_state["tools_by_agent"] = {
+        role: crew["tools_by_agent"].get(role, []) for role in roles
+    }
+
+
+def _by_label(widgets, label: str):
+    """Return the first widget with the given label."""
+    for widget in widgets:
+        if widget.label == label:
+            return widget
+    raise LookupError(f"Widget not found: {label}")
+
+
+def tab_edits(n_agents: int, n_tasks: int) -> Dict[str, Callable[[Any, int], None]]:
+    """
+    Build one edit action per tab. Each action mutates a widget; the caller reruns.
+
+    Returns:
+        Dictionary mapping edit name to a callable(app_test, iteration)
+    """
+    unselected_tool = all_tool_names()[-1]
+
+    def edit_project(at, i):
+        _by_label(at.text_area, "Project Description").set_value(f"Benchmark description {i}")
+
+    def edit_agent(at, i):
+        at.text_area(key=f"agent_{i % n_agents}_goal").set_value(f"Updated goal {i}")
+
+    def edit_task(at, i):
+        at.text_area(key=f"task_{i % n_tasks}_description").set_value(f"Updated description {i}")
+
+    def edit_crew(at, i):
+        _by_label(at.checkbox, "Verbose Mode").set_value(i % 2 == 0)
+
+    def edit_tools(at, i):
+        for checkbox in at.checkbox:
+            if checkbox.key and checkbox.key.endswith(f"_{unselected_tool}"):
+                checkbox.set_value(i % 2 == 0)
+                return
+        raise LookupError(f"Tool checkbox not found: {unselected_tool}")
+
+    def edit_knowledge(at, i):
+        _by_label(at.checkbox, "Configure Custom Embedder").set_value(i % 2 == 0)
+
+    def edit_env(at, i):
+        at.text_input(key="custom_env_name").set_value(f"CUSTOM_VAR_{i}")
+
+    def edit_preview(at, i):
+        _by_label(at.button, "View Summary" if i % 2 == 0 else "Hide Summary").click()
+
+    edits = {"project_info": edit_project}
+    if n_agents:
+        edits["agents"] = edit_agent
+    if n_tasks and n_agents:
+        edits["tasks"] = edit_task
+    edits.update({
+        "crew_config": edit_crew,
+        "tools": edit_tools,
+        "knowledge": edit_knowledge,
+        "env": edit_env,
+    })
+    if n_agents and n_tasks:
+        edits["preview"] = edit_preview
+    return edits
+
+
+def timed_run(app_test) -> float:
+    """Run the app once and return the wall time in seconds."""
+    start = time.perf_counter()
+    app_test.run()
+    elapsed = time.perf_counter() - start
+    if app_test.exception:
+        messages = "; ".join(exc.message for exc in app_test.exception)
+        raise RuntimeError(f"App raised during rerun: {messages}")
+    return elapsed
+
+
+def run_benchmark(
+    n_agents: int,
+    n_tasks: int,
+    n_tools: int,
+    repeat: int,
+    text_length: int,
+    timeout: float,
+) -> List[Dict[str, Any]]:
+    """
+    Run the initial render, an idle rerun and every tab edit `repeat` times.
+
+    Returns:
+        List of result rows (one per rerun kind)
+    """
+    from streamlit.testing.v1 import AppTest
+
+    app_test = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    populate_session(app_test, n_agents, n_tasks, n_tools, text_length)
+
+    samples: Dict[str, List[float]] = {"initial": [timed_run(app_test)]}
+    counts: Dict[str, Dict[str, int]] = {"initial": count_elements(app_test)}
+
+    edits = {"idle": lambda at, i: None, **tab_edits(n_agents, n_tasks)}
+    for i in range(max(1, repeat)):
+        for name, edit in edits.items():
+            edit(app_test, i)
+            samples.setdefault(name, []).append(timed_run(app_test))
+            counts[name] = count_elements(app_test)
+
+    results = []
+    for name, values in samples.items():
+        row = {
+            "rerun": name,
+            "agents": n_agents,
+            "tasks": n_tasks,
+            "tools": n_tools,
+            "runs": len(values),
+            "min_s": min(values),
+            "median_s": statistics.median(values),
+            "max_s": max(values),
+            **counts[name],
+        }
+        results.append(row)
+        print(
+            f"{name:<14} median {row['median_s'] * 1000:>9.1f} ms  "
+            f"elements {row['elements']:>6}  payload {row['proto_bytes'] / 1024:>9.1f} KiB",
+            file=sys.stderr,
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Gunny UI reruns headlessly.")
+    parser.add_argument("--agents", type=int, default=5, help="Number of agents (default: %(default)s)")
+    parser.add_argument("--tasks", type=int, default=5, help="Number of tasks (default: %(default)s)")
+    parser.add_argument("--tools", type=int, default=10, help="Number of selected tools (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=3, help="Times each tab edit is repeated (default: %(default)s)")
+    parser.add_argument("--text-length", type=int, default=400, help="Length of long text fields (default: %(default)s)")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Per-rerun timeout in seconds (default: %(default)s)")
+    parser.add_argument("--output", default=None, help="Write JSON results to this file (default: stdout)")
+    parser.add_argument("--compare", default=None, help="Baseline JSON file to compare median timings against")
+    args = parser.parse_args()
+
+    results = run_benchmark(
+        args.agents, args.tasks, args.tools, args.repeat, args.text_length, args.timeout
+    )
+
+    write_results(
+        {
+            "meta": {
+                **run_metadata("ui_reruns"),
+                "agents": args.agents,
+                "tasks": args.tasks,
+                "tools": args.tools,
+                "repeat": args.repeat,
+            },
+            "results": results,
+        },
+        args.output,
+    )
+
+    if args.compare:
+        compare_results(results, args.compare, ["rerun", "agents", "tasks", "tools"], "median_s")
+
+
+if __name__ == "__main__":
+    main()
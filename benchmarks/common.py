@@ -0,0 +1,245 @@
+"""Shared helpers for Gunny benchmarks: synthetic crews and result files."""
+
+import json
+import math
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.catalog import get_tool_names
+
+LOREM = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod "
+    "tempor incididunt ut labore et dolore magna aliqua. "
+)
+
+LLM_CHOICES = ["gpt-4o", "claude-3-sonnet-20240229", "gemini-1.5-pro", "llama2"]
+
+
+def long_text(prefix: str, length: int) -> str:
+    """
+    Build a deterministic text field of roughly `length` characters.
+
+    Args:
+        prefix: Leading text (keeps fields distinct between agents/tasks)
+        length: Target length in characters
+
+    Returns:
+        Text of at least len(prefix) characters
+    """
+    if length <= len(prefix):
+        return prefix
+    filler = (LOREM * (length // len(LOREM) + 1))[: length - len(prefix) - 1]
+    return f"{prefix} {filler}"
+
+
+def all_tool_names() -> List[str]:
+    """Return every tool name in the catalog, in catalog order."""
+    return list(get_tool_names())
+
+
+def build_synthetic_crew(
+    n_agents: int,
+    tasks_per_agent: int = 1,
+    tools_per_agent: int = 3,
+    text_length: int = 400,
+) -> Dict[str, Any]:
+    """
+    Build a synthetic crew configuration shaped like the app's session state.
+
+    Args:
+        n_agents: Number of agents
+        tasks_per_agent: Number of tasks assigned to each agent
+        tools_per_agent: Number of catalog tools given to each agent
+        text_length: Approximate length of goal/backstory/description fields
+
+    Returns:
+        Dictionary with project_name, agents, tasks, crew_config,
+        tools_by_agent, selected_tools and env_vars
+    """
+    tool_names = all_tool_names()
+    agents = []
+    tasks = []
+    tools_by_agent = {}
+    selected = []
+
+    for i in range(n_agents):
+        role = f"Agent {i:05d} Specialist"
+        agents.append({
+            "role": role,
+            "goal": long_text(f"Goal for {role} about {{topic}}", text_length // 2),
+            "backstory": long_text(f"Backstory of {role}", text_length),
+            "verbose": i % 2 == 0,
+            "cache": i % 5 != 0,
+            "allow_delegation": i % 3 == 0,
+            "max_iter": 25 + (i % 4),
+            "max_retry_limit": 2,
+            "llm": LLM_CHOICES[i % len(LLM_CHOICES)],
+            "reasoning": False,
+            "multimodal": False,
+            "allow_code_execution": False,
+        })
+
+        agent_tools = [
+            tool_names[(i * tools_per_agent + j) % len(tool_names)]
+            for j in range(tools_per_agent)
+        ]
+        tools_by_agent[role] = agent_tools
+        for tool in agent_tools:
+            if tool not in selected:
+                selected.append(tool)
+
+        for j in range(tasks_per_agent):
+            index = len(tasks)
+            tasks.append({
+                "name": f"task_{index + 1:05d}",
+                "description": long_text(f"Task {index + 1} on {{topic}} for {role}", text_length),
+                "expected_output": long_text(f"Report {index + 1}", text_length // 2),
+                "agent": role,
+                "context": [f"task_{index:05d}"] if index > 0 else None,
+                "async_execution": False,
+                "human_input": False,
+                "markdown": index % 2 == 0,
+                "output_file": f"output/task_{index + 1:05d}.md" if index % 10 == 0 else None,
+            })
+
+    return {
+        "project_name": "benchmark_crew",
+        "description": long_text("Synthetic benchmark crew", text_length),
+        "agents": agents,
+        "tasks": tasks,
+        "crew_config": {
+            "name": "crew",
+            "process": "sequential",
+            "verbose": True,
+            "cache": True,
+            "memory": True,
+            "planning": False,
+            "max_rpm": 60,
+        },
+        "tools_by_agent": tools_by_agent,
+        "selected_tools": selected,
+        "env_vars": {"OPENAI_API_KEY": "your_api_key_here", "SERPER_API_KEY": "your_api_key_here"},
+    }
+
+
+def time_call(func: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """
+    Time a zero-argument callable.
+
+    Args:
+        func: Callable to time
+        repeat: Number of timed runs
+
+    Returns:
+        Dictionary with min_s, median_s and max_s
+    """
+    samples = []
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return {
+        "min_s": min(samples),
+        "median_s": statistics.median(samples),
+        "max_s": max(samples),
+    }
+
+
+def peak_memory(func: Callable[[], Any]) -> int:
+    """
+    Measure peak Python heap allocation of a single call with tracemalloc.
+
+    Run separately from timing so tracing overhead does not skew timings.
+
+    Returns:
+        Peak traced bytes allocated during the call
+    """
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Return the pct-th percentile (0-100) of samples using nearest-rank."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[max(0, min(len(ordered), rank) - 1)]
+
+
+def git_revision() -> Optional[str]:
+    """Return the current git commit hash, or None outside a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True, text=True, timeout=5, check=True,
+        )
+        return result.stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_metadata(benchmark: str) -> Dict[str, Any]:
+    """Describe the environment a benchmark ran in."""
+    return {
+        "benchmark": benchmark,
+        "commit": git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+    }
+
+
+def write_results(results: Dict[str, Any], output: Optional[str]) -> None:
+    """Write results as JSON to `output`, or to stdout when output is None or '-'."""
+    payload = json.dumps(results, indent=2, sort_keys=True)
+    if output and output != "-":
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(payload + "\n")
+        print(f"Results written to {output}")
+    else:
+        print(payload)
+
+
+def compare_results(
+    current: List[Dict[str, Any]],
+    baseline_path: str,
+    key_fields: List[str],
+    metric: str,
+) -> None:
+    """
+    Print a side-by-side comparison of a metric against a baseline results file.
+
+    Args:
+        current: Result rows from this run
+        baseline_path: Path to a JSON file produced by an earlier run
+        key_fields: Fields that identify a row (e.g. ["size", "generator"])
+        metric: Metric to compare (e.g. "median_s")
+    """
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    def row_key(row: Dict[str, Any]) -> tuple:
+        return tuple(row.get(field) for field in key_fields)
+
+    previous = {row_key(row): row for row in baseline.get("results", [])}
+    print(f"\nComparison with {baseline_path} ({baseline.get('meta', {}).get('commit')}):")
+    for row in current:
+        old = previous.get(row_key(row))
+        if old is None or not old.get(metric):
+            continue
+        ratio = row[metric] / old[metric]
+        label = " / ".join(str(value) for value in row_key(row))
+        print(f"  {label:<40} {old[metric]:>12.6f} -> {row[metric]:>12.6f}  ({ratio:.2f}x)")
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Tools Catalog Builder for Gunny
+
+Introspects the locally installed crewai_tools package (tool classes, their
+descriptions, declared env vars and argument schemas), merges the result into
+utils/data/catalog.json and shows what changed. Introspection results are
+cached on disk per crewai_tools version, so re-running for the same version
+takes well under a second.
+
+Curated text in the catalog (descriptions, auth notes, categories) is kept;
+env vars, auth requirements and argument schemas follow the package. New tools are added to
+"Other Tools" with the description the tool declares. Embedder providers and
+their model config keys are checked against the installed crewai.
+
+Usage:
+    python build_catalog.py              # show the diff only
+    python build_catalog.py --write      # update utils/data/catalog.json
+    python build_catalog.py --write --prune --refresh
+"""
+
+import argparse
+import copy
+import importlib
+import importlib.metadata
+import inspect
+import json
+import os
+import re
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from utils.catalog import dump_catalog, load_catalog
+from utils.constants import CACHE_DIR
+
+PACKAGE = "crewai-tools"
+NEW_TOOLS_CATEGORY = "Other Tools"
+
+
+def get_installed_version() -> Optional[str]:
+    """Get the installed crewai-tools version, or None if it is not installed."""
+    try:
+        return importlib.metadata.version(PACKAGE)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def _field_default(cls: type, field: str) -> Any:
+    """Get the default of a pydantic field on a tool class (None if undeclared)."""
+    info = getattr(cls, "model_fields", {}).get(field)
+    if info is None:
+        return None
+    if info.default_factory is not None:
+        return info.default_factory()
+    return info.default
+
+
+def _summarize(text: str, sentences: int = 3) -> str:
+    """Collapse whitespace and keep the first few sentences of a description."""
+    text = " ".join(text.split())
+    parts = re.split(r"(?<=[.!?])\s+", text)
+    return " ".join(parts[:sentences])
+
+
+def _describe_args(schema: Any) -> List[Dict[str, Any]]:
+    """Describe the arguments of a tool's args_schema model."""
+    if not inspect.isclass(schema) or not hasattr(schema, "model_json_schema"):
+        return []
+    json_schema = schema.model_json_schema()
+    required = set(json_schema.get("required", []))
+    return [
+        {
+            "name": name,
+            "type": prop.get("type", "any"),
+            "required": name in required,
+            "description": prop.get("description", ""),
+        }
+        for name, prop in json_schema.get("properties", {}).items()
+    ]
+
+
+def introspect_tools() -> Dict[str, Dict[str, Any]]:
+    """
+    Inspect every tool class exported by crewai_tools.
+
+    Returns:
+        Dictionary mapping tool class name to its description, env vars
+        (None when the tool does not declare them), required env vars and args
+    """
+    crewai_tools = importlib.import_module("crewai_tools")
+    from crewai.tools import BaseTool
+
+    names = getattr(crewai_tools, "__all__", None) or dir(crewai_tools)
+    tools = {}
+    for name in sorted(names):
+        cls = getattr(crewai_tools, name, None)
+        if not inspect.isclass(cls) or not issubclass(cls, BaseTool) or cls is BaseTool:
+            continue
+
+        # BaseTool defaults env_vars to [], so an empty list means "not declared"
+        declared = _field_default(cls, "env_vars")
+        env_vars = None
+        required_env_vars: List[str] = []
+        if declared:
+            env_vars = [getattr(var, "name", str(var)) for var in declared]
+            required_env_vars = [
+                getattr(var, "name", str(var)) for var in declared if getattr(var, "required", True)
+            ]
+
+        description = _field_default(cls, "description") or inspect.getdoc(cls) or ""
+        tools[name] = {
+            "name": name,
+            "module": cls.__module__,
+            "description": _summarize(str(description)),
+            "env_vars": env_vars,
+            "required_env_vars": required_env_vars,
+            "args": _describe_args(_field_default(cls, "args_schema")),
+        }
+    return tools
+
+
+def load_introspection(version: str, refresh: bool = False) -> Dict[str, Dict[str, Any]]:
+    """
+    Introspect crewai_tools, reusing the on-disk result for the same version.
+
+    Args:
+        version: Installed crewai-tools version (the cache key)
+        refresh: Ignore any cached result
+
+    Returns:
+        Introspection result as from introspect_tools()
+    """
+    path = os.path.join(CACHE_DIR, f"crewai_tools-{version}.json")
+    if not refresh and os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    tools = introspect_tools()
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(tools, f, indent=1, sort_keys=True)
+    return tools
+
+
+def merge_catalog(
+    current: Dict[str, Any],
+    introspected: Dict[str, Dict[str, Any]],
+    prune: bool = False,
+) -> Dict[str, Any]:
+    """
+    Merge introspected tools into a catalog.
+
+    Args:
+        current: Current catalog (all sections)
+        introspected: Result of introspect_tools()
+        prune: Remove tools that the installed package no longer provides
+
+    Returns:
+        New catalog; `current` is not modified
+    """
+    catalog = copy.deepcopy(current)
+    seen = set()
+    for category, tools in catalog["tools"].items():
+        kept = []
+        for tool in tools:
+            found = introspected.get(tool["name"])
+            seen.add(tool["name"])
+            if found is None:
+                if not prune:
+                    kept.append(tool)
+                continue
+            if found["env_vars"] is not None:
+                tool["env_vars"] = found["env_vars"]
+                tool["requires_auth"] = bool(found["required_env_vars"])
+            tool["args"] = found["args"]
+            if not tool.get("description"):
+                tool["description"] = found["description"]
+            kept.append(tool)
+        catalog["tools"][category] = kept
+
+    new_tools = [tool for name, tool in introspected.items() if name not in seen]
+    for found in new_tools:
+        catalog["tools"].setdefault(NEW_TOOLS_CATEGORY, []).append({
+            "name": found["name"],
+            "description": found["description"],
+            "requires_auth": bool(found["required_env_vars"]),
+            "env_vars": found["env_vars"] or [],
+            "args": found["args"],
+        })
+    return catalog
+
+
+def check_embedder_configs(catalog: Dict[str, Any]) -> List[str]:
+    """
+    Check the catalog's embedder configs against the installed crewai.
+
+    Every provider must be one crewai's build_embedder resolves, and the model
+    must go under a config field that provider declares (crewai accepts and
+    ignores unknown keys, so a wrong key would silently use the default model).
+
+    Returns:
+        One line per problem
+    """
+    from crewai.rag.embeddings.factory import PROVIDER_PATHS
+
+    problems = []
+    for provider in catalog["embedder_providers"]:
+        path = PROVIDER_PATHS.get(provider)
+        if path is None:
+            problems.append(f"{provider}: not a crewai embedder provider")
+            continue
+        module_name, class_name = path.rsplit(".", 1)
+        fields = getattr(importlib.import_module(module_name), class_name).model_fields
+        key = catalog["embedder_models"].get(provider, {}).get("key")
+        if key is not None and key not in fields:
+            problems.append(f"{provider}: model key {key!r} is not a config field of {class_name}")
+    return problems
+
+
+def diff_catalogs(old: Dict[str, Any], new: Dict[str, Any]) -> List[str]:
+    """
+    Describe the tool changes between two catalogs.
+
+    Returns:
+        One line per change ("+" added, "-" removed, "~" changed)
+    """
+    def index(catalog: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        entries = {}
+        for category, tools in catalog["tools"].items():
+            for tool in tools:
+                entries.setdefault(tool["name"], {**tool, "categories": []})["categories"].append(category)
+        return entries
+
+    before, after = index(old), index(new)
+    lines = []
+    for name in sorted(set(before) | set(after)):
+        if name not in before:
+            lines.append(f"+ {name} ({', '.join(after[name]['categories'])})")
+        elif name not in after:
+            lines.append(f"- {name}")
+        else:
+            for field in ("env_vars", "requires_auth", "description", "args"):
+                if before[name].get(field) != after[name].get(field):
+                    lines.append(f"~ {name}: {field} {before[name].get(field)!r} -> {after[name].get(field)!r}")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild Gunny's tools catalog from the installed crewai_tools.")
+    parser.add_argument("--write", action="store_true", help="Write the merged catalog to utils/data/catalog.json")
+    parser.add_argument("--prune", action="store_true", help="Drop tools the installed package no longer provides")
+    parser.add_argument("--refresh", action="store_true", help="Ignore the cached introspection for this version")
+    args = parser.parse_args()
+
+    version = get_installed_version()
+    if version is None:
+        print("❌ crewai-tools is not installed. Install the version to catalog first:")
+        print("   pip install crewai-tools==X.Y.Z")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    introspected = load_introspection(version, refresh=args.refresh)
+    print(f"📦 crewai-tools {version}: {len(introspected)} tools ({time.perf_counter() - start:.2f}s)")
+
+    current = load_catalog()
+    for problem in check_embedder_configs(current):
+        print(f"⚠️  Embedder {problem}")
+    merged = merge_catalog(current, introspected, prune=args.prune)
+    changes = diff_catalogs(current, merged)
+
+    if not changes:
+        print("✅ Catalog is up to date.")
+        return
+
+    print(f"\n{len(changes)} change(s):")
+    for line in changes:
+        print(f"  {line}")
+
+    if args.write:
+        dump_catalog(merged)
+        print("\n✅ utils/data/catalog.json updated. Review new tools' categories and descriptions.")
+    else:
+        print("\nRun with --write to update utils/data/catalog.json.")
+
+
+if __name__ == "__main__":
+    main()
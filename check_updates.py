@@ -5,39 +5,160 @@ Simple CrewAI Update Checker for Gunny
 Run this script to check if there's a new version of CrewAI available
 and whether Gunny has been tested with it.
 
+crewai and crewai-tools are looked up concurrently. Responses are cached in
+~/.cache/gunny/ (override with GUNNY_CACHE_DIR): within --max-age no request is
+made, and after that the index is asked with If-None-Match/If-Modified-Since,
+so an unchanged project costs a 304 instead of a full download.
+
 Usage:
     python check_updates.py
+    python check_updates.py --max-age 0
+    python check_updates.py --index-url http://localhost:8080/pypi
 """
 
-import sys
+import argparse
 import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
 from urllib import request, error
-from utils.constants import TESTED_CREWAI_VERSIONS, LATEST_TESTED_VERSION
+from utils.constants import CACHE_DIR, TESTED_CREWAI_VERSIONS, LATEST_TESTED_VERSION
+from utils.version_checker import get_crewai_version, parse_version
+
+DEFAULT_INDEX_URL = os.environ.get("GUNNY_INDEX_URL", "https://pypi.org/pypi")
+DEFAULT_MAX_AGE = 3600
+PACKAGES = ["crewai", "crewai-tools"]
+CACHE_FILE = os.path.join(CACHE_DIR, "index-cache.json")
+
+_cache_lock = threading.Lock()
+
+
+def load_cache(path: str = CACHE_FILE) -> Dict[str, Dict[str, Any]]:
+    """Load cached index responses (URL -> version, ETag, Last-Modified, fetched_at)."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
 
 
-def get_latest_crewai_version():
-    """Fetch the latest CrewAI version from PyPI."""
+def save_cache(cache: Dict[str, Dict[str, Any]], path: str = CACHE_FILE) -> None:
+    """Write cached index responses, ignoring an unwritable cache directory."""
     try:
-        with request.urlopen('https://pypi.org/pypi/crewai/json', timeout=5) as response:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def get_latest_version(
+    package: str,
+    index_url: str,
+    cache: Dict[str, Dict[str, Any]],
+    max_age: float,
+) -> Dict[str, Any]:
+    """
+    Get the latest version of a package from a PyPI-compatible JSON index.
+
+    Args:
+        package: Distribution name (e.g. "crewai")
+        index_url: Base URL of the JSON API (e.g. "https://pypi.org/pypi")
+        cache: Cache loaded by load_cache(); updated in place
+        max_age: Seconds a cached answer is used without asking the index
+
+    Returns:
+        Dictionary with version (None on failure), source ("cache", "not-modified",
+        "network" or "stale-cache") and error (message or None)
+    """
+    url = f"{index_url.rstrip('/')}/{package}/json"
+    with _cache_lock:
+        cached = dict(cache.get(url, {}))
+
+    if cached.get("version") and time.time() - cached.get("fetched_at", 0) < max_age:
+        return {"version": cached["version"], "source": "cache", "error": None}
+
+    headers = {"Accept": "application/json"}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        with request.urlopen(request.Request(url, headers=headers), timeout=5) as response:
             data = json.loads(response.read().decode())
-            return data['info']['version']
-    except (error.URLError, error.HTTPError, KeyError, json.JSONDecodeError) as e:
-        print(f"❌ Error fetching CrewAI version from PyPI: {e}")
-        return None
+            entry = {
+                "version": data["info"]["version"],
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+            source = "network"
+    except error.HTTPError as e:
+        if e.code != 304 or not cached.get("version"):
+            return _fallback(cached, f"HTTP {e.code} from {url}")
+        entry, source = cached, "not-modified"
+    except (error.URLError, OSError, KeyError, json.JSONDecodeError) as e:
+        return _fallback(cached, str(e))
+
+    entry["fetched_at"] = time.time()
+    with _cache_lock:
+        cache[url] = entry
+    return {"version": entry["version"], "source": source, "error": None}
+
+
+def _fallback(cached: Dict[str, Any], message: str) -> Dict[str, Any]:
+    """Answer from an expired cache entry when the index cannot be reached."""
+    if cached.get("version"):
+        return {"version": cached["version"], "source": "stale-cache", "error": message}
+    return {"version": None, "source": None, "error": message}
+
+
+def get_latest_versions(index_url: str, max_age: float) -> Dict[str, Dict[str, Any]]:
+    """
+    Look up the latest version of every package in PACKAGES concurrently.
+
+    Returns:
+        Dictionary mapping package name to get_latest_version()'s result
+    """
+    cache = load_cache()
+    with ThreadPoolExecutor(max_workers=len(PACKAGES)) as pool:
+        futures = {
+            package: pool.submit(get_latest_version, package, index_url, cache, max_age)
+            for package in PACKAGES
+        }
+        results = {package: future.result() for package, future in futures.items()}
+    if any(result["source"] in ("network", "not-modified") for result in results.values()):
+        save_cache(cache)
+    return results
 
 
 def check_local_crewai():
-    """Check if CrewAI is installed locally and get its version."""
-    try:
-        import crewai
-        return crewai.__version__
-    except ImportError:
-        return None
-    except AttributeError:
-        return "unknown"
+    """Check if CrewAI is installed locally and get its version (without importing it)."""
+    return get_crewai_version()
+
+
+def check_local_crewai_tools():
+    """Check if crewai-tools is installed locally and get its version (without importing it)."""
+    return get_crewai_version("crewai-tools")
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Check for new CrewAI releases and Gunny compatibility.")
+    parser.add_argument(
+        "--index-url", default=DEFAULT_INDEX_URL,
+        help="Base URL of a PyPI-compatible JSON API (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--max-age", type=float, default=DEFAULT_MAX_AGE,
+        help="Seconds to reuse cached answers without contacting the index (default: %(default)s)",
+    )
+    args = parser.parse_args()
+
     print("=" * 60)
     print("🔍 Gunny - CrewAI Update Checker")
     print("=" * 60)
@@ -49,17 +170,29 @@ def main():
         print(f"📦 Your CrewAI version: {local_version}")
     else:
         print("📦 CrewAI not installed locally (optional for Gunny)")
+    local_tools_version = check_local_crewai_tools()
+    if local_tools_version:
+        print(f"📦 Your crewai-tools version: {local_tools_version}")
     print()
 
-    # Check latest version
-    print("🌐 Checking PyPI for latest CrewAI version...")
-    latest_version = get_latest_crewai_version()
+    # Check latest versions
+    print(f"🌐 Checking {args.index_url} for latest CrewAI versions...")
+    latest = get_latest_versions(args.index_url, args.max_age)
+    for package, result in latest.items():
+        if result["error"]:
+            print(f"❌ Error fetching {package} version: {result['error']}")
+        if result["source"] == "stale-cache":
+            print(f"   Using cached {package} version from an earlier check")
 
+    latest_version = latest["crewai"]["version"]
     if not latest_version:
         print("\n⚠️  Could not fetch latest version. Check your internet connection.")
         sys.exit(1)
 
     print(f"📦 Latest CrewAI version: {latest_version}")
+    latest_tools_version = latest["crewai-tools"]["version"]
+    if latest_tools_version:
+        print(f"📦 Latest crewai-tools version: {latest_tools_version}")
     print()
 
     # Check Gunny compatibility
@@ -76,7 +209,7 @@ def main():
         print("✅ COMPATIBLE: Gunny has been tested with this CrewAI version!")
         print()
         print("🎉 You're all set! No updates needed.")
-    elif latest_version > LATEST_TESTED_VERSION:
+    elif parse_version(latest_version) > parse_version(LATEST_TESTED_VERSION):
         print(f"⚠️  NEW VERSION AVAILABLE: CrewAI {latest_version}")
         print()
         print("📋 Next Steps:")
@@ -95,6 +228,10 @@ def main():
         print()
         print("   4. Check CrewAI release notes for new tools/features:")
         print(f"      https://github.com/crewAIInc/crewAI/releases/tag/{latest_version}")
+        print()
+        print("   5. Refresh the tools catalog:")
+        print(f"      pip install crewai-tools=={latest_tools_version or 'X.Y.Z'}")
+        print("      python build_catalog.py --write")
     else:
         print(f"ℹ️  You're using a version older than Gunny's latest tested ({LATEST_TESTED_VERSION})")
         print()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Font Fetcher for Gunny
+
+Downloads the Latin subsets of Outfit and Fira Code (both SIL Open Font
+License) from Google Fonts into static/fonts/, so the running app serves
+them itself and never fetches fonts from the internet. Run it once on a
+machine with network access (the Docker build does this); files that already
+exist are left alone, so air-gapped builds can ship pre-fetched copies.
+
+Usage:
+    python fetch_fonts.py
+    python fetch_fonts.py --force
+"""
+
+import argparse
+import os
+import re
+import sys
+from urllib import error, request
+
+FONTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "fonts")
+
+# Output file -> Google Fonts css2 family spec (variable weight ranges)
+FONTS = {
+    "outfit-latin.woff2": "Outfit:wght@300..700",
+    "fira-code-latin.woff2": "Fira+Code:wght@400..600",
+}
+
+# Google Fonts only serves woff2 to browsers it recognises
+USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+
+
+def _get(url: str) -> bytes:
+    req = request.Request(url, headers={"User-Agent": USER_AGENT})
+    with request.urlopen(req, timeout=15) as response:
+        return response.read()
+
+
+def latin_woff2_url(family: str) -> str:
+    """
+    Find the woff2 URL of a family's Latin subset.
+
+    Args:
+        family: css2 family spec (e.g. "Outfit:wght@300..700")
+
+    Returns:
+        URL of the woff2 file
+    """
+    css = _get(f"https://fonts.googleapis.com/css2?family={family}&display=swap").decode("utf-8")
+    match = re.search(r"/\* latin \*/\s*@font-face\s*{[^}]*?url\((https://[^)]+\.woff2)\)", css)
+    if not match:
+        raise ValueError(f"No Latin woff2 subset found for {family}")
+    return match.group(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Download Gunny's fonts into static/fonts/.")
+    parser.add_argument("--force", action="store_true", help="Download even if the files already exist")
+    args = parser.parse_args()
+
+    os.makedirs(FONTS_DIR, exist_ok=True)
+    failed = False
+    for filename, family in FONTS.items():
+        path = os.path.join(FONTS_DIR, filename)
+        if os.path.exists(path) and not args.force:
+            print(f"✅ {filename} already present")
+            continue
+        try:
+            data = _get(latin_woff2_url(family))
+        except (error.URLError, error.HTTPError, ValueError, OSError) as e:
+            print(f"❌ Could not fetch {filename}: {e}")
+            failed = True
+            continue
+        with open(path, "wb") as f:
+            f.write(data)
+        print(f"✅ {filename} ({len(data) / 1024:.0f} KiB)")
+
+    if failed:
+        print("\n⚠️  Missing fonts fall back to the system font stack in static/theme.css.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
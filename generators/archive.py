@@ -0,0 +1,366 @@
+"""Project archive writers: ZIP (stored/deflate) and tar (gzip/zstd).
+
+All writers are deterministic: entries are sorted by path, use POSIX
+separators, a fixed timestamp, fixed permissions and fixed compression
+parameters, so the same files always produce the same bytes.
+
+File contents may be given as str, bytes or a pathlib.Path. Path entries are
+streamed from disk in chunks, so archives much larger than memory can be
+written to a file. Large deflate entries are compressed in chunks: each chunk
+is deflated with the previous 32 KiB as a preset dictionary and ends on a
+byte boundary, and the chunks are joined into one valid deflate stream (the
+technique pigz uses). Chunks are deflated on a thread pool (zlib releases the
+GIL); the number of threads does not change the output bytes.
+"""
+
+import calendar
+import gzip
+import io
+import os
+import struct
+import tarfile
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, Dict, Iterator, List, Optional, Tuple, Union
+
+FileContent = Union[str, bytes, Path]
+
+# Mode name -> (archive format, compression, level)
+COMPRESSION_MODES: Dict[str, Tuple[str, str, Optional[int]]] = {
+    "stored": ("zip", "stored", None),
+    "fast": ("zip", "deflate", 1),
+    "default": ("zip", "deflate", 6),
+    "max": ("zip", "deflate", 9),
+    "tar.gz": ("tar", "gzip", 6),
+    "zstd": ("tar", "zstd", 10),
+}
+
+COMPRESSION_LABELS = {
+    "stored": "ZIP (stored, fastest)",
+    "fast": "ZIP (fast deflate)",
+    "default": "ZIP (deflate)",
+    "max": "ZIP (max deflate)",
+    "tar.gz": "tar.gz",
+    "zstd": "tar.zst (zstd, multi-threaded)",
+}
+
+ARCHIVE_EXTENSIONS = {"zip": ".zip", "gzip": ".tar.gz", "zstd": ".tar.zst"}
+ARCHIVE_MIME_TYPES = {"zip": "application/zip", "gzip": "application/gzip", "zstd": "application/zstd"}
+
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)  # earliest timestamp a ZIP entry can hold
+ZIP_MIN_EPOCH = 315532800  # 1980-01-01T00:00:00Z as a Unix timestamp
+FILE_MODE = 0o644
+
+CHUNK_SIZE = 1024 * 1024
+PARALLEL_THRESHOLD = 2 * CHUNK_SIZE  # entries at least this large are deflated in chunks
+DICT_SIZE = 32 * 1024  # deflate window
+ZIP32_LIMIT = 0xFFFFFFFF
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def available_compression_modes() -> List[str]:
+    """
+    List the compression modes usable in this environment.
+
+    Returns:
+        Mode names; "zstd" is included only when the zstandard package is installed
+    """
+    modes = [mode for mode, (_, compression, _) in COMPRESSION_MODES.items() if compression != "zstd"]
+    try:
+        import zstandard  # noqa: F401
+        modes.append("zstd")
+    except ImportError:
+        pass
+    return modes
+
+
+def archive_filename(project_name: str, mode: str = "default", suffix: str = "") -> str:
+    """Get the download file name for an archive (e.g. "my_crew_core.tar.gz")."""
+    compression = COMPRESSION_MODES[mode][1]
+    return f"{project_name}{suffix}{ARCHIVE_EXTENSIONS.get(compression, '.zip')}"
+
+
+def archive_mime_type(mode: str = "default") -> str:
+    """Get the MIME type of an archive written in the given mode."""
+    return ARCHIVE_MIME_TYPES.get(COMPRESSION_MODES[mode][1], "application/zip")
+
+
+def source_date_time() -> Tuple[int, int, int, int, int, int]:
+    """
+    Get the fixed timestamp stamped on every archive entry.
+
+    Honors SOURCE_DATE_EPOCH (the reproducible-builds convention) and
+    otherwise uses the earliest date a ZIP file can represent.
+    """
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if epoch and epoch.isdigit():
+        return time.gmtime(max(int(epoch), ZIP_MIN_EPOCH))[:6]
+    return ZIP_EPOCH
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 2, thread_name_prefix="gunny-deflate"
+            )
+        return _executor
+
+
+def _content_size(content: FileContent) -> int:
+    if isinstance(content, Path):
+        return content.stat().st_size
+    if isinstance(content, str):
+        return len(content.encode("utf-8"))
+    return len(content)
+
+
+def _iter_chunks(content: FileContent, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield an entry's bytes in chunks, reading Path contents from disk."""
+    if isinstance(content, Path):
+        with open(content, "rb") as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    view = memoryview(data)
+    for start in range(0, len(data), chunk_size):
+        yield view[start:start + chunk_size].tobytes()
+
+
+def _archive_entries(files: Dict[str, FileContent], project_name: str) -> List[Tuple[str, FileContent]]:
+    """Sorted (archive path, content) pairs rooted at the project directory."""
+    return [
+        (f"{project_name}/{path.replace(chr(92), '/').lstrip('/')}", files[path])
+        for path in sorted(files)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Deflate
+# ---------------------------------------------------------------------------
+
+def _deflate_chunk(data: bytes, level: int, zdict: bytes, last: bool) -> bytes:
+    """Raw-deflate one chunk, primed with the preceding data, ending on a byte boundary."""
+    if zdict:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS, 8, zlib.Z_DEFAULT_STRATEGY, zdict)
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+
+def _deflate_serial(chunks: Iterator[bytes], level: int) -> Iterator[Tuple[bytes, bytes]]:
+    """Yield (input chunk, compressed bytes) using one compressor."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    for chunk in chunks:
+        yield chunk, compressor.compress(chunk)
+    yield b"", compressor.flush(zlib.Z_FINISH)
+
+
+def _deflate_chunked(chunks: Iterator[bytes], level: int, workers: int) -> Iterator[Tuple[bytes, bytes]]:
+    """
+    Yield (input chunk, compressed bytes) with each chunk deflated independently.
+
+    With more than one worker the chunks are deflated concurrently, holding at
+    most `workers * 2` chunks in memory; the bytes are the same either way.
+    """
+    executor = _get_executor() if workers > 1 else None
+    pending = []
+    previous_tail = b""
+    chunk = next(chunks, None)
+    while chunk is not None:
+        following = next(chunks, None)
+        job = (chunk, level, previous_tail, following is None)
+        previous_tail = chunk[-DICT_SIZE:]
+        if executor is None:
+            yield chunk, _deflate_chunk(*job)
+        else:
+            pending.append((chunk, executor.submit(_deflate_chunk, *job)))
+            if len(pending) >= workers * 2:
+                data, future = pending.pop(0)
+                yield data, future.result()
+        chunk = following
+    for data, future in pending:
+        yield data, future.result()
+
+
+# ---------------------------------------------------------------------------
+# ZIP
+# ---------------------------------------------------------------------------
+
+def _dos_date_time(date_time: Tuple[int, ...]) -> Tuple[int, int]:
+    year, month, day, hour, minute, second = date_time[:6]
+    return (hour << 11) | (minute << 5) | (second // 2), ((year - 1980) << 9) | (month << 5) | day
+
+
+def write_zip(
+    files: Dict[str, FileContent],
+    project_name: str,
+    output: IO[bytes],
+    level: Optional[int] = 6,
+    workers: Optional[int] = None,
+) -> None:
+    """
+    Write a deterministic ZIP archive to a seekable binary stream.
+
+    Args:
+        files: Dictionary mapping file paths to contents (str, bytes or Path)
+        project_name: Root directory inside the archive
+        output: Seekable binary stream (BytesIO or a file opened "w+b"/"wb")
+        level: Deflate level 1-9, or None to store entries uncompressed
+        workers: Threads for large entries (default: all cores; 1 deflates them
+            on the calling thread). The output does not depend on it.
+
+    Raises:
+        ValueError: If the archive would need ZIP64 (an entry or the archive over 4 GiB)
+    """
+    workers = workers or os.cpu_count() or 1
+    dos_time, dos_date = _dos_date_time(source_date_time())
+    method = 0 if level is None else 8
+    central = []
+    base = output.tell()
+
+    for name, content in _archive_entries(files, project_name):
+        encoded_name = name.encode("utf-8")
+        offset = output.tell() - base
+        header_fmt = "<IHHHHHIIIHH"
+        output.write(struct.pack(header_fmt, 0x04034B50, 20, 0x0800, method, dos_time, dos_date,
+                                 0, 0, 0, len(encoded_name), 0))
+        output.write(encoded_name)
+
+        crc = 0
+        size = 0
+        compressed_size = 0
+        chunks = _iter_chunks(content)
+        if method == 0:
+            pieces = ((chunk, chunk) for chunk in chunks)
+        elif _content_size(content) >= PARALLEL_THRESHOLD:
+            pieces = _deflate_chunked(chunks, level, workers)
+        else:
+            pieces = _deflate_serial(chunks, level)
+        for raw, packed in pieces:
+            crc = zlib.crc32(raw, crc)
+            size += len(raw)
+            compressed_size += len(packed)
+            output.write(packed)
+
+        if max(size, compressed_size, offset) > ZIP32_LIMIT:
+            raise ValueError("Archive too large for ZIP (over 4 GiB); use the tar.gz or zstd mode")
+
+        end = output.tell()
+        output.seek(base + offset + 14)
+        output.write(struct.pack("<III", crc, compressed_size, size))
+        output.seek(end)
+        central.append((encoded_name, crc, compressed_size, size, offset))
+
+    directory_offset = output.tell() - base
+    for encoded_name, crc, compressed_size, size, offset in central:
+        output.write(struct.pack(
+            "<IHHHHHHIIIHHHHHII", 0x02014B50, (3 << 8) | 20, 20, 0x0800, method, dos_time, dos_date,
+            crc, compressed_size, size, len(encoded_name), 0, 0, 0, 0,
+            (0o100000 | FILE_MODE) << 16, offset,
+        ))
+        output.write(encoded_name)
+    directory_size = output.tell() - base - directory_offset
+
+    if len(central) > 0xFFFF or directory_offset > ZIP32_LIMIT:
+        raise ValueError("Archive too large for ZIP (over 4 GiB); use the tar.gz or zstd mode")
+    output.write(struct.pack("<IHHHHIIH", 0x06054B50, 0, 0, len(central), len(central),
+                             directory_size, directory_offset, 0))
+
+
+# ---------------------------------------------------------------------------
+# tar
+# ---------------------------------------------------------------------------
+
+def write_tar(
+    files: Dict[str, FileContent],
+    project_name: str,
+    output: IO[bytes],
+    compression: str = "gzip",
+    level: int = 6,
+) -> None:
+    """
+    Write a deterministic compressed tar archive.
+
+    Args:
+        files: Dictionary mapping file paths to contents (str, bytes or Path)
+        project_name: Root directory inside the archive
+        output: Binary stream (need not be seekable)
+        compression: "gzip" or "zstd" (zstd needs the zstandard package and uses all cores)
+        level: Compression level
+    """
+    mtime = calendar.timegm(source_date_time())
+    if compression == "zstd":
+        import zstandard
+
+        stream = zstandard.ZstdCompressor(level=level, threads=-1).stream_writer(output, closefd=False)
+    else:
+        stream = gzip.GzipFile(filename="", fileobj=output, mode="wb", compresslevel=level, mtime=0)
+
+    with stream, tarfile.open(fileobj=stream, mode="w|", format=tarfile.PAX_FORMAT) as tar:
+        for name, content in _archive_entries(files, project_name):
+            info = tarfile.TarInfo(name)
+            info.size = _content_size(content)
+            info.mtime = mtime
+            info.mode = FILE_MODE
+            info.uid = info.gid = 0
+            info.uname = info.gname = ""
+            if isinstance(content, Path):
+                with open(content, "rb") as f:
+                    tar.addfile(info, f)
+            else:
+                data = content.encode("utf-8") if isinstance(content, str) else content
+                tar.addfile(info, io.BytesIO(data))
+
+
+def write_archive(
+    files: Dict[str, FileContent],
+    project_name: str,
+    output: IO[bytes],
+    mode: str = "default",
+    workers: Optional[int] = None,
+) -> None:
+    """
+    Write a project archive in one of COMPRESSION_MODES.
+
+    Args:
+        files: Dictionary mapping file paths to contents (str, bytes or Path)
+        project_name: Root directory inside the archive
+        output: Binary stream (must be seekable for ZIP modes)
+        mode: Compression mode name (see COMPRESSION_MODES)
+        workers: Threads for parallel deflate (ZIP modes)
+
+    Raises:
+        ValueError: If the mode is unknown or unavailable
+    """
+    if mode not in COMPRESSION_MODES:
+        raise ValueError(f"Unknown compression mode {mode!r}; choose from {', '.join(COMPRESSION_MODES)}")
+    if mode not in available_compression_modes():
+        raise ValueError(f"Compression mode {mode!r} needs the zstandard package (pip install zstandard)")
+
+    archive_format, compression, level = COMPRESSION_MODES[mode]
+    if archive_format == "zip":
+        write_zip(files, project_name, output, level=level, workers=workers)
+    else:
+        write_tar(files, project_name, output, compression=compression, level=level)
+
+
+def build_archive(
+    files: Dict[str, FileContent],
+    project_name: str,
+    mode: str = "default",
+    workers: Optional[int] = None,
+) -> bytes:
+    """Build a project archive in memory (see write_archive) and return its bytes."""
+    buffer = io.BytesIO()
+    write_archive(files, project_name, buffer, mode=mode, workers=workers)
+    return buffer.getvalue()
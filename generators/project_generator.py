@@ -2,8 +2,10 @@
 
 import os
 import io
+import hashlib
+import posixpath
 import zipfile
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Union
 from generators.yaml_generator import (
     generate_agents_yaml,
     generate_tasks_yaml,
@@ -17,7 +19,18 @@ from generators.python_generator import (
     generate_main_py,
     generate_init_py,
     generate_tool_stubs,
+    generate_knowledge_sources_method,
+    generate_knowledge_index_py,
+    generate_local_embedder_py,
+    generate_local_embedder_test_py,
+    generate_batch_py,
+    generate_shard_runner_py,
+    generate_tracing_py,
+    generate_tool_cache_py,
+    generate_llm_cache_py,
+    generate_startup_benchmark_py,
 )
+from generators.archive import COMPRESSION_MODES, build_archive
 
 
 def extract_input_variables(agents: List[Dict[str, Any]], tasks: List[Dict[str, Any]]) -> List[str]:
@@ -70,7 +83,14 @@ def generate_project_structure(
     enable_langsmith: bool = False,
     langsmith_project: str = "my-crew-project",
     selected_tools: List[str] = None,
-    tools_catalog: Dict[str, List[Dict[str, Any]]] = None
+    tools_catalog: Dict[str, List[Dict[str, Any]]] = None,
+    knowledge_sources: List[Dict[str, Any]] = None,
+    embedder: Dict[str, Any] = None,
+    enable_local_tracing: bool = False,
+    enable_tool_cache: bool = False,
+    tool_cache_ttls: Dict[str, int] = None,
+    enable_llm_cache: bool = False,
+    lazy_tool_imports: bool = False,
 ) -> Dict[str, str]:
     """
     Generate complete project structure as a dictionary of file paths to contents.
@@ -89,6 +109,14 @@ def generate_project_structure(
         langsmith_project: LangSmith project name
         selected_tools: List of selected tool names (for dynamic stub generation)
         tools_catalog: Complete tools catalog from constants.py
+        knowledge_sources: Knowledge source configurations emitted into crew.py
+        embedder: Embedder configuration ({"provider", "config"}) emitted into crew.py;
+            local embedders ("local": True) also get local_embedder.py and a smoke test
+        enable_local_tracing: Whether to include local JSONL tracing (tracing.py)
+        enable_tool_cache: Whether to persist tool results across runs (tool_cache.py)
+        tool_cache_ttls: Tool name -> cache TTL in seconds (see utils.catalog.get_tool_cache_ttls)
+        enable_llm_cache: Whether to cache LLM responses locally (llm_cache.py)
+        lazy_tool_imports: Whether crew.py imports tools inside the agent methods that use them
 
     Returns:
         Dictionary mapping file paths to their contents
@@ -103,9 +131,42 @@ def generate_project_structure(
 
     # Core files (always included)
     files[f"{src_dir}/crew.py"] = generate_crew_py(
-        project_name, agents, tasks, crew_config, tools_by_agent
+        project_name,
+        agents,
+        tasks,
+        crew_config,
+        tools_by_agent,
+        knowledge_sources,
+        embedder,
+        enable_local_tracing,
+        enable_tool_cache,
+        enable_llm_cache,
+        lazy_tool_imports,
     )
-    files[f"{src_dir}/main.py"] = generate_main_py(project_name, input_vars)
+    has_knowledge = bool(generate_knowledge_sources_method(knowledge_sources or []))
+    files[f"{src_dir}/main.py"] = generate_main_py(
+        project_name,
+        input_vars,
+        knowledge_index=has_knowledge,
+        tracing=enable_local_tracing,
+        tool_cache=enable_tool_cache,
+        llm_cache=enable_llm_cache,
+    )
+    files[f"{src_dir}/batch.py"] = generate_batch_py(project_name)
+    files[f"{src_dir}/shard_runner.py"] = generate_shard_runner_py(project_name)
+    files[f"{src_dir}/startup_benchmark.py"] = generate_startup_benchmark_py(project_name)
+    if enable_local_tracing:
+        files[f"{src_dir}/tracing.py"] = generate_tracing_py(project_name)
+    if enable_tool_cache:
+        files[f"{src_dir}/tool_cache.py"] = generate_tool_cache_py(project_name, tool_cache_ttls)
+    if enable_llm_cache:
+        files[f"{src_dir}/llm_cache.py"] = generate_llm_cache_py(project_name)
+    if has_knowledge:
+        files[f"{src_dir}/knowledge_index.py"] = generate_knowledge_index_py(project_name, knowledge_sources)
+    uses_local_embedder = bool(embedder and embedder.get("local"))
+    if uses_local_embedder:
+        files[f"{src_dir}/local_embedder.py"] = generate_local_embedder_py(project_name, embedder)
+        files["tests/test_local_embeddings.py"] = generate_local_embedder_test_py(project_name)
 
     # Config files (always included)
     files[f"{src_dir}/config/agents.yaml"] = generate_agents_yaml(agents)
@@ -124,9 +185,13 @@ def generate_project_structure(
     for filename, content in tool_stubs:
         files[f"{src_dir}/tools/{filename}"] = content
 
-    # Knowledge directory (always included)
-    files[f"{src_dir}/knowledge/.gitkeep"] = ""
-    files[f"{src_dir}/knowledge/README.md"] = """# Knowledge Base
+    # Knowledge directory (always included), at the project root where CrewAI
+    # resolves knowledge file paths
+    files["knowledge/.gitkeep"] = ""
+    files["knowledge/README.md"] = """# Knowledge Base
+
+CrewAI resolves knowledge file paths against this directory, at the project
+root (where you run `crewai run`).
 
 Place your knowledge base files here:
 - PDF documents
@@ -142,9 +207,30 @@ These files can be used by agents to access domain-specific information.
     if generation_mode == "complete_project":
         # Root level files
         files[".gitignore"] = generate_gitignore()
-        files["README.md"] = generate_readme(project_name, description, enable_langsmith)
-        files["pyproject.toml"] = generate_pyproject_toml(project_name, python_version, enable_langsmith)
-        files[".env"] = generate_env_file(env_vars, enable_langsmith, langsmith_project)
+        files["README.md"] = generate_readme(
+            project_name,
+            description,
+            enable_langsmith,
+            enable_local_tracing,
+            enable_tool_cache,
+            enable_llm_cache,
+            enable_knowledge_index=has_knowledge,
+        )
+        files["pyproject.toml"] = generate_pyproject_toml(
+            project_name,
+            python_version,
+            enable_langsmith,
+            uses_docling=any(source.get("type") == "Docling" for source in knowledge_sources or []),
+            extra_dependencies=embedder.get("dependencies") if uses_local_embedder else None,
+        )
+        files[".env"] = generate_env_file(
+            env_vars,
+            enable_langsmith,
+            langsmith_project,
+            enable_local_tracing,
+            enable_tool_cache,
+            enable_llm_cache,
+        )
 
         # Source directory __init__.py
         files[f"{src_dir}/__init__.py"] = generate_init_py(project_name)
@@ -152,29 +238,68 @@ These files can be used by agents to access domain-specific information.
     return files
 
 
-def create_zip_file(files: Dict[str, str], project_name: str) -> bytes:
+def create_zip_file(
+    files: Dict[str, str],
+    project_name: str,
+    deterministic: bool = True,
+    compression: str = "default",
+) -> bytes:
     """
     Create a ZIP file containing all project files.
 
+    In deterministic mode (the default) the same files always produce the same
+    bytes: entries are sorted by path, use POSIX separators, a fixed timestamp,
+    fixed permissions (0644) and a fixed compression level.
+
     Args:
         files: Dictionary mapping file paths to their contents
         project_name: Name of the project (used as root directory in ZIP)
+        deterministic: Produce byte-reproducible output (default: True)
+        compression: "stored", "fast", "default" or "max" (see generators.archive)
 
     Returns:
         Bytes of the ZIP file
     """
-    zip_buffer = io.BytesIO()
+    if COMPRESSION_MODES.get(compression, ("",))[0] != "zip":
+        raise ValueError(f"Not a ZIP compression mode: {compression!r}")
+    if deterministic:
+        return build_archive(files, project_name, mode=compression)
 
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+    level = COMPRESSION_MODES[compression][2]
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(
+        zip_buffer,
+        'w',
+        zipfile.ZIP_STORED if level is None else zipfile.ZIP_DEFLATED,
+        compresslevel=level,
+    ) as zip_file:
         for file_path, content in files.items():
-            # Add project name as root directory
-            full_path = os.path.join(project_name, file_path)
-            zip_file.writestr(full_path, content)
+            # Add project name as root directory (ZIP paths always use "/")
+            zip_file.writestr(posixpath.join(project_name, file_path.replace("\\", "/")), content)
 
     zip_buffer.seek(0)
     return zip_buffer.getvalue()
 
 
+def archive_digest(data: Union[bytes, str, os.PathLike]) -> str:
+    """
+    Get the content digest of an archive (stable for deterministic archives).
+
+    Args:
+        data: Archive bytes, or the path of an archive file (read in chunks)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    if isinstance(data, bytes):
+        return hashlib.sha256(data).hexdigest()
+    digest = hashlib.sha256()
+    with open(data, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def save_project_to_disk(files: Dict[str, str], base_path: str):
     """
     Save project files to disk.
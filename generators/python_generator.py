@@ -1,6 +1,1617 @@
 """Python code generation for CrewAI project files."""
 
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
+
+# Knowledge source type -> (module in crewai.knowledge.source, class name)
+KNOWLEDGE_SOURCE_CLASSES = {
+    "String": ("string_knowledge_source", "StringKnowledgeSource"),
+    "PDF": ("pdf_knowledge_source", "PDFKnowledgeSource"),
+    "TextFile": ("text_file_knowledge_source", "TextFileKnowledgeSource"),
+    "CSV": ("csv_knowledge_source", "CSVKnowledgeSource"),
+    "JSON": ("json_knowledge_source", "JSONKnowledgeSource"),
+    "Excel": ("excel_knowledge_source", "ExcelKnowledgeSource"),
+    "Docling": ("crew_docling_source", "CrewDoclingSource"),
+}
+
+
+def _knowledge_file_path(path: str) -> str:
+    """Make a knowledge file path relative to the project's knowledge/ directory."""
+    path = path.strip().replace("\\", "/")
+    while path.startswith("./"):
+        path = path[2:]
+    if path.startswith("knowledge/"):
+        path = path[len("knowledge/"):]
+    return path
+
+
+def group_knowledge_sources(
+    knowledge_sources: List[Dict[str, Any]],
+) -> Tuple[List[str], Dict[str, List[str]]]:
+    """
+    Collect the usable knowledge sources.
+
+    Args:
+        knowledge_sources: Knowledge source configurations ({"type", "config"})
+
+    Returns:
+        Tuple of (string contents, file paths relative to knowledge/ by source type)
+    """
+    strings = []
+    files_by_type: Dict[str, List[str]] = {}
+    for source in knowledge_sources:
+        source_type = source.get("type", "String")
+        config = source.get("config", {})
+        if source_type not in KNOWLEDGE_SOURCE_CLASSES:
+            continue
+        if source_type == "String":
+            if config.get("content", "").strip():
+                strings.append(config["content"])
+        elif config.get("path", "").strip():
+            path = _knowledge_file_path(config["path"])
+            if path not in files_by_type.setdefault(source_type, []):
+                files_by_type[source_type].append(path)
+    return strings, files_by_type
+
+
+def generate_knowledge_sources_method(knowledge_sources: List[Dict[str, Any]]) -> str:
+    """
+    Generate the crew method that builds the knowledge sources.
+
+    File sources of the same type are grouped into one source object. Source
+    classes are imported and constructed inside the method, so documents are
+    parsed only when the crew is built to run, not when crew.py is imported.
+
+    Args:
+        knowledge_sources: Knowledge source configurations ({"type", "config"})
+
+    Returns:
+        Method code, or an empty string if no source has content
+    """
+    strings, files_by_type = group_knowledge_sources(knowledge_sources)
+    used_types = [t for t in KNOWLEDGE_SOURCE_CLASSES if files_by_type.get(t) or (t == "String" and strings)]
+    if not used_types:
+        return ""
+
+    imports = sorted(
+        f"from crewai.knowledge.source.{KNOWLEDGE_SOURCE_CLASSES[t][0]} import {KNOWLEDGE_SOURCE_CLASSES[t][1]}"
+        for t in used_types
+    )
+    constructors = []
+    for source_type in used_types:
+        class_name = KNOWLEDGE_SOURCE_CLASSES[source_type][1]
+        if source_type == "String":
+            constructors.extend(f"{class_name}(content={content!r})," for content in strings)
+        else:
+            constructors.append(f"{class_name}(file_paths={files_by_type[source_type]!r}),")
+
+    import_lines = "\n".join(f"        {line}" for line in imports)
+    constructor_lines = "\n".join(f"            {line}" for line in constructors)
+    return f'''    def build_knowledge_sources(self) -> list:
+        """
+        Build the crew's knowledge sources.
+
+        Called from crew(), so documents are parsed only when the crew is built
+        to run. File paths are relative to the knowledge/ directory.
+        """
+{import_lines}
+
+        return [
+{constructor_lines}
+        ]'''
+
+
+def generate_knowledge_index_py(project_name: str, knowledge_sources: List[Dict[str, Any]]) -> str:
+    """
+    Generate knowledge_index.py: offline pre-indexing of knowledge files.
+
+    The module chunks knowledge files as CrewAI does (streaming text and CSV
+    through a memory map), embeds chunks in batches and keeps a content-hash
+    keyed embedding cache on disk that crew.py also uses at run time.
+
+    Args:
+        project_name: Name of the project
+        knowledge_sources: Knowledge source configurations ({"type", "config"})
+
+    Returns:
+        String content for knowledge_index.py
+    """
+    _, knowledge_files = group_knowledge_sources(knowledge_sources)
+
+    content = f'''"""
+Knowledge index for the {project_name.replace("_", " ").title()} crew.
+
+Pre-computes embeddings for the knowledge files so the crew does not
+re-embed them on every start:
+
+    python main.py build_knowledge_index
+
+Files are chunked the way CrewAI chunks them (4000 characters with 200 of
+overlap). Text and CSV files are streamed through a memory map instead of
+being loaded whole. Embeddings are computed in batches and cached on disk in
+.knowledge_cache/, keyed by a hash of the embedder config and the chunk text,
+so re-runs only embed new or changed chunks. crew.py wraps its embedder with
+the same cache (cached_embedder), so CrewAI's own embedding calls at run time
+are answered from disk too.
+"""
+
+import codecs
+import csv
+import hashlib
+import importlib
+import io
+import json
+import mmap
+import sqlite3
+import threading
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from chromadb.api.types import EmbeddingFunction as ChromaEmbeddingFunction
+from crewai.rag.embeddings.factory import build_embedder
+from crewai.rag.embeddings.providers.custom.embedding_callable import CustomEmbeddingFunction
+
+KNOWLEDGE_DIR = Path("knowledge")
+CACHE_PATH = Path(".knowledge_cache") / "embeddings.sqlite3"
+CHUNK_SIZE = 4000  # CrewAI's default knowledge chunk size
+CHUNK_OVERLAP = 200
+READ_SIZE = 1024 * 1024
+BATCH_SIZE = 64
+
+# Knowledge files configured in crew.py, by source type
+KNOWLEDGE_FILES = {knowledge_files!r}
+
+# Source types parsed with CrewAI's own loader (not streamable)
+CREWAI_LOADERS = {{
+    "PDF": ("pdf_knowledge_source", "PDFKnowledgeSource"),
+    "JSON": ("json_knowledge_source", "JSONKnowledgeSource"),
+}}
+
+Embed = Callable[[List[str]], List[List[float]]]
+
+
+def _describe(value: Any) -> str:
+    # Custom embedding classes carry their settings as class attributes
+    if isinstance(value, type):
+        settings = json.dumps(getattr(value, "settings", None), sort_keys=True, default=str)
+        return f"{{value.__module__}}.{{value.__qualname__}}({{settings}})"
+    return str(value)
+
+
+def embedder_key(config: Dict[str, Any]) -> str:
+    """Identify an embedder configuration (cache entries are per model)."""
+    payload = json.dumps(config, sort_keys=True, default=_describe)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def build_embedding_function(config: Dict[str, Any]) -> Embed:
+    """Build CrewAI's embedding function for an embedder config."""
+    if config.get("provider") == "custom":
+        return config["config"]["embedding_callable"]()
+    return build_embedder(config)
+
+
+class EmbeddingCache:
+    """Embeddings stored in SQLite, keyed by embedder and chunk text hash."""
+
+    def __init__(self, path: Path = CACHE_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)")
+        self._db.commit()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(model: str, text: str) -> str:
+        return hashlib.sha256(f"{{model}}\\0{{text}}".encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        found = {{}}
+        with self._lock:
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._db.execute(f"SELECT key, vector FROM embeddings WHERE key IN ({{placeholders}})", batch)
+                for key, blob in rows:
+                    found[key] = array("f", blob).tolist()
+        return found
+
+    def put_many(self, vectors: Dict[str, List[float]]) -> None:
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO embeddings VALUES (?, ?)",
+                [(key, array("f", vector).tobytes()) for key, vector in vectors.items()],
+            )
+            self._db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+def embed_with_cache(
+    texts: List[str],
+    embed: Embed,
+    cache: EmbeddingCache,
+    model: str,
+    batch_size: int = BATCH_SIZE,
+) -> Tuple[List[List[float]], int]:
+    """
+    Embed texts, computing only those missing from the cache, in batches.
+
+    Returns:
+        Tuple of (one vector per text, number of texts actually embedded)
+    """
+    keys = [EmbeddingCache.key(model, text) for text in texts]
+    found = cache.get_many(list(dict.fromkeys(keys)))
+    missing = list({{key: text for key, text in zip(keys, texts) if key not in found}}.items())
+    for start in range(0, len(missing), batch_size):
+        batch = missing[start:start + batch_size]
+        vectors = embed([text for _, text in batch])
+        computed = {{key: [float(x) for x in vector] for (key, _), vector in zip(batch, vectors)}}
+        cache.put_many(computed)
+        found.update(computed)
+    return [found[key] for key in keys], len(missing)
+
+
+class CachedEmbeddingFunction(CustomEmbeddingFunction, ChromaEmbeddingFunction):
+    """
+    Embedding function for CrewAI that answers from the on-disk cache first.
+
+    CrewAI instantiates the class itself (with no arguments), so the wrapped
+    embedder config lives on the subclasses made by cached_embedder().
+    """
+
+    settings: Dict[str, Any] = {{}}
+    batch_size = BATCH_SIZE
+    cache_path = CACHE_PATH
+
+    def __init__(self, **kwargs: Any):
+        self._model = embedder_key(self.settings)
+        self._embed: Optional[Embed] = None
+        self._cache: Optional[EmbeddingCache] = None
+
+    def __call__(self, input: List[str]) -> List[List[float]]:
+        if self._cache is None:
+            self._cache = EmbeddingCache(self.cache_path)
+        vectors, _ = embed_with_cache(list(input), self._embed_uncached, self._cache, self._model, self.batch_size)
+        return vectors
+
+    def _embed_uncached(self, texts: List[str]) -> List[List[float]]:
+        if self._embed is None:
+            self._embed = build_embedding_function(self.settings)
+        return self._embed(texts)
+
+    @staticmethod
+    def name() -> str:
+        return "knowledge_index_cache"
+
+
+def cached_embedder(
+    config: Dict[str, Any], batch_size: int = BATCH_SIZE, cache_path: Path = CACHE_PATH
+) -> Dict[str, Any]:
+    """Wrap an embedder config so CrewAI's embedding calls go through the cache."""
+    embedding_callable = type(
+        "CachedEmbeddingFunction",
+        (CachedEmbeddingFunction,),
+        {{"__module__": __name__, "settings": config, "batch_size": batch_size, "cache_path": cache_path}},
+    )
+    return {{"provider": "custom", "config": {{"embedding_callable": embedding_callable}}}}
+
+
+def iter_chunks(pieces: Iterable[str], chunk_size: int = CHUNK_SIZE, overlap: int = CHUNK_OVERLAP) -> Iterator[str]:
+    """
+    Split streamed text into the windows CrewAI produces for the whole text.
+
+    Equivalent to [text[i:i + chunk_size] for i in range(0, len(text), step)]
+    with step = chunk_size - overlap, holding at most one piece in memory.
+    """
+    step = chunk_size - overlap
+    buffer, position = "", 0
+    for piece in pieces:
+        buffer = buffer[position:] + piece
+        position = 0
+        while len(buffer) - position >= chunk_size:
+            yield buffer[position:position + chunk_size]
+            position += step
+    tail = buffer[position:]
+    for start in range(0, len(tail), step):
+        yield tail[start:start + chunk_size]
+
+
+def stream_text(path: Path) -> Iterator[str]:
+    """Yield a UTF-8 text file in decoded pieces, read through a memory map."""
+    if path.stat().st_size == 0:
+        return
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder("utf-8")(), translate=True)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        for start in range(0, len(mapped), READ_SIZE):
+            yield decoder.decode(mapped[start:start + READ_SIZE])
+    yield decoder.decode(b"", final=True)
+
+
+def stream_csv(path: Path) -> Iterator[str]:
+    """Yield a CSV file one row at a time, as CrewAI renders rows ("a b c\\\\n")."""
+    if path.stat().st_size == 0:
+        return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        lines = (line.decode("utf-8") for line in iter(mapped.readline, b""))
+        for row in csv.reader(lines):
+            yield " ".join(row) + "\\n"
+
+
+def load_with_crewai(source_type: str, path: str) -> Iterator[str]:
+    """Yield the text CrewAI's loader extracts from a file (loaded whole)."""
+    module_name, class_name = CREWAI_LOADERS[source_type]
+    module = importlib.import_module(f"crewai.knowledge.source.{{module_name}}")
+    source = getattr(module, class_name)(file_paths=[path])
+    for text in source.content.values():
+        yield str(text)
+
+
+def iter_knowledge_chunks(files: Dict[str, List[str]] = KNOWLEDGE_FILES) -> Iterator[str]:
+    """Yield the chunks of every configured knowledge file."""
+    for source_type, paths in files.items():
+        for name in paths:
+            path = KNOWLEDGE_DIR / name
+            if source_type == "TextFile":
+                yield from iter_chunks(stream_text(path))
+            elif source_type == "CSV":
+                yield from iter_chunks(stream_csv(path))
+            elif source_type in CREWAI_LOADERS:
+                for text in load_with_crewai(source_type, name):
+                    yield from iter_chunks([text])
+            # Other types (Excel, Docling) are embedded on the first run and cached then
+
+
+def build_knowledge_index(
+    embedder: Optional[Dict[str, Any]] = None,
+    batch_size: int = BATCH_SIZE,
+    embed: Optional[Embed] = None,
+    files: Optional[Dict[str, List[str]]] = None,
+) -> Dict[str, int]:
+    """
+    Embed every knowledge chunk that is not cached yet.
+
+    Args:
+        embedder: Embedder config (default: EMBEDDER from crew.py)
+        batch_size: Chunks per embedding request
+        embed: Embedding function to use instead of the configured one
+        files: Knowledge files by source type (default: KNOWLEDGE_FILES)
+
+    Returns:
+        Counts of chunks seen, embedded and served from the cache
+    """
+    if embedder is None:
+        from {project_name}.crew import EMBEDDER
+
+        embedder = EMBEDDER
+    model = embedder_key(embedder)
+    embed = embed or build_embedding_function(embedder)
+    cache = EmbeddingCache()
+    stats = {{"chunks": 0, "embedded": 0, "cached": 0}}
+
+    def flush(window: List[str]) -> None:
+        _, embedded = embed_with_cache(window, embed, cache, model, batch_size)
+        stats["chunks"] += len(window)
+        stats["embedded"] += embedded
+        stats["cached"] += len(window) - embedded
+
+    # Bounded windows keep memory flat for large corpora
+    window: List[str] = []
+    try:
+        for chunk in iter_knowledge_chunks(KNOWLEDGE_FILES if files is None else files):
+            window.append(chunk)
+            if len(window) >= batch_size * 16:
+                flush(window)
+                window = []
+        if window:
+            flush(window)
+    finally:
+        cache.close()
+    return stats
+'''
+
+    return content
+
+
+def local_embedder_settings(embedder: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Flatten a local embedder configuration into the LOCAL_EMBEDDER settings.
+
+    Args:
+        embedder: Local embedder configuration ({"provider", "config", "local": True})
+
+    Returns:
+        Dictionary with "provider", "model", "batch_size" and optional "threads"/"url"
+    """
+    settings = {"provider": embedder["provider"], **embedder.get("config", {})}
+    if settings["provider"] == "ollama":
+        settings.setdefault("url", "http://localhost:11434")
+    return settings
+
+
+def generate_local_embedder_py(project_name: str, embedder: Dict[str, Any]) -> str:
+    """
+    Generate local_embedder.py: an embedding function that never leaves the machine.
+
+    Supports sentence-transformers and ONNX Runtime models loaded from disk
+    (with batch size and thread count applied), a local Ollama server, and a
+    dependency-free "hash" stub used by the smoke test.
+
+    Args:
+        project_name: Name of the project
+        embedder: Local embedder configuration ({"provider", "config", "local": True})
+
+    Returns:
+        String content for local_embedder.py
+    """
+    settings = local_embedder_settings(embedder)
+
+    content = f'''"""
+Local embeddings for the {project_name.replace("_", " ").title()} crew.
+
+Knowledge retrieval and memory embed text on this machine, with no network
+round-trips. The model is loaded on first use from a local directory; fetch
+it once, e.g.:
+
+    huggingface-cli download sentence-transformers/all-MiniLM-L6-v2 --local-dir models/all-MiniLM-L6-v2
+
+Providers:
+    sentence_transformer  A sentence-transformers model directory (or cached name)
+    onnx                  A directory with tokenizer.json and model.onnx (or onnx/model.onnx)
+    ollama                A model served by a local Ollama (http://localhost:11434)
+    hash                  Deterministic token-hashing stub for tests (no model)
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib import request
+
+from chromadb.api.types import EmbeddingFunction as ChromaEmbeddingFunction
+from crewai.rag.embeddings.providers.custom.embedding_callable import CustomEmbeddingFunction
+
+LOCAL_EMBEDDER = {settings!r}
+
+
+def hash_embedding(text: str, dimensions: int = 256) -> List[float]:
+    """Embed text by hashing its tokens into a fixed-size, normalized vector."""
+    vector = [0.0] * dimensions
+    for token in re.findall(r"\w+", text.lower()):
+        digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+        vector[int.from_bytes(digest[:4], "little") % dimensions] += 1.0 if digest[4] & 1 else -1.0
+    norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+    return [value / norm for value in vector]
+
+
+class LocalEmbeddingFunction(CustomEmbeddingFunction, ChromaEmbeddingFunction):
+    """
+    Embedding function for CrewAI that runs entirely on this machine.
+
+    CrewAI instantiates the class itself (with no arguments), so settings
+    that override LOCAL_EMBEDDER live on the subclasses made by local_embedder().
+    """
+
+    settings: Dict[str, Any] = LOCAL_EMBEDDER
+
+    def __init__(self, **kwargs: Any):
+        self._model: Any = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def name() -> str:
+        return "local"
+
+    def __call__(self, input: List[str]) -> List[List[float]]:
+        texts = list(input)
+        batch_size = max(1, int(self.settings.get("batch_size") or 32))
+        vectors: List[List[float]] = []
+        for start in range(0, len(texts), batch_size):
+            vectors.extend(self._embed_batch(texts[start:start + batch_size]))
+        return vectors
+
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        provider = self.settings["provider"]
+        if provider == "hash":
+            return [hash_embedding(text, int(self.settings.get("dimensions", 256))) for text in texts]
+        if provider == "ollama":
+            return self._embed_ollama(texts)
+        model = self._load()
+        if provider == "sentence_transformer":
+            return model.encode(texts, batch_size=len(texts), normalize_embeddings=True, show_progress_bar=False).tolist()
+        return self._embed_onnx(model, texts)
+
+    def _load(self) -> Any:
+        with self._lock:
+            if self._model is None:
+                provider = self.settings["provider"]
+                threads = self.settings.get("threads")
+                path = self.settings["model"]
+                if provider == "sentence_transformer":
+                    os.environ.setdefault("HF_HUB_OFFLINE", "1")
+                    import torch
+                    from sentence_transformers import SentenceTransformer
+
+                    if threads:
+                        torch.set_num_threads(int(threads))
+                    self._model = SentenceTransformer(path, device=self.settings.get("device", "cpu"))
+                elif provider == "onnx":
+                    import onnxruntime
+                    from tokenizers import Tokenizer
+
+                    options = onnxruntime.SessionOptions()
+                    if threads:
+                        options.intra_op_num_threads = int(threads)
+                    model_file = Path(path) / "model.onnx"
+                    if not model_file.exists():
+                        model_file = Path(path) / "onnx" / "model.onnx"
+                    session = onnxruntime.InferenceSession(
+                        str(model_file), options, providers=["CPUExecutionProvider"]
+                    )
+                    tokenizer = Tokenizer.from_file(str(Path(path) / "tokenizer.json"))
+                    tokenizer.enable_truncation(max_length=int(self.settings.get("max_length", 256)))
+                    tokenizer.enable_padding()
+                    self._model = (session, tokenizer)
+                else:
+                    raise ValueError(f"Unknown local embedder provider: {{provider}}")
+            return self._model
+
+    @staticmethod
+    def _embed_onnx(model: Any, texts: List[str]) -> List[List[float]]:
+        import numpy as np
+
+        session, tokenizer = model
+        encoded = tokenizer.encode_batch(texts)
+        mask = np.array([e.attention_mask for e in encoded], dtype=np.int64)
+        feeds = {{
+            "input_ids": np.array([e.ids for e in encoded], dtype=np.int64),
+            "attention_mask": mask,
+            "token_type_ids": np.zeros_like(mask),
+        }}
+        inputs = {{i.name for i in session.get_inputs()}}
+        output = session.run(None, {{k: v for k, v in feeds.items() if k in inputs}})[0]
+        # Mean pooling over real tokens, then L2 normalization
+        pooled = (output * mask[..., None]).sum(axis=1) / np.clip(mask.sum(axis=1)[..., None], 1e-9, None)
+        pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+        return pooled.tolist()
+
+    def _embed_ollama(self, texts: List[str]) -> List[List[float]]:
+        payload = {{"model": self.settings["model"], "input": texts}}
+        if self.settings.get("threads"):
+            payload["options"] = {{"num_thread": int(self.settings["threads"])}}
+        url = self.settings.get("url", "http://localhost:11434").rstrip("/") + "/api/embed"
+        req = request.Request(url, data=json.dumps(payload).encode("utf-8"), headers={{"Content-Type": "application/json"}})
+        with request.urlopen(req, timeout=120) as response:
+            return json.loads(response.read())["embeddings"]
+
+
+def local_embedder(settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Embedder config for Crew(embedder=...) that embeds locally, overriding LOCAL_EMBEDDER with settings."""
+    embedding_callable = LocalEmbeddingFunction
+    if settings:
+        embedding_callable = type(
+            "LocalEmbeddingFunction",
+            (LocalEmbeddingFunction,),
+            {{"__module__": __name__, "settings": {{**LOCAL_EMBEDDER, **settings}}}},
+        )
+    return {{"provider": "custom", "config": {{"embedding_callable": embedding_callable}}}}
+'''
+
+    return content
+
+
+def generate_local_embedder_test_py(project_name: str) -> str:
+    """
+    Generate tests/test_local_embeddings.py: an offline smoke test for local embeddings.
+
+    The test builds the embedder through CrewAI's embedder factory and
+    retrieves from a Knowledge store with the stub embedder while any
+    non-loopback socket connection fails; the configured model runs too when
+    LOCAL_EMBEDDER_SMOKE_MODEL is set.
+
+    Args:
+        project_name: Name of the project
+
+    Returns:
+        String content for the smoke test
+    """
+    content = f'''"""
+Smoke test: local embeddings for retrieval and memory, with no network.
+
+    python -m unittest discover tests
+    python -m pytest tests/test_local_embeddings.py
+
+The embedder config from local_embedder() goes through CrewAI's embedder
+factory and a Knowledge store, as in crew.py. The stub ("hash") embedder
+always runs and needs no model. Set LOCAL_EMBEDDER_SMOKE_MODEL=1 to also run
+the configured local model from local_embedder.py (it must already be on
+disk or served by local Ollama).
+"""
+
+import os
+import socket
+import sys
+import tempfile
+import unittest
+import uuid
+from pathlib import Path
+
+# Before CrewAI is imported: keep the test store out of the crew's and send no telemetry
+os.environ["CREWAI_STORAGE_DIR"] = tempfile.mkdtemp(prefix="local-embeddings-")
+os.environ.setdefault("ANONYMIZED_TELEMETRY", "False")
+os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from crewai.knowledge.knowledge import Knowledge  # noqa: E402
+from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource  # noqa: E402
+from crewai.rag.embeddings.factory import build_embedder  # noqa: E402
+
+from {project_name}.local_embedder import local_embedder  # noqa: E402
+
+DOCUMENTS = [
+    "Invoices are paid within thirty days of receipt.",
+    "The support team answers tickets from nine to five on weekdays.",
+    "Refunds for damaged goods are issued to the original payment method.",
+]
+QUERY = "When does the support team answer tickets?"
+LOOPBACK = {{"127.0.0.1", "::1", "localhost"}}
+
+
+class NetworkGuard:
+    """Fail any socket connection that leaves this machine."""
+
+    def __enter__(self):
+        self._connect = socket.socket.connect
+        real_connect = self._connect
+
+        def guarded(sock, address):
+            host = address[0] if isinstance(address, tuple) else address
+            if host not in LOOPBACK:
+                raise AssertionError(f"Network call to {{address}} during local embedding")
+            return real_connect(sock, address)
+
+        socket.socket.connect = guarded
+        return self
+
+    def __exit__(self, *exc):
+        socket.socket.connect = self._connect
+
+
+class LocalEmbeddingSmokeTest(unittest.TestCase):
+    def check_embedder(self, embedder):
+        with NetworkGuard():
+            embed = build_embedder(embedder)
+            first, second = embed(["hello world", "hello world"])
+            self.assertEqual(len(first), len(second))
+            self.assertAlmostEqual(float(sum(a * b for a, b in zip(first, second))), 1.0, places=3)
+
+            knowledge = Knowledge(
+                collection_name=f"smoke_{{uuid.uuid4().hex[:8]}}",
+                sources=[StringKnowledgeSource(content=document) for document in DOCUMENTS],
+                embedder=embedder,
+            )
+            knowledge.add_sources()
+            results = knowledge.query([QUERY], results_limit=1, score_threshold=0.0)
+            self.assertEqual(results[0]["content"], DOCUMENTS[1])
+
+    def test_stub_embedder(self):
+        self.check_embedder(local_embedder({{"provider": "hash", "batch_size": 2}}))
+
+    @unittest.skipUnless(os.environ.get("LOCAL_EMBEDDER_SMOKE_MODEL"), "set LOCAL_EMBEDDER_SMOKE_MODEL=1")
+    def test_configured_model(self):
+        self.check_embedder(local_embedder())
+
+
+if __name__ == "__main__":
+    unittest.main()
+'''
+
+    return content
+
+
+def generate_tracing_py(project_name: str) -> str:
+    """
+    Generate tracing.py: local JSONL tracing (an offline LangSmith alternative).
+
+    The module registers a CrewAI event listener that records crew, task,
+    tool and LLM spans (latency, tokens, retries, cache hits) to traces/, and
+    summarizes the slowest tasks and tools for `main.py trace_summary`.
+
+    Args:
+        project_name: Name of the project
+
+    Returns:
+        String content for tracing.py
+    """
+    content = f'''"""
+Local tracing for the {project_name.replace("_", " ").title()} crew: an offline alternative to LangSmith.
+
+Crew, task, tool and LLM events from CrewAI's event bus are written as JSONL
+spans to traces/trace-<timestamp>-<pid>.jsonl, one object per line:
+
+    {{"kind": "tool", "name": "SerperDevTool", "start": 1718000000.1, "duration": 0.82,
+     "status": "ok", "task": "research", "attempts": 1, "cache_hit": false}}
+
+LLM spans take their tokens from the usage CrewAI counts on the LLM instance
+(or the agent, for LiteLLM calls); task spans aggregate their LLM calls,
+tokens, tool calls, tool errors and tool cache hits, and crew spans carry the
+run's total tokens. Print crew totals and the slowest tasks and tools with:
+
+    python main.py trace_summary [trace_dir] [top_n]
+
+Set CREW_TRACE_DIR to change the directory, or CREW_TRACING=false to turn
+tracing off.
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+TRACE_DIR = Path(os.environ.get("CREW_TRACE_DIR", "traces"))
+
+try:  # CrewAI >= 1.0
+    from crewai.events import (
+        BaseEventListener,
+        CrewKickoffCompletedEvent,
+        CrewKickoffFailedEvent,
+        CrewKickoffStartedEvent,
+        LLMCallCompletedEvent,
+        LLMCallFailedEvent,
+        LLMCallStartedEvent,
+        TaskCompletedEvent,
+        TaskFailedEvent,
+        TaskStartedEvent,
+        ToolUsageErrorEvent,
+        ToolUsageFinishedEvent,
+    )
+
+    # The 1.x bus runs sync handlers on a thread pool, in no particular order;
+    # async handlers run on its event loop in the order events were emitted
+    ASYNC_HANDLERS = True
+except ImportError:  # CrewAI 0.x
+    from crewai.utilities.events import (
+        CrewKickoffCompletedEvent,
+        CrewKickoffFailedEvent,
+        CrewKickoffStartedEvent,
+        LLMCallCompletedEvent,
+        LLMCallFailedEvent,
+        LLMCallStartedEvent,
+        TaskCompletedEvent,
+        TaskFailedEvent,
+        TaskStartedEvent,
+        ToolUsageErrorEvent,
+        ToolUsageFinishedEvent,
+    )
+    from crewai.utilities.events.base_event_listener import BaseEventListener
+
+    ASYNC_HANDLERS = False
+
+
+class SpanWriter:
+    """Append spans to a JSONL file, safely from any thread."""
+
+    def __init__(self, directory: Path = TRACE_DIR):
+        directory.mkdir(parents=True, exist_ok=True)
+        self.path = directory / f"trace-{{time.strftime('%Y%m%dT%H%M%S')}}-{{os.getpid()}}.jsonl"
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def write(self, span: Dict[str, Any]) -> None:
+        line = json.dumps(span, ensure_ascii=False, default=str) + "\\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+
+def _task_name(task: Any) -> str:
+    name = getattr(task, "name", None) or getattr(task, "description", None) or "task"
+    return str(name).strip().splitlines()[0][:80]
+
+
+def _seconds(value: Any) -> Optional[float]:
+    return value.timestamp() if isinstance(value, datetime) else None
+
+
+def _event_time(event: Any) -> float:
+    # Handlers may run after the event (CrewAI 1.x dispatches on a pool), so prefer its timestamp
+    return _seconds(getattr(event, "timestamp", None)) or time.time()
+
+
+def _subscribe(bus: Any, event_type: Any, handler: Callable[[Any, Any], None]) -> Callable[[Any, Any], None]:
+    """Register a handler so that it sees events in the order they were emitted."""
+    if ASYNC_HANDLERS:
+        async def ordered(source: Any, event: Any) -> None:
+            handler(source, event)
+
+        ordered.__name__ = handler.__name__
+        bus.on(event_type)(ordered)
+    else:
+        bus.on(event_type)(handler)
+    return handler
+
+
+def _task_key(task: Any) -> tuple:
+    return ("task", str(getattr(task, "id", None) or id(task)))
+
+
+def _token_counters(llm: Any, agent: Any) -> Dict[tuple, int]:
+    """
+    Running token totals that an LLM call adds to.
+
+    LLM call events carry no usage: native providers count tokens on the LLM
+    instance (get_token_usage_summary) and LiteLLM calls on the agent
+    (_token_process), as Crew.calculate_usage_metrics reads them.
+    """
+    counters = {{}}
+    usage = getattr(llm, "get_token_usage_summary", None)
+    if callable(usage):
+        counters[("llm", id(llm))] = getattr(usage(), "total_tokens", 0) or 0
+    process = getattr(agent, "_token_process", None)
+    if process is not None:
+        counters[("agent", id(agent))] = getattr(process.get_summary(), "total_tokens", 0) or 0
+    return counters
+
+
+class LocalTraceListener(BaseEventListener):
+    """Turn CrewAI events into latency spans (see the module docstring)."""
+
+    def __init__(self, writer: SpanWriter):
+        self.writer = writer
+        self._open: Dict[Any, Dict[str, Any]] = {{}}
+        self._agents: Dict[str, Any] = {{}}
+        self._agent_tasks: Dict[str, Dict[str, Any]] = {{}}
+        self._tokens_seen: Dict[tuple, int] = {{}}
+        self._lock = threading.Lock()
+        super().__init__()
+
+    def _start(self, key: Any, event: Any, span: Dict[str, Any]) -> Dict[str, Any]:
+        span["start"] = _event_time(event)
+        with self._lock:
+            self._open[key] = span
+        return span
+
+    def _finish(self, key: Any, event: Any, status: str, **fields: Any) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            span = self._open.pop(key, None)
+        if span is None:
+            return None
+        span.update(fields, status=status, duration=round(_event_time(event) - span["start"], 4))
+        self.writer.write(span)
+        return span
+
+    def _tokens(self, llm: Any, event: Any) -> Optional[int]:
+        """Tokens used since the last completed call on the same LLM instance and agent."""
+        counters = _token_counters(llm, self._agents.get(str(getattr(event, "agent_id", None))))
+        if not counters:
+            return None
+        with self._lock:
+            deltas = [total - self._tokens_seen.get(key, 0) for key, total in counters.items()]
+            self._tokens_seen.update(counters)
+        return max(0, *deltas)
+
+    def _task_span(self, event: Any) -> Optional[Dict[str, Any]]:
+        """
+        Find the open task span an event belongs to: by task id, else the
+        open task of the event's agent. (Handlers do not run on the task's
+        thread, so the handler's thread says nothing about the task.)
+        """
+        task_id = getattr(event, "task_id", None)
+        span = self._open.get(("task", str(task_id))) if task_id else None
+        agent_id = getattr(event, "agent_id", None)
+        return span or (self._agent_tasks.get(str(agent_id)) if agent_id else None)
+
+    def setup_listeners(self, crewai_event_bus: Any) -> None:
+        def on(event_type: Any) -> Callable:
+            return lambda handler: _subscribe(crewai_event_bus, event_type, handler)
+
+        @on(CrewKickoffStartedEvent)
+        def on_crew_started(source: Any, event: Any) -> None:
+            name = getattr(event, "crew_name", None) or getattr(source, "name", None) or "crew"
+            self._start(("crew", id(source)), event, {{"kind": "crew", "name": name}})
+
+        @on(CrewKickoffCompletedEvent)
+        def on_crew_completed(source: Any, event: Any) -> None:
+            self._finish(("crew", id(source)), event, "ok", tokens=getattr(event, "total_tokens", None))
+
+        @on(CrewKickoffFailedEvent)
+        def on_crew_failed(source: Any, event: Any) -> None:
+            self._finish(("crew", id(source)), event, "error", error=str(getattr(event, "error", "")))
+
+        @on(TaskStartedEvent)
+        def on_task_started(source: Any, event: Any) -> None:
+            task = getattr(event, "task", None) or source
+            agent = getattr(task, "agent", None)
+            agent_id = str(getattr(agent, "id", id(agent)))
+            if agent is not None:
+                self._agents[agent_id] = agent
+            span = self._start(
+                _task_key(task),
+                event,
+                {{
+                    "kind": "task",
+                    "name": _task_name(task),
+                    "agent": getattr(agent, "role", None),
+                    "llm_calls": 0,
+                    "tokens": 0,
+                    "tool_calls": 0,
+                    "tool_errors": 0,
+                    "cache_hits": 0,
+                }},
+            )
+            if agent is not None:
+                with self._lock:
+                    self._agent_tasks[agent_id] = span
+
+        def finish_task(source: Any, event: Any, status: str, **fields: Any) -> None:
+            task = getattr(event, "task", None) or source
+            span = self._finish(_task_key(task), event, status, **fields)
+            agent = getattr(task, "agent", None)
+            agent_id = str(getattr(agent, "id", id(agent)))
+            with self._lock:
+                if span is not None and self._agent_tasks.get(agent_id) is span:
+                    del self._agent_tasks[agent_id]
+
+        @on(TaskCompletedEvent)
+        def on_task_completed(source: Any, event: Any) -> None:
+            finish_task(source, event, "ok")
+
+        @on(TaskFailedEvent)
+        def on_task_failed(source: Any, event: Any) -> None:
+            finish_task(source, event, "error", error=str(getattr(event, "error", "")))
+
+        def tool_span(event: Any, status: str, **fields: Any) -> None:
+            task = self._task_span(event)
+            started = _seconds(getattr(event, "started_at", None))
+            finished = _seconds(getattr(event, "finished_at", None)) or _event_time(event)
+            span = {{
+                "kind": "tool",
+                "name": getattr(event, "tool_name", "tool"),
+                "start": started or finished,
+                "duration": round(finished - started, 4) if started else None,
+                "status": status,
+                "task": task["name"] if task else None,
+                "agent": getattr(event, "agent_role", None),
+                "attempts": getattr(event, "run_attempts", None),
+                **fields,
+            }}
+            if task is not None:
+                task["tool_calls"] += 1
+                task["tool_errors"] += status == "error"
+                task["cache_hits"] += bool(fields.get("cache_hit"))
+            self.writer.write(span)
+
+        @on(ToolUsageFinishedEvent)
+        def on_tool_finished(source: Any, event: Any) -> None:
+            tool_span(event, "ok", cache_hit=bool(getattr(event, "from_cache", False)))
+
+        @on(ToolUsageErrorEvent)
+        def on_tool_error(source: Any, event: Any) -> None:
+            tool_span(event, "error", error=str(getattr(event, "error", "")))
+
+        def llm_key(source: Any, event: Any) -> tuple:
+            # The same on start and finish, even if the agent's task changes in between
+            return ("llm", id(source), str(getattr(event, "agent_id", None)))
+
+        @on(LLMCallStartedEvent)
+        def on_llm_started(source: Any, event: Any) -> None:
+            task = self._task_span(event)
+            model = getattr(event, "model", None) or getattr(source, "model", None) or "llm"
+            self._start(
+                llm_key(source, event),
+                event,
+                {{"kind": "llm", "name": str(model), "task": task["name"] if task else None}},
+            )
+
+        def finish_llm(source: Any, event: Any, status: str, **fields: Any) -> None:
+            task = self._task_span(event)
+            span = self._finish(llm_key(source, event), event, status, **fields)
+            if span is not None and task is not None:
+                task["llm_calls"] += 1
+                task["tokens"] += span.get("tokens") or 0
+
+        @on(LLMCallCompletedEvent)
+        def on_llm_completed(source: Any, event: Any) -> None:
+            finish_llm(source, event, "ok", tokens=self._tokens(source, event))
+
+        @on(LLMCallFailedEvent)
+        def on_llm_failed(source: Any, event: Any) -> None:
+            finish_llm(source, event, "error", error=str(getattr(event, "error", "")))
+
+
+_listener: Optional[LocalTraceListener] = None
+
+
+def enable_tracing() -> Optional[LocalTraceListener]:
+    """Start writing spans for this process (once; no-op when CREW_TRACING=false)."""
+    global _listener
+    if _listener is None and os.environ.get("CREW_TRACING", "true").lower() not in ("0", "false", "no"):
+        _listener = LocalTraceListener(SpanWriter())
+    return _listener
+
+
+def load_spans(directory: Path = TRACE_DIR) -> List[Dict[str, Any]]:
+    """Read every span from the trace files in a directory."""
+    spans = []
+    for path in sorted(Path(directory).glob("trace-*.jsonl")):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    spans.append(json.loads(line))
+                except ValueError:
+                    continue  # Torn last line from an interrupted run
+    return spans
+
+
+def summarize(spans: List[Dict[str, Any]], kind: str) -> List[Dict[str, Any]]:
+    """
+    Aggregate spans of one kind by name, slowest (by total time) first.
+
+    Returns:
+        One row per name with calls, total/mean/p95/max seconds, errors,
+        cache hits, tokens and extra attempts (retries)
+    """
+    groups: Dict[str, List[Dict[str, Any]]] = {{}}
+    for span in spans:
+        if span.get("kind") == kind:
+            groups.setdefault(span.get("name") or "?", []).append(span)
+
+    rows = []
+    for name, group in groups.items():
+        durations = sorted(span.get("duration") or 0.0 for span in group)
+        rows.append({{
+            "name": name,
+            "calls": len(group),
+            "total": sum(durations),
+            "mean": sum(durations) / len(durations),
+            "p95": durations[min(len(durations) - 1, int(0.95 * len(durations)))],
+            "max": durations[-1],
+            "errors": sum(span.get("status") == "error" for span in group),
+            "cache_hits": sum(span.get("cache_hits", int(bool(span.get("cache_hit")))) for span in group),
+            "tokens": sum(span.get("tokens") or 0 for span in group),
+            "retries": sum(max(0, (span.get("attempts") or 1) - 1) for span in group),
+        }})
+    return sorted(rows, key=lambda row: row["total"], reverse=True)
+
+
+def print_summary(directory: Path = TRACE_DIR, top: int = 10) -> None:
+    """Print crew run totals and the slowest tasks, tools and LLM models in a trace directory."""
+    spans = load_spans(directory)
+    if not spans:
+        print(f"No spans found in {{directory}}/")
+        return
+    header = f"{{'name':<40}} {{'calls':>6}} {{'total s':>9}} {{'mean s':>8}} {{'p95 s':>8}} {{'max s':>8}} {{'errors':>6}} {{'cached':>6}} {{'retries':>7}} {{'tokens':>9}}"
+    crews = [span for span in spans if span.get("kind") == "crew"]
+    if crews:
+        print(
+            f"Crew runs: {{len(crews)}} ({{sum(span.get('status') == 'error' for span in crews)}} failed), "
+            f"{{sum(span.get('duration') or 0.0 for span in crews):.2f}} s, "
+            f"{{sum(span.get('tokens') or 0 for span in crews)}} tokens"
+        )
+    for kind, title in (("crew", "crews"), ("task", "tasks"), ("tool", "tools"), ("llm", "LLM models")):
+        rows = summarize(spans, kind)[:top]
+        if not rows:
+            continue
+        print(f"\\nSlowest {{title}}")
+        print(header)
+        for row in rows:
+            print(
+                f"{{row['name'][:40]:<40}} {{row['calls']:>6}} {{row['total']:>9.2f}} {{row['mean']:>8.2f}} "
+                f"{{row['p95']:>8.2f}} {{row['max']:>8.2f}} {{row['errors']:>6}} {{row['cache_hits']:>6}} "
+                f"{{row['retries']:>7}} {{row['tokens']:>9}}"
+            )
+'''
+
+    return content
+
+
+def generate_tool_cache_py(project_name: str, tool_cache_ttls: Optional[Dict[str, int]] = None) -> str:
+    """
+    Generate tool_cache.py: a persistent (SQLite) cache for tool results.
+
+    The module replaces CrewAI's per-run in-memory tool cache with one that
+    survives across runs, keyed by tool name and normalized arguments, with
+    a TTL per tool and hit/miss counters for `main.py tool_cache_stats`.
+
+    Args:
+        project_name: Name of the project
+        tool_cache_ttls: Tool class name -> TTL in seconds (0 = never cache)
+
+    Returns:
+        String content for tool_cache.py
+    """
+    ttl_lines = "".join(f'\n    "{name}": {ttl},' for name, ttl in sorted((tool_cache_ttls or {}).items()))
+    ttls_code = f"{{{ttl_lines}\n}}" if ttl_lines else "{}"
+
+    content = f'''"""
+Persistent tool-result cache for the {project_name.replace("_", " ").title()} crew.
+
+CrewAI caches tool results in memory for one run. This module backs that
+cache with SQLite (.tool_cache/tools.sqlite3), so repeated runs and batch
+jobs skip duplicate search and scrape calls:
+
+- Entries are keyed by tool name and normalized arguments (JSON with sorted
+  keys and collapsed whitespace), so {{"q": "AI  news"}} and '{{"q":"AI news"}}'
+  hit the same entry.
+- Each tool has a TTL from its catalog category (TOOL_TTLS); 0 never caches
+  (tools with side effects, such as writers and code execution, and tools
+  that read local files or directories, whose contents change between runs).
+- Hits and misses per tool are counted across runs:
+
+    python main.py tool_cache_stats
+
+Agents with cache=False (or a crew with cache=False) bypass it as before.
+Set CREW_TOOL_CACHE to move the database.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from crewai.agents.cache import CacheHandler
+from pydantic import PrivateAttr
+
+TOOL_CACHE_PATH = Path(os.environ.get("CREW_TOOL_CACHE", ".tool_cache/tools.sqlite3"))
+
+# Seconds a result stays valid, by tool class (from the tool's catalog category)
+TOOL_TTLS = {ttls_code}
+DEFAULT_TTL = 3600
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {{str(k): _normalize(v) for k, v in value.items()}}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if isinstance(value, str):
+        return " ".join(value.split())
+    return value
+
+
+def normalize_args(args: Any) -> str:
+    """Canonical text for tool arguments given as a dict or as a (JSON) string."""
+    if isinstance(args, str):
+        try:
+            args = json.loads(args)
+        except ValueError:
+            pass
+    return json.dumps(_normalize(args), sort_keys=True, ensure_ascii=False, default=str)
+
+
+class ToolResultStore:
+    """Tool results in SQLite with per-tool TTLs and hit/miss counters."""
+
+    def __init__(self, path: Path = TOOL_CACHE_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.ttl_by_name: Dict[str, int] = {{}}
+        self._lock = threading.Lock()
+        # Several processes (main.py shard) may share the file
+        self._db = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results "
+            "(key TEXT PRIMARY KEY, tool TEXT NOT NULL, expires_at REAL NOT NULL, output TEXT NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS stats "
+            "(tool TEXT PRIMARY KEY, hits INTEGER NOT NULL DEFAULT 0, misses INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._db.execute("DELETE FROM results WHERE expires_at < ?", (time.time(),))
+        self._db.commit()
+
+    @staticmethod
+    def key(tool: str, args: Any) -> str:
+        return hashlib.sha256(f"{{tool}}\\0{{normalize_args(args)}}".encode("utf-8")).hexdigest()
+
+    def ttl(self, tool: str) -> int:
+        return self.ttl_by_name.get(tool, DEFAULT_TTL)
+
+    def get(self, tool: str, args: Any) -> Optional[str]:
+        """Return a cached, unexpired result (None on a miss) and count the lookup."""
+        if self.ttl(tool) <= 0:
+            return None
+        with self._lock:
+            row = self._db.execute(
+                "SELECT output FROM results WHERE key = ? AND expires_at >= ?", (self.key(tool, args), time.time())
+            ).fetchone()
+            hit = row is not None
+            self._db.execute(
+                "INSERT INTO stats (tool, hits, misses) VALUES (?, ?, ?) "
+                "ON CONFLICT(tool) DO UPDATE SET hits = hits + excluded.hits, misses = misses + excluded.misses",
+                (tool, int(hit), int(not hit)),
+            )
+            self._db.commit()
+        return row[0] if hit else None
+
+    def put(self, tool: str, args: Any, output: Any) -> None:
+        ttl = self.ttl(tool)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                (self.key(tool, args), tool, time.time() + ttl, str(output)),
+            )
+            self._db.commit()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hits, misses, hit rate and live entries per tool, across all runs."""
+        with self._lock:
+            entries = dict(
+                self._db.execute(
+                    "SELECT tool, COUNT(*) FROM results WHERE expires_at >= ? GROUP BY tool", (time.time(),)
+                ).fetchall()
+            )
+            rows = self._db.execute("SELECT tool, hits, misses FROM stats ORDER BY tool").fetchall()
+        return {{
+            tool: {{
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+                "entries": entries.get(tool, 0),
+            }}
+            for tool, hits, misses in rows
+        }}
+
+
+class PersistentToolCache(CacheHandler):
+    """CrewAI cache handler that reads and writes the ToolResultStore."""
+
+    _store: Any = PrivateAttr(default=None)
+
+    def __init__(self, store: ToolResultStore, **data: Any):
+        super().__init__(**data)
+        self._store = store
+
+    def add(self, tool: str, input: Any, output: Any) -> None:
+        self._store.put(tool, input, output)
+
+    def read(self, tool: str, input: Any) -> Optional[str]:
+        return self._store.get(tool, input)
+
+
+_store: Optional[ToolResultStore] = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> ToolResultStore:
+    """Get this process's store (opened on first use)."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ToolResultStore()
+        return _store
+
+
+def install_tool_cache(crew: Any) -> Any:
+    """
+    Back a crew's tool cache with the persistent store.
+
+    Args:
+        crew: Crew whose agents should use the store (unchanged if crew.cache is False)
+
+    Returns:
+        The same crew
+    """
+    if not getattr(crew, "cache", True):
+        return crew
+    store = get_store()
+    # CrewAI looks results up by the tool's display name; TTLs are set by tool class
+    for agent in crew.agents:
+        for tool in getattr(agent, "tools", None) or []:
+            store.ttl_by_name.setdefault(tool.name, TOOL_TTLS.get(type(tool).__name__, DEFAULT_TTL))
+    handler = PersistentToolCache(store)
+    crew._cache_handler = handler
+    for agent in crew.agents:
+        agent.set_cache_handler(handler)  # Skipped by agents with cache=False
+    return crew
+
+
+def print_stats() -> None:
+    """Print per-tool hit rates of the persistent cache."""
+    stats = get_store().stats()
+    if not stats:
+        print(f"No tool calls recorded in {{TOOL_CACHE_PATH}}")
+        return
+    print(f"{{'tool':<40}} {{'hits':>7}} {{'misses':>7}} {{'hit rate':>9}} {{'entries':>8}}")
+    for tool, row in stats.items():
+        print(f"{{tool[:40]:<40}} {{row['hits']:>7}} {{row['misses']:>7}} {{row['hit_rate']:>9.0%}} {{row['entries']:>8}}")
+    hits = sum(row["hits"] for row in stats.values())
+    total = hits + sum(row["misses"] for row in stats.values())
+    print(f"\\nOverall: {{hits}}/{{total}} lookups served from cache ({{hits / total if total else 0:.0%}})")
+'''
+
+    return content
+
+
+def generate_llm_cache_py(project_name: str) -> str:
+    """
+    Generate llm_cache.py: a local cache of LLM responses for fast re-runs.
+
+    The module wraps the call() method of every CrewAI LLM class so responses
+    are stored in SQLite, keyed by model, prompt and parameters, with record,
+    replay and passthrough modes and least-recently-used eviction.
+
+    Args:
+        project_name: Name of the project
+
+    Returns:
+        String content for llm_cache.py
+    """
+    content = f'''"""
+LLM response cache for the {project_name.replace("_", " ").title()} crew.
+
+Every LLM call made by the crew (agents, manager, planner, and the evaluator
+used by `main.py test`) is looked up in a local SQLite cache
+(.llm_cache/responses.sqlite3) keyed by model, prompt and sampling
+parameters. After a first run, `run`, `train`, `test` and `replay` return in
+seconds and give the same answers every time. Set CREW_LLM_CACHE to:
+
+- record (default): serve cached responses and record new ones
+- replay: serve cached responses only; a miss raises LLMCacheMiss, so tests
+  never reach a provider
+- passthrough: call the LLM every time, without reading or writing the cache
+
+The least recently used responses are evicted once the cache grows past
+CREW_LLM_CACHE_MAX_MB (default 256). Calls that execute functions
+(available_functions) are never cached. Clear the cache with:
+
+    python main.py llm_cache clear
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+try:  # CrewAI >= 0.105
+    from crewai.llms.base_llm import BaseLLM
+except ImportError:
+    from crewai import BaseLLM
+
+LLM_CACHE_PATH = Path(os.environ.get("CREW_LLM_CACHE_PATH", ".llm_cache/responses.sqlite3"))
+MODES = ("record", "replay", "passthrough")
+DEFAULT_MAX_MB = 256
+
+# LLM attributes that change the response, besides the prompt
+KEY_PARAMS = (
+    "model",
+    "temperature",
+    "top_p",
+    "n",
+    "max_tokens",
+    "max_completion_tokens",
+    "stop",
+    "seed",
+    "presence_penalty",
+    "frequency_penalty",
+    "logit_bias",
+    "response_format",
+    "reasoning_effort",
+)
+
+
+class LLMCacheMiss(LookupError):
+    """Raised in replay mode when a call has no recorded response."""
+
+
+def cache_key(llm: Any, messages: Any, tools: Any = None, response_model: Any = None) -> str:
+    """Hash the model, prompt and parameters of an LLM call."""
+    params = {{name: getattr(llm, name, None) for name in KEY_PARAMS}}
+    payload = {{
+        "params": {{name: value for name, value in params.items() if value not in (None, [], {{}})}},
+        "messages": messages,
+        "tools": tools,
+        "response_model": getattr(response_model, "__name__", None),
+    }}
+    text = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ResponseStore:
+    """LLM responses in SQLite, evicting the least recently used over a size budget."""
+
+    def __init__(self, path: Path = LLM_CACHE_PATH, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Several processes (main.py shard) may share the file
+        self._db = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, model TEXT, size INTEGER NOT NULL, "
+            "last_used REAL NOT NULL, hits INTEGER NOT NULL DEFAULT 0, response TEXT NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+        self._db.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self._db.execute(
+                    "UPDATE responses SET last_used = ?, hits = hits + 1 WHERE key = ?", (time.time(), key)
+                )
+                self._db.commit()
+        return row[0] if row else None
+
+    def put(self, key: str, model: str, response: str) -> None:
+        size = len(response.encode("utf-8"))
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, model, size, last_used, response) VALUES (?, ?, ?, ?, ?)",
+                (key, model, size, time.time(), response),
+            )
+            self._evict()
+            self._db.commit()
+
+    def _evict(self) -> None:
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Free down to 90% of the budget so eviction does not run on every put
+        excess = total - int(self.max_bytes * 0.9)
+        evicted = []
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY last_used"):
+            if excess <= 0:
+                break
+            evicted.append((key,))
+            excess -= size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+            self._db.execute("VACUUM")
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Responses, bytes and hits per model."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT model, COUNT(*), SUM(size), SUM(hits) FROM responses GROUP BY model ORDER BY model"
+            ).fetchall()
+        return [{{"model": model, "responses": count, "bytes": size, "hits": hits}} for model, count, size, hits in rows]
+
+
+_store: Optional[ResponseStore] = None
+_mode = "passthrough"
+_active = threading.local()
+
+
+def _cached_call(call: Callable) -> Callable:
+    """Wrap an LLM class's call() with cache lookups."""
+    signature = inspect.signature(call)
+
+    @functools.wraps(call)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        # Subclasses may call super().call(); only the outermost call is cached
+        if _mode == "passthrough" or getattr(_active, "depth", 0):
+            return call(self, *args, **kwargs)
+        arguments = signature.bind(self, *args, **kwargs).arguments
+        if arguments.get("available_functions"):
+            return call(self, *args, **kwargs)
+
+        key = cache_key(self, arguments.get("messages"), arguments.get("tools"), arguments.get("response_model"))
+        cached = _store.get(key)
+        if cached is not None:
+            return cached
+        if _mode == "replay":
+            raise LLMCacheMiss(
+                f"No recorded response for a {{getattr(self, 'model', 'LLM')}} call; run once with CREW_LLM_CACHE=record"
+            )
+
+        _active.depth = getattr(_active, "depth", 0) + 1
+        try:
+            response = call(self, *args, **kwargs)
+        finally:
+            _active.depth -= 1
+        if isinstance(response, str):
+            _store.put(key, str(getattr(self, "model", "")), response)
+        return response
+
+    wrapper.__llm_cache__ = True
+    return wrapper
+
+
+def _patch(cls: type) -> None:
+    call = cls.__dict__.get("call")
+    if call is not None and not getattr(call, "__llm_cache__", False) and not getattr(call, "__isabstractmethod__", False):
+        cls.call = _cached_call(call)
+
+
+def _all_subclasses(cls: type) -> List[type]:
+    subclasses = []
+    for subclass in cls.__subclasses__():
+        subclasses.append(subclass)
+        subclasses.extend(_all_subclasses(subclass))
+    return subclasses
+
+
+def enable_llm_cache(mode: Optional[str] = None) -> str:
+    """
+    Route every LLM call of this process through the response cache.
+
+    Args:
+        mode: "record", "replay" or "passthrough" (default: CREW_LLM_CACHE, else "record")
+
+    Returns:
+        The active mode
+    """
+    global _store, _mode
+    mode = (mode or os.environ.get("CREW_LLM_CACHE") or "record").lower()
+    if mode not in MODES:
+        raise ValueError(f"CREW_LLM_CACHE must be one of {{', '.join(MODES)}}, not {{mode!r}}")
+    _mode = mode
+    if mode == "passthrough" or getattr(BaseLLM, "__llm_cache__", False):
+        return mode
+
+    max_mb = float(os.environ.get("CREW_LLM_CACHE_MAX_MB", DEFAULT_MAX_MB))
+    _store = ResponseStore(max_bytes=int(max_mb * 1024 * 1024))
+    for cls in [BaseLLM, *_all_subclasses(BaseLLM)]:
+        _patch(cls)
+
+    # Provider classes are imported lazily (when an LLM is first created): patch them as they appear
+    init_subclass = BaseLLM.__dict__.get("__init_subclass__")
+
+    def patch_subclass(cls: type, **kwargs: Any) -> None:
+        if init_subclass is not None:
+            init_subclass.__func__(cls, **kwargs)
+        else:
+            super(BaseLLM, cls).__init_subclass__(**kwargs)
+        _patch(cls)
+
+    BaseLLM.__init_subclass__ = classmethod(patch_subclass)
+    BaseLLM.__llm_cache__ = True
+    return mode
+
+
+def get_store() -> ResponseStore:
+    """Get the response store (opened without patching any LLM when the cache is off)."""
+    return _store or ResponseStore()
+
+
+def print_stats() -> None:
+    """Print the cached responses per model."""
+    store = get_store()
+    rows = store.stats()
+    if not rows:
+        print(f"No responses cached in {{store.path}}")
+        return
+    print(f"{{'model':<40}} {{'responses':>9}} {{'MB':>8}} {{'hits':>7}}")
+    for row in rows:
+        print(f"{{row['model'][:40]:<40}} {{row['responses']:>9}} {{row['bytes'] / 1048576:>8.2f}} {{row['hits']:>7}}")
+    mode = _mode if _store else os.environ.get("CREW_LLM_CACHE", "record")
+    print(f"\\nMode: {{mode}} (CREW_LLM_CACHE), budget {{store.max_bytes / 1048576:.0f}} MB")
+'''
+
+    return content
 
 
 def generate_crew_py(
@@ -8,7 +1619,13 @@ def generate_crew_py(
     agents: List[Dict[str, Any]],
     tasks: List[Dict[str, Any]],
     crew_config: Dict[str, Any],
-    tools_by_agent: Dict[str, List[str]]
+    tools_by_agent: Dict[str, List[str]],
+    knowledge_sources: Optional[List[Dict[str, Any]]] = None,
+    embedder: Optional[Dict[str, Any]] = None,
+    tracing: bool = False,
+    tool_cache: bool = False,
+    llm_cache: bool = False,
+    lazy_tool_imports: bool = False,
 ) -> str:
     """
     Generate crew.py file content.
@@ -19,6 +1636,15 @@ def generate_crew_py(
         tasks: List of task configurations
         crew_config: Crew configuration dictionary
         tools_by_agent: Dictionary mapping agent roles to their tools
+        knowledge_sources: Knowledge source configurations ({"type", "config"})
+        embedder: Embedder configuration ({"provider", "config"}) for knowledge and memory;
+            with "local": True it is built by the generated local_embedder.py
+        tracing: Enable the generated local tracing module (tracing.py) on import
+        tool_cache: Back the crew's tool cache with the generated persistent
+            store (tool_cache.py)
+        llm_cache: Route LLM calls through the generated response cache (llm_cache.py)
+        lazy_tool_imports: Import tools inside the agent methods that use them instead
+            of at module level, so importing crew.py does not load crewai_tools
 
     Returns:
         String content for crew.py
@@ -32,7 +1658,7 @@ def generate_crew_py(
 
     # Generate tool imports
     tool_imports = []
-    if all_tools:
+    if all_tools and not lazy_tool_imports:
         tool_imports.append("from crewai_tools import (")
         for tool in sorted(all_tools):
             tool_imports.append(f"    {tool},")
@@ -44,14 +1670,24 @@ def generate_crew_py(
     agent_methods = []
     for agent in agents:
         agent_key = agent["role"].lower().replace(" ", "_")
+        agent_tools = tools_by_agent.get(agent["role"], [])
+
+        # In lazy mode each agent method imports its own tools
+        tool_import = ""
+        if agent_tools and lazy_tool_imports:
+            names = ", ".join(sorted(set(agent_tools)))
+            tool_import = f"        from crewai_tools import {names}\n\n"
+            if len(tool_import) > 100:
+                names = "".join(f"\n            {tool}," for tool in sorted(set(agent_tools)))
+                tool_import = f"        from crewai_tools import ({names}\n        )\n\n"
+
         agent_method = f'''    @agent
     def {agent_key}(self) -> Agent:
         """Create {agent['role']} agent."""
-        return Agent(
+{tool_import}        return Agent(
             config=self.agents_config['{agent_key}'],'''
 
         # Add tools if any
-        agent_tools = tools_by_agent.get(agent["role"], [])
         if agent_tools:
             agent_method += "\n            tools=["
             for tool in agent_tools:
@@ -94,12 +1730,57 @@ def generate_crew_py(
 
     tasks_code = "\n\n".join(task_methods)
 
+    knowledge_method = generate_knowledge_sources_method(knowledge_sources or [])
+    knowledge_code = f"\n\n{knowledge_method}" if knowledge_method else ""
+    if knowledge_method:
+        # Knowledge embeddings go through the on-disk cache built by knowledge_index.py;
+        # without a configured embedder, use CrewAI's default (OpenAI's default model)
+        if not embedder:
+            from utils.catalog import get_embedder_config
+
+            embedder = get_embedder_config("openai")
+        index_import = f"from {project_name}.knowledge_index import cached_embedder\n"
+        imports_section = f"{imports_section}\n{index_import}" if imports_section else index_import
+    if embedder and embedder.get("local"):
+        local_import = f"from {project_name}.local_embedder import local_embedder\n"
+        imports_section = f"{imports_section.rstrip()}\n{local_import}" if imports_section else local_import
+        embedder_code = (
+            "\n# Embedding model for knowledge and memory (runs locally, see local_embedder.py)"
+            "\nEMBEDDER = local_embedder()\n"
+        )
+    elif embedder:
+        embedder_code = f"\n# Embedding model for knowledge and memory\nEMBEDDER = {embedder!r}\n"
+    else:
+        embedder_code = ""
+
+    if tracing:
+        tracing_import = f"from {project_name}.tracing import enable_tracing\n"
+        imports_section = f"{imports_section.rstrip()}\n{tracing_import}" if imports_section else tracing_import
+        embedder_code = (
+            "\n# Local JSONL tracing (see tracing.py); set CREW_TRACING=false to turn it off"
+            "\nenable_tracing()\n" + embedder_code
+        )
+
+    if llm_cache:
+        llm_cache_import = f"from {project_name}.llm_cache import enable_llm_cache\n"
+        imports_section = f"{imports_section.rstrip()}\n{llm_cache_import}" if imports_section else llm_cache_import
+        embedder_code = (
+            "\n# Cached LLM responses (see llm_cache.py); set CREW_LLM_CACHE=passthrough to turn it off"
+            "\nenable_llm_cache()\n" + embedder_code
+        )
+
+    if tool_cache:
+        cache_import = f"from {project_name}.tool_cache import install_tool_cache"
+        imports_section = f"{imports_section.rstrip()}\n{cache_import}" if imports_section else cache_import
+
     # Generate crew method
     process = crew_config.get("process", "sequential")
+    # Tool results persist across runs when the tool cache is enabled (see tool_cache.py)
+    crew_call = "install_tool_cache(Crew(" if tool_cache else "Crew("
     crew_method = f'''    @crew
     def crew(self) -> Crew:
         """Create the {project_name} crew."""
-        return Crew(
+        return {crew_call}
             agents=self.agents,
             tasks=self.tasks,
             process=Process.{process},'''
@@ -114,8 +1795,13 @@ def generate_crew_py(
         crew_method += f"\n            max_rpm={crew_config['max_rpm']},"
     if crew_config.get("manager_llm"):
         crew_method += f"\n            manager_llm='{crew_config['manager_llm']}',"
+    if knowledge_method:
+        crew_method += "\n            knowledge_sources=self.build_knowledge_sources(),"
+        crew_method += "\n            embedder=cached_embedder(EMBEDDER),"
+    elif embedder:
+        crew_method += "\n            embedder=EMBEDDER,"
 
-    crew_method += "\n        )"
+    crew_method += "\n        ))" if tool_cache else "\n        )"
 
     # Combine everything
     content = f'''"""
@@ -125,7 +1811,7 @@ def generate_crew_py(
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 {imports_section}
-
+{embedder_code}
 
 @CrewBase
 class {class_name}Crew:
@@ -138,7 +1824,7 @@ class {class_name}Crew:
 
 {agents_code}
 
-{tasks_code}
+{tasks_code}{knowledge_code}
 
 {crew_method}
 '''
@@ -146,13 +1832,582 @@ class {class_name}Crew:
     return content
 
 
-def generate_main_py(project_name: str, input_variables: List[str]) -> str:
+def generate_batch_py(project_name: str) -> str:
+    """
+    Generate batch.py: run the crew over a JSONL or CSV file of inputs.
+
+    Inputs are streamed through a bounded queue to a fixed number of
+    concurrent kickoffs; results are appended to a JSONL file that doubles as
+    the checkpoint for resuming, and all crews share one max_rpm budget.
+
+    Args:
+        project_name: Name of the project
+
+    Returns:
+        String content for batch.py
+    """
+    class_name = "".join(word.capitalize() for word in project_name.split("_"))
+
+    content = f'''"""
+Batch runs for the {project_name.replace("_", " ").title()} crew.
+
+Streams inputs from a JSONL or CSV file through the crew with a bounded
+number of concurrent kickoffs and appends one JSON result per line:
+
+    python main.py batch inputs.jsonl results.jsonl [concurrency]
+
+The results file is the checkpoint: running the same command again skips
+inputs that already have an "ok" result and retries the rest. Results are
+written in completion order; each carries its input's 0-based "index" (the
+last line for an index wins). Concurrent crews share one request-per-minute
+controller, so max_rpm in crew.py caps the whole batch rather than each crew,
+and one tool cache, so a tool called with the same arguments for several
+inputs runs once.
+"""
+
+import asyncio
+import csv
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Set, Tuple, Union
+
+from {project_name}.crew import {class_name}Crew
+
+DEFAULT_CONCURRENCY = 4
+
+PathLike = Union[str, Path]
+
+
+def iter_inputs(path: PathLike) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield (index, inputs) for each record of a JSONL or CSV file, one at a time."""
+    path = Path(path)
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.suffix.lower() == ".csv":
+            records: Iterator[Dict[str, Any]] = csv.DictReader(f)
+        else:
+            records = (json.loads(line) for line in f if line.strip())
+        yield from enumerate(records)
+
+
+def completed_indices(path: PathLike) -> Set[int]:
+    """Get the input indices that already have an "ok" result in a results file."""
+    done: Set[int] = set()
+    path = Path(path)
+    if not path.exists():
+        return done
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # Torn last line from an interrupted run
+            if record.get("status") == "ok":
+                done.add(record["index"])
+    return done
+
+
+def result_record(index: int, inputs: Dict[str, Any], result: Any, seconds: float) -> Dict[str, Any]:
+    """Build the results-file line for a finished kickoff."""
+    usage = getattr(result, "token_usage", None)
+    return {{
+        "index": index,
+        "status": "ok",
+        "inputs": inputs,
+        "output": getattr(result, "raw", str(result)),
+        "seconds": round(seconds, 3),
+        "tokens": getattr(usage, "total_tokens", None),
+    }}
+
+
+def error_record(index: int, inputs: Dict[str, Any], error: BaseException) -> Dict[str, Any]:
+    """Build the results-file line for a failed kickoff."""
+    return {{"index": index, "status": "error", "inputs": inputs, "error": f"{{type(error).__name__}}: {{error}}"}}
+
+
+def share_rpm_limit(crew: Any, controller: Any) -> None:
+    """Route a crew's agents through a shared RPM controller."""
+    for agent in crew.agents:
+        agent._rpm_controller = controller
+
+
+def share_tool_cache(crew: Any, handler: Any) -> None:
+    """Point a crew's agents at a shared tool-result cache handler."""
+    crew._cache_handler = handler
+    for agent in crew.agents:
+        agent.set_cache_handler(handler)  # Skipped by agents with cache=False
+
+
+async def arun_batch(
+    inputs_path: PathLike,
+    output_path: PathLike,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> Dict[str, int]:
+    """
+    Run the crew over every input not yet completed in the results file.
+
+    Args:
+        inputs_path: JSONL file (one object per line) or CSV file (header row = input names)
+        output_path: Results JSONL file, appended to
+        concurrency: Maximum number of kickoffs in flight
+
+    Returns:
+        Counts of "ok", "error" and "skipped" (already completed) inputs
+    """
+    done = completed_indices(output_path)
+    base = {class_name}Crew().crew()
+    controller = getattr(base, "_rpm_controller", None) if getattr(base, "max_rpm", None) else None
+    cache_handler = getattr(base, "_cache_handler", None) if getattr(base, "cache", True) else None
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+    stats = {{"ok": 0, "error": 0, "skipped": 0}}
+
+    with open(output_path, "a", encoding="utf-8") as out:
+
+        def write(record: Dict[str, Any]) -> None:
+            out.write(json.dumps(record, ensure_ascii=False, default=str) + "\\n")
+            out.flush()
+            stats[record["status"]] += 1
+
+        async def worker() -> None:
+            while True:
+                item: Optional[Tuple[int, Dict[str, Any]]] = await queue.get()
+                if item is None:
+                    return
+                index, inputs = item
+                # Each kickoff gets its own copy: a Crew is not safe to run concurrently
+                crew = base.copy()
+                if cache_handler is not None:
+                    share_tool_cache(crew, cache_handler)
+                if controller is not None:
+                    share_rpm_limit(crew, controller)
+                started = time.perf_counter()
+                try:
+                    result = await crew.kickoff_async(inputs=inputs)
+                except Exception as e:
+                    write(error_record(index, inputs, e))
+                else:
+                    write(result_record(index, inputs, result, time.perf_counter() - started))
+
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        # The bounded queue keeps only a few inputs in memory at a time
+        for index, inputs in iter_inputs(inputs_path):
+            if index in done:
+                stats["skipped"] += 1
+                continue
+            await queue.put((index, inputs))
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+
+    if controller is not None and hasattr(controller, "stop_rpm_counter"):
+        controller.stop_rpm_counter()
+    return stats
+
+
+def run_batch(
+    inputs_path: PathLike,
+    output_path: PathLike,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> Dict[str, int]:
+    """Synchronous wrapper for arun_batch (sizes the kickoff thread pool to the concurrency)."""
+
+    async def main() -> Dict[str, int]:
+        # kickoff_async runs each kickoff in a thread; the default pool may be smaller
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=concurrency))
+        return await arun_batch(inputs_path, output_path, concurrency)
+
+    return asyncio.run(main())
+'''
+
+    return content
+
+
+def generate_shard_runner_py(project_name: str) -> str:
+    """
+    Generate shard_runner.py: run the crew over an inputs file across processes.
+
+    Each worker process builds the crew once and works through its shard of
+    the inputs, retrying failed items; shard checkpoints are merged into the
+    results file in input order. Reuses the input/result helpers of batch.py.
+
+    Args:
+        project_name: Name of the project
+
+    Returns:
+        String content for shard_runner.py
+    """
+    class_name = "".join(word.capitalize() for word in project_name.split("_"))
+
+    content = f'''"""
+Process-pool runs for the {project_name.replace("_", " ").title()} crew.
+
+For crews whose tools are CPU-heavy (PDF/CSV search, code execution) threads
+do not scale, so this runner shards an inputs file across processes:
+
+    python main.py shard inputs.jsonl results.jsonl [processes] [retries]
+
+Input i goes to shard i % processes. Each worker process builds the crew
+once and reuses it for every input in its shard, retrying failed inputs
+with backoff. Shards write their own checkpoint files
+(results.jsonl.shard-<n>); when all shards finish they are merged into
+results.jsonl in input order and removed. Running the command again resumes:
+inputs that already have an "ok" result are skipped. max_rpm in crew.py is
+split evenly across the processes; inputs within a shard share one tool cache.
+"""
+
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from {project_name}.batch import (
+    PathLike,
+    completed_indices,
+    error_record,
+    iter_inputs,
+    result_record,
+    share_rpm_limit,
+    share_tool_cache,
+)
+
+DEFAULT_RETRIES = 2
+MAX_BACKOFF_SECONDS = 30.0
+
+
+def shard_path(output_path: PathLike, shard: int) -> Path:
+    """Get the checkpoint file of one shard."""
+    return Path(f"{{output_path}}.shard-{{shard}}")
+
+
+def shard_paths(output_path: PathLike) -> List[Path]:
+    """Get the existing shard checkpoint files of a results file, in shard order."""
+    output_path = Path(output_path)
+    paths = output_path.parent.glob(f"{{output_path.name}}.shard-*")
+    return sorted(paths, key=lambda path: int(path.name.rsplit("-", 1)[1]))
+
+
+def run_shard(
+    inputs_path: PathLike,
+    output_path: PathLike,
+    shard: int,
+    processes: int,
+    done: Set[int],
+    retries: int = DEFAULT_RETRIES,
+) -> Dict[str, int]:
+    """
+    Run one shard in a worker process.
+
+    Args:
+        inputs_path: JSONL or CSV inputs file
+        output_path: Final results file (the shard writes to shard_path())
+        shard: Shard number (handles inputs with index % processes == shard)
+        processes: Number of shards
+        done: Input indices that already have an "ok" result
+        retries: Extra attempts per failed input
+
+    Returns:
+        Counts of "ok" and "error" inputs in this shard
+    """
+    from {project_name}.crew import {class_name}Crew
+
+    # Built once per worker; each input runs on a cheap copy
+    base = {class_name}Crew().crew()
+    controller = getattr(base, "_rpm_controller", None) if getattr(base, "max_rpm", None) else None
+    if controller is not None:
+        controller.max_rpm = max(1, base.max_rpm // processes)
+    cache_handler = getattr(base, "_cache_handler", None) if getattr(base, "cache", True) else None
+
+    stats = {{"ok": 0, "error": 0}}
+    with open(shard_path(output_path, shard), "a", encoding="utf-8") as out:
+        for index, inputs in iter_inputs(inputs_path):
+            if index % processes != shard or index in done:
+                continue
+            for attempt in range(retries + 1):
+                crew = base.copy()
+                if cache_handler is not None:
+                    share_tool_cache(crew, cache_handler)
+                if controller is not None:
+                    share_rpm_limit(crew, controller)
+                started = time.perf_counter()
+                try:
+                    result = crew.kickoff(inputs=inputs)
+                except Exception as e:
+                    record = error_record(index, inputs, e)
+                    if attempt < retries:
+                        time.sleep(min(MAX_BACKOFF_SECONDS, 2.0 ** attempt))
+                        continue
+                else:
+                    record = result_record(index, inputs, result, time.perf_counter() - started)
+                break
+            record["attempts"] = attempt + 1
+            out.write(json.dumps(record, ensure_ascii=False, default=str) + "\\n")
+            out.flush()
+            stats[record["status"]] += 1
+
+    if controller is not None and hasattr(controller, "stop_rpm_counter"):
+        controller.stop_rpm_counter()
+    return stats
+
+
+def merge_results(output_path: PathLike) -> int:
+    """
+    Merge shard checkpoint files into the results file, in input order.
+
+    For each input the last "ok" record wins, otherwise the last error. Only
+    line offsets are kept in memory; records are copied from disk.
+
+    Returns:
+        Number of records in the merged results file
+    """
+    output_path = Path(output_path)
+    sources = ([output_path] if output_path.exists() else []) + shard_paths(output_path)
+    best: Dict[int, Tuple[bool, int, int]] = {{}}  # index -> (ok, source, offset)
+    for source, path in enumerate(sources):
+        with open(path, "rb") as f:
+            offset = 0
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None  # Torn last line from an interrupted run
+                if record is not None:
+                    ok = record.get("status") == "ok"
+                    if ok or not best.get(record["index"], (False,))[0]:
+                        best[record["index"]] = (ok, source, offset)
+                offset += len(line)
+
+    temp_path = output_path.with_name(output_path.name + ".merging")
+    handles = [open(path, "rb") for path in sources]
+    try:
+        with open(temp_path, "wb") as out:
+            for index in sorted(best):
+                _, source, offset = best[index]
+                handles[source].seek(offset)
+                out.write(handles[source].readline())
+    finally:
+        for handle in handles:
+            handle.close()
+    os.replace(temp_path, output_path)
+    for path in shard_paths(output_path):
+        path.unlink()
+    return len(best)
+
+
+def run_sharded(
+    inputs_path: PathLike,
+    output_path: PathLike,
+    processes: Optional[int] = None,
+    retries: int = DEFAULT_RETRIES,
+) -> Dict[str, int]:
+    """
+    Run the crew over an inputs file with one worker process per shard.
+
+    Args:
+        inputs_path: JSONL file (one object per line) or CSV file (header row = input names)
+        output_path: Results JSONL file (merged in input order)
+        processes: Worker processes (default: CPU count)
+        retries: Extra attempts per failed input
+
+    Returns:
+        Counts of "ok", "error" and "skipped" (already completed) inputs
+    """
+    processes = processes or os.cpu_count() or 1
+    done = completed_indices(output_path)
+    for path in shard_paths(output_path):
+        done |= completed_indices(path)
+
+    stats = {{"ok": 0, "error": 0, "skipped": sum(1 for index, _ in iter_inputs(inputs_path) if index in done)}}
+    # Spawned workers do not inherit the parent's threads or open clients
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=processes, mp_context=context) as pool:
+        futures = [
+            pool.submit(run_shard, str(inputs_path), str(output_path), shard, processes, done, retries)
+            for shard in range(processes)
+        ]
+        for future in futures:
+            for key, count in future.result().items():
+                stats[key] += count
+
+    merge_results(output_path)
+    return stats
+'''
+
+    return content
+
+
+def generate_startup_benchmark_py(project_name: str) -> str:
+    """
+    Generate startup_benchmark.py: time how long a cold process takes to build the crew.
+
+    Each run builds the crew in a fresh interpreter and times importing
+    crew.py, instantiating the crew class and calling .crew(), and lists the
+    slowest imports reported by `python -X importtime`.
+
+    Args:
+        project_name: Name of the project
+
+    Returns:
+        String content for startup_benchmark.py
+    """
+    class_name = "".join(word.capitalize() for word in project_name.split("_"))
+
+    content = f'''"""
+Startup benchmark for the {project_name.replace("_", " ").title()} crew.
+
+Measures how long a cold process takes to get a crew ready to kick off, in
+fresh interpreters, split into phases:
+
+- import: `from {project_name}.crew import {class_name}Crew` (CrewAI, plus every tool
+  when crew.py imports them at module level)
+- init: {class_name}Crew() (loads the agent and task YAML)
+- crew: .crew() (builds the agents with their LLMs and tools, and the tasks)
+
+It also lists the slowest imports of the whole startup (from
+`python -X importtime`) and whether crewai_tools was already loaded after the
+import phase. No LLM or tool is called.
+
+    python main.py startup_benchmark [runs]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+DEFAULT_RUNS = 5
+SRC_DIR = Path(__file__).resolve().parent.parent
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+from {project_name}.crew import {class_name}Crew
+imported = time.perf_counter()
+tools_on_import = "crewai_tools" in sys.modules
+project = {class_name}Crew()
+initialized = time.perf_counter()
+crew = project.crew()
+built = time.perf_counter()
+print(json.dumps({{
+    "import": imported - started,
+    "init": initialized - imported,
+    "crew": built - initialized,
+    "total": built - started,
+    "tools_on_import": tools_on_import,
+    "agents": len(crew.agents),
+}}))
+"""
+
+
+def run_probe() -> Dict[str, Any]:
+    """
+    Build the crew once in a fresh interpreter.
+
+    Returns:
+        Phase timings in seconds, "tools_on_import", "agents", and the
+        "imports" timed by -X importtime (module -> self seconds)
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(SRC_DIR), os.environ.get("PYTHONPATH")])))
+    # Agents build their LLM clients at construction; no request is sent, but some providers need a key
+    env.setdefault("OPENAI_API_KEY", "sk-startup-benchmark")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Building the crew failed:\\n{{result.stderr[-2000:]}}")
+
+    imports: Dict[str, float] = {{}}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|", 2)
+        imports[name.strip()] = int(self_us) / 1e6
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    timings["imports"] = imports
+    return timings
+
+
+def run_benchmark(runs: int = DEFAULT_RUNS) -> Dict[str, Any]:
+    """
+    Build the crew in `runs` fresh interpreters and aggregate the timings.
+
+    Returns:
+        Dictionary with per-phase median/min/max seconds ("phases"),
+        "tools_on_import", "agents" and the mean self time of each import
+    """
+    probes: List[Dict[str, Any]] = [run_probe() for _ in range(runs)]
+    phases = {{
+        phase: {{
+            "median": statistics.median(probe[phase] for probe in probes),
+            "min": min(probe[phase] for probe in probes),
+            "max": max(probe[phase] for probe in probes),
+        }}
+        for phase in ("import", "init", "crew", "total")
+    }}
+    imports: Dict[str, float] = {{}}
+    for probe in probes:
+        for name, seconds in probe["imports"].items():
+            imports[name] = imports.get(name, 0.0) + seconds / len(probes)
+    return {{
+        "runs": runs,
+        "phases": phases,
+        "tools_on_import": probes[-1]["tools_on_import"],
+        "agents": probes[-1]["agents"],
+        "imports": imports,
+    }}
+
+
+def print_report(report: Dict[str, Any], top: int = 10) -> None:
+    """Print phase timings and the slowest imports."""
+    print(f"Crew startup over {{report['runs']}} fresh interpreter(s), {{report['agents']}} agent(s)\\n")
+    print(f"{{'phase':<8}} {{'median s':>9}} {{'min s':>8}} {{'max s':>8}}")
+    for phase, row in report["phases"].items():
+        print(f"{{phase:<8}} {{row['median']:>9.3f}} {{row['min']:>8.3f}} {{row['max']:>8.3f}}")
+    loaded = "yes" if report["tools_on_import"] else "no (imported when agents are built)"
+    print(f"\\ncrewai_tools loaded by importing crew.py: {{loaded}}")
+
+    print("\\nSlowest imports (self time)")
+    slowest = sorted(report["imports"].items(), key=lambda item: item[1], reverse=True)[:top]
+    for name, seconds in slowest:
+        print(f"  {{seconds:>7.3f}} s  {{name}}")
+
+
+if __name__ == "__main__":
+    print_report(run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RUNS))
+'''
+
+    return content
+
+
+def generate_main_py(
+    project_name: str,
+    input_variables: List[str],
+    knowledge_index: bool = False,
+    tracing: bool = False,
+    tool_cache: bool = False,
+    llm_cache: bool = False,
+) -> str:
     """
     Generate main.py file content.
 
     Args:
         project_name: Name of the project
         input_variables: List of input variable names used in descriptions
+        knowledge_index: Include the build_knowledge_index command
+        tracing: Include the trace_summary command
+        tool_cache: Include the tool_cache_stats command
+        llm_cache: Include the llm_cache command
 
     Returns:
         String content for main.py
@@ -169,6 +2424,96 @@ def generate_main_py(project_name: str, input_variables: List[str]) -> str:
         inputs_code += f"        '{var}': 'your_{var}_here',\n"
     inputs_code += "    }"
 
+    commands = ["train", "replay", "test", "batch", "shard", "startup_benchmark"]
+    knowledge_index_code = ""
+    if knowledge_index:
+        commands.append("build_knowledge_index")
+        knowledge_index_code = f'''
+
+def build_knowledge_index():
+    """
+    Pre-compute knowledge embeddings so the crew starts without re-embedding.
+
+    Only new or changed chunks are embedded; the rest come from .knowledge_cache/.
+
+    Usage:
+        python main.py build_knowledge_index [batch_size]
+    """
+    from {project_name}.knowledge_index import build_knowledge_index as build_index
+
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    stats = build_index(batch_size=batch_size)
+    print(
+        f"Indexed {{stats['chunks']}} chunks: "
+        f"{{stats['embedded']}} embedded, {{stats['cached']}} from cache"
+    )
+'''
+
+    tracing_code = ""
+    if tracing:
+        commands.append("trace_summary")
+        tracing_code = f'''
+
+def trace_summary():
+    """
+    Print the slowest tasks and tools recorded by local tracing.
+
+    Usage:
+        python main.py trace_summary [trace_dir] [top_n]
+    """
+    from pathlib import Path
+
+    from {project_name}.tracing import TRACE_DIR, print_summary
+
+    directory = Path(sys.argv[2]) if len(sys.argv) > 2 else TRACE_DIR
+    top = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+    print_summary(directory, top)
+'''
+
+    tool_cache_code = ""
+    if tool_cache:
+        commands.append("tool_cache_stats")
+        tool_cache_code = f'''
+
+def tool_cache_stats():
+    """
+    Print hit rates of the persistent tool cache across all runs.
+
+    Usage:
+        python main.py tool_cache_stats
+    """
+    from {project_name}.tool_cache import print_stats
+
+    print_stats()
+'''
+
+    llm_cache_code = ""
+    if llm_cache:
+        commands.append("llm_cache")
+        llm_cache_code = f'''
+
+def llm_cache():
+    """
+    Show or clear the cached LLM responses.
+
+    Usage:
+        python main.py llm_cache [stats|clear]
+    """
+    from {project_name}.llm_cache import get_store, print_stats
+
+    action = sys.argv[2] if len(sys.argv) > 2 else "stats"
+    if action == "clear":
+        get_store().clear()
+        print("LLM response cache cleared")
+    else:
+        print_stats()
+'''
+
+    dispatch_code = "".join(
+        f"\n        {'if' if i == 0 else 'elif'} command == \"{command}\":\n            {command}()"
+        for i, command in enumerate(commands)
+    )
+
     content = f'''#!/usr/bin/env python
 """
 Main entry point for the {project_name.replace("_", " ").title()} crew.
@@ -262,18 +2607,72 @@ def test():
         raise
 
 
+def batch():
+    """
+    Run the crew over every record of a JSONL or CSV inputs file.
+
+    Results are appended to the results file, which is also the checkpoint:
+    running the command again skips records that already succeeded.
+
+    Usage:
+        python main.py batch <inputs.jsonl|inputs.csv> <results.jsonl> [concurrency]
+    """
+    if len(sys.argv) < 4:
+        print("Usage: python main.py batch <inputs.jsonl|inputs.csv> <results.jsonl> [concurrency]")
+        sys.exit(1)
+
+    from {project_name}.batch import DEFAULT_CONCURRENCY, run_batch
+
+    concurrency = int(sys.argv[4]) if len(sys.argv) > 4 else DEFAULT_CONCURRENCY
+    stats = run_batch(sys.argv[2], sys.argv[3], concurrency)
+    print(f"Batch finished: {{stats['ok']}} ok, {{stats['error']}} failed, {{stats['skipped']}} already done")
+    if stats["error"]:
+        print("Re-run the same command to retry the failed inputs")
+
+
+def shard():
+    """
+    Run the crew over a JSONL or CSV inputs file with a pool of worker processes.
+
+    Use this instead of batch when tools are CPU-bound. Each process builds
+    the crew once; results are merged into the results file in input order.
+
+    Usage:
+        python main.py shard <inputs.jsonl|inputs.csv> <results.jsonl> [processes] [retries]
+    """
+    if len(sys.argv) < 4:
+        print("Usage: python main.py shard <inputs.jsonl|inputs.csv> <results.jsonl> [processes] [retries]")
+        sys.exit(1)
+
+    from {project_name}.shard_runner import DEFAULT_RETRIES, run_sharded
+
+    processes = int(sys.argv[4]) if len(sys.argv) > 4 else None
+    retries = int(sys.argv[5]) if len(sys.argv) > 5 else DEFAULT_RETRIES
+    stats = run_sharded(sys.argv[2], sys.argv[3], processes, retries)
+    print(f"Sharded run finished: {{stats['ok']}} ok, {{stats['error']}} failed, {{stats['skipped']}} already done")
+    if stats["error"]:
+        print("Re-run the same command to retry the failed inputs")
+
+
+def startup_benchmark():
+    """
+    Time how long a cold process takes to build the crew (import, init, .crew()).
+
+    Usage:
+        python main.py startup_benchmark [runs]
+    """
+    from {project_name}.startup_benchmark import DEFAULT_RUNS, print_report, run_benchmark
+
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_RUNS
+    print_report(run_benchmark(runs))
+{knowledge_index_code}{tracing_code}{tool_cache_code}{llm_cache_code}
+
 if __name__ == "__main__":
     if len(sys.argv) > 1:
-        command = sys.argv[1].lower()
-        if command == "train":
-            train()
-        elif command == "replay":
-            replay()
-        elif command == "test":
-            test()
+        command = sys.argv[1].lower(){dispatch_code}
         else:
             print(f"Unknown command: {{command}}")
-            print("Available commands: train, replay, test")
+            print("Available commands: {', '.join(commands)}")
             sys.exit(1)
     else:
         run()
@@ -1,7 +1,7 @@
 """YAML generation for CrewAI configuration files."""
 
 import yaml
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 
 def generate_agents_yaml(agents: List[Dict[str, Any]]) -> str:
@@ -109,7 +109,14 @@ def generate_tasks_yaml(tasks: List[Dict[str, Any]]) -> str:
     return yaml_content
 
 
-def generate_env_file(env_vars: Dict[str, str], enable_langsmith: bool = False, langsmith_project: str = "my-crew-project") -> str:
+def generate_env_file(
+    env_vars: Dict[str, str],
+    enable_langsmith: bool = False,
+    langsmith_project: str = "my-crew-project",
+    enable_local_tracing: bool = False,
+    enable_tool_cache: bool = False,
+    enable_llm_cache: bool = False,
+) -> str:
     """
     Generate .env file content.
 
@@ -117,6 +124,9 @@ def generate_env_file(env_vars: Dict[str, str], enable_langsmith: bool = False,
         env_vars: Dictionary of environment variable names and their placeholder values
         enable_langsmith: Whether to include LangSmith configuration
         langsmith_project: LangSmith project name
+        enable_local_tracing: Whether to include local tracing settings
+        enable_tool_cache: Whether to include persistent tool cache settings
+        enable_llm_cache: Whether to include LLM response cache settings
 
     Returns:
         String content for .env file
@@ -153,10 +163,39 @@ def generate_env_file(env_vars: Dict[str, str], enable_langsmith: bool = False,
             ""
         ])
 
+    if enable_local_tracing:
+        lines.extend([
+            "# Local Tracing (JSONL spans, summarize with: python main.py trace_summary)",
+            "CREW_TRACING=true",
+            "CREW_TRACE_DIR=traces",
+            ""
+        ])
+
+    if enable_tool_cache:
+        lines.extend([
+            "# Persistent Tool Cache (hit rates: python main.py tool_cache_stats)",
+            "CREW_TOOL_CACHE=.tool_cache/tools.sqlite3",
+            ""
+        ])
+
+    if enable_llm_cache:
+        lines.extend([
+            "# LLM Response Cache (record, replay or passthrough)",
+            "CREW_LLM_CACHE=record",
+            "CREW_LLM_CACHE_MAX_MB=256",
+            ""
+        ])
+
     return "\n".join(lines)
 
 
-def generate_pyproject_toml(project_name: str, python_version: str = "3.10", enable_langsmith: bool = False) -> str:
+def generate_pyproject_toml(
+    project_name: str,
+    python_version: str = "3.10",
+    enable_langsmith: bool = False,
+    uses_docling: bool = False,
+    extra_dependencies: Optional[Dict[str, str]] = None,
+) -> str:
     """
     Generate pyproject.toml for the project.
 
@@ -164,19 +203,26 @@ def generate_pyproject_toml(project_name: str, python_version: str = "3.10", ena
         project_name: Name of the project
         python_version: Minimum Python version
         enable_langsmith: Whether to include LangSmith dependency
+        uses_docling: Whether a Docling knowledge source needs the docling extra
+        extra_dependencies: Additional packages (name -> version constraint), e.g. for a local embedder
 
     Returns:
         String content for pyproject.toml
     """
+    extras = '"tools", "docling"' if uses_docling else '"tools"'
+
     # Base dependencies
     dependencies = f'''python = "^{python_version}"
-crewai = {{version = "^1.3.0", extras = ["tools"]}}
+crewai = {{version = "^1.3.0", extras = [{extras}]}}
 crewai-tools = "^1.3.0"'''
 
     # Add langsmith if enabled
     if enable_langsmith:
         dependencies += '\nlangsmith = "^0.1.0"'
 
+    for package, version in (extra_dependencies or {}).items():
+        dependencies += f'\n{package} = "{version}"'
+
     toml_content = f'''[tool.poetry]
 name = "{project_name}"
 version = "0.1.0"
@@ -193,7 +239,15 @@ build-backend = "poetry.core.masonry.api"
     return toml_content
 
 
-def generate_readme(project_name: str, description: str, enable_langsmith: bool = False) -> str:
+def generate_readme(
+    project_name: str,
+    description: str,
+    enable_langsmith: bool = False,
+    enable_local_tracing: bool = False,
+    enable_tool_cache: bool = False,
+    enable_llm_cache: bool = False,
+    enable_knowledge_index: bool = False,
+) -> str:
     """
     Generate README.md for the project.
 
@@ -201,6 +255,10 @@ def generate_readme(project_name: str, description: str, enable_langsmith: bool
         project_name: Name of the project
         description: Project description
         enable_langsmith: Whether to include LangSmith setup instructions
+        enable_local_tracing: Whether to include local tracing instructions
+        enable_tool_cache: Whether to include persistent tool cache instructions
+        enable_llm_cache: Whether to include LLM response cache instructions
+        enable_knowledge_index: Whether to include knowledge index instructions
 
     Returns:
         String content for README.md
@@ -227,6 +285,89 @@ This project includes LangSmith tracing for debugging and monitoring your AI age
 
 '''
 
+    # Local tracing section (if enabled)
+    tracing_section = ""
+    if enable_local_tracing:
+        tracing_section = f'''
+## Local Tracing
+
+Every run writes crew, task, tool and LLM spans (latency, tokens, retries,
+tool cache hits) as JSONL to `traces/`, with no external service. Print the
+slowest tasks and tools:
+
+```bash
+uv run python -m {project_name}.main trace_summary
+```
+
+Set `CREW_TRACING=false` in `.env` to turn tracing off.
+
+'''
+
+    # Persistent tool cache section (if enabled)
+    tool_cache_section = ""
+    if enable_tool_cache:
+        tool_cache_section = f'''
+## Tool Cache
+
+Tool results are kept in `.tool_cache/tools.sqlite3`, keyed by tool name and
+normalized arguments, so repeated runs and batch jobs skip duplicate search
+and scrape calls. Each tool's TTL comes from its category (`TOOL_TTLS` in
+`tool_cache.py`); tools with side effects are never cached. Show hit rates:
+
+```bash
+uv run python -m {project_name}.main tool_cache_stats
+```
+
+Delete `.tool_cache/` to start fresh.
+
+'''
+
+    # LLM response cache section (if enabled)
+    llm_cache_section = ""
+    if enable_llm_cache:
+        llm_cache_section = f'''
+## LLM Response Cache
+
+LLM responses are kept in `.llm_cache/`, keyed by model, prompt and
+parameters, so after a first run `run`, `train`, `test` and `replay` are
+near-instant and deterministic. Set `CREW_LLM_CACHE` in `.env`:
+
+- `record` (default): reuse cached responses and record new ones
+- `replay`: only use cached responses; an unrecorded call fails instead of reaching the provider
+- `passthrough`: always call the LLM
+
+The least recently used responses are evicted above `CREW_LLM_CACHE_MAX_MB`.
+
+```bash
+uv run python -m {project_name}.main llm_cache          # responses per model
+uv run python -m {project_name}.main llm_cache clear
+```
+
+'''
+
+    # Knowledge index section (if the crew has knowledge sources)
+    knowledge_index_section = ""
+    knowledge_index_structure = ""
+    if enable_knowledge_index:
+        knowledge_index_section = f'''
+## Knowledge Index
+
+Knowledge embeddings are kept in `.knowledge_cache/embeddings.sqlite3`, keyed
+by a hash of the embedder config and the chunk text. The crew embeds through
+this cache, so only new or changed chunks reach the embedding provider.
+Pre-compute embeddings before the first run (optionally with a batch size):
+
+```bash
+uv run python -m {project_name}.main build_knowledge_index 64
+```
+
+Delete `.knowledge_cache/` to start fresh.
+
+'''
+        knowledge_index_structure = (
+            "\n  - `knowledge_index.py`: Knowledge chunking and embedding cache (`main.py build_knowledge_index`)"
+        )
+
     readme_content = f'''# {project_name}
 
 {description}
@@ -241,7 +382,7 @@ crewai install
 
 1. Copy `.env.example` to `.env`
 2. Add your API keys to the `.env` file
-{langsmith_section}
+{langsmith_section}{tracing_section}{tool_cache_section}{llm_cache_section}{knowledge_index_section}
 ## Usage
 
 Run the crew:
@@ -268,16 +409,40 @@ Test the crew:
 crewai test <n_iterations> <eval_llm>
 ```
 
+Run the crew over a file of inputs (JSONL, or CSV with one column per input),
+with a concurrency limit; re-running resumes where it stopped:
+
+```bash
+uv run python -m {project_name}.main batch inputs.jsonl results.jsonl 8
+```
+
+For CPU-heavy tools, shard the inputs across worker processes instead (each
+builds the crew once; results are merged in input order):
+
+```bash
+uv run python -m {project_name}.main shard inputs.jsonl results.jsonl 4
+```
+
+Measure how long a cold process takes to build the crew (importing `crew.py`,
+instantiating it and calling `.crew()`), with the slowest imports:
+
+```bash
+uv run python -m {project_name}.main startup_benchmark 5
+```
+
 ## Project Structure
 
 - `src/{project_name}/`: Main project directory
   - `crew.py`: Crew configuration and orchestration
   - `main.py`: Entry point for running the crew
+  - `batch.py`: Concurrent batch runs over JSONL/CSV inputs (`main.py batch`)
+  - `shard_runner.py`: Multi-process batch runs (`main.py shard`)
+  - `startup_benchmark.py`: Cold-start crew construction timings (`main.py startup_benchmark`){knowledge_index_structure}
   - `config/`:
     - `agents.yaml`: Agent definitions
     - `tasks.yaml`: Task definitions
   - `tools/`: Custom tools directory
-  - `knowledge/`: Knowledge base files
+- `knowledge/`: Knowledge base files (CrewAI resolves knowledge file paths here)
 
 ## Generated with Gunny
 
@@ -326,6 +491,10 @@ wheels/
 
 # CrewAI
 .crewai/
+.knowledge_cache/
+traces/
+.tool_cache/
+.llm_cache/
 training_data.pkl
 *.log
 
@@ -3,12 +3,9 @@
 import streamlit as st
 from typing import Dict, List, Any, Optional
 from ui.icons import icon_inline
+from utils.catalog import get_tools_catalog, get_llm_providers
 from utils.constants import (
-    TOOLS_CATALOG,
-    LLM_PROVIDERS,
-    EMBEDDER_PROVIDERS,
     CODE_EXECUTION_MODES,
-    ENTERPRISE_APPS,
     DEFAULT_AGENT_CONFIG,
     DEFAULT_TASK_CONFIG,
 )
@@ -94,9 +91,10 @@ def agent_configuration_form(agent_index: int, agent_data: Optional[Dict[str, An
             )
 
     with st.expander("LLM Configuration"):
+        llm_providers = get_llm_providers()
         llm_provider = st.selectbox(
             "LLM Provider",
-            options=list(LLM_PROVIDERS.keys()),
+            options=list(llm_providers.keys()),
             key=f"agent_{agent_index}_llm_provider",
             help="Select the LLM provider for this agent"
         )
@@ -104,10 +102,10 @@ def agent_configuration_form(agent_index: int, agent_data: Optional[Dict[str, An
         col1, col2 = st.columns([1, 1])
 
         with col1:
-            if llm_provider in LLM_PROVIDERS:
+            if llm_provider in llm_providers:
                 llm_model = st.selectbox(
                     "Model (Preset)",
-                    options=LLM_PROVIDERS[llm_provider],
+                    options=llm_providers[llm_provider],
                     key=f"agent_{agent_index}_llm_model",
                     help="Select a preset model or enter custom name"
                 )
@@ -324,7 +322,7 @@ def tools_selector(selected_tools: List[str] = None) -> List[str]:
     selected = []
 
     # Display tools by category
-    for category, tools in TOOLS_CATALOG.items():
+    for category, tools in get_tools_catalog().items():
         with st.expander(f"{category} ({len(tools)} tools)"):
             for tool in tools:
                 # Filter by search query
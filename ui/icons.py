@@ -2,10 +2,20 @@
 SVG icon library for Gunny UI.
 
 Icons sourced from Lucide Icons (https://lucide.dev/) - MIT Licensed
+
+Icons are defined once in an SVG sprite (served as static/icons.svg, or
+inlined into the page when static serving is off); get_icon() returns a small
+<use> reference into it.
 """
 
+import hashlib
+import os
+from functools import lru_cache
 from typing import Dict
 
+import streamlit as st
+from ui.theme import STATIC_DIR, static_serving_available
+
 # SVG icon definitions (Lucide-style, outlined icons)
 ICONS: Dict[str, str] = {
     "target": '<circle cx="12" cy="12" r="10"/><circle cx="12" cy="12" r="6"/><circle cx="12" cy="12" r="2"/>',
@@ -34,6 +44,72 @@ ICONS: Dict[str, str] = {
 }
 
 
+SPRITE_FILE = "icons.svg"
+SYMBOL_PREFIX = "gi-"
+
+
+@lru_cache(maxsize=None)
+def get_sprite_svg() -> str:
+    """
+    Build an SVG sprite with one <symbol> per icon in ICONS.
+
+    Stroke color is left unset on the symbols so each reference inherits it
+    from the <svg> that uses it.
+
+    Returns:
+        Hidden <svg> element containing every icon as a <symbol>
+    """
+    symbols = "".join(
+        f'<symbol id="{SYMBOL_PREFIX}{name}" viewBox="0 0 24 24" fill="none" stroke-width="2" '
+        f'stroke-linecap="round" stroke-linejoin="round">{paths}</symbol>'
+        for name, paths in ICONS.items()
+    )
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg" width="0" height="0" '
+        f'style="position: absolute; width: 0; height: 0; overflow: hidden;" aria-hidden="true">{symbols}</svg>'
+    )
+
+
+def _write_sprite_file() -> bool:
+    """Write static/icons.svg if it is missing or out of date. Returns False if it cannot be written."""
+    path = os.path.join(STATIC_DIR, SPRITE_FILE)
+    sprite = get_sprite_svg()
+    try:
+        with open(path, encoding="utf-8") as f:
+            if f.read() == sprite:
+                return True
+    except OSError:
+        pass
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(sprite)
+    except OSError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def sprite_href() -> str:
+    """
+    Get the URL icon references point at (once per process).
+
+    Returns:
+        URL of the static sprite file (e.g. "app/static/icons.svg?v=1a2b3c4d5e6f"),
+        or "" when the sprite has to be inlined into the page instead
+    """
+    if not static_serving_available(".svg") or not _write_sprite_file():
+        return ""
+    digest = hashlib.sha256(get_sprite_svg().encode("utf-8")).hexdigest()[:12]
+    return f"app/static/{SPRITE_FILE}?v={digest}"
+
+
+def inject_icon_sprite() -> None:
+    """Inline the icon sprite into the page when it cannot be served as a static file."""
+    if not sprite_href():
+        st.markdown(get_sprite_svg(), unsafe_allow_html=True)
+
+
+@lru_cache(maxsize=1024)
 def get_icon(
     name: str,
     size: int = 20,
@@ -42,7 +118,7 @@ def get_icon(
     margin_right: str = "0.5rem",
 ) -> str:
     """
-    Get SVG icon markup.
+    Get SVG icon markup (a <use> reference into the icon sprite).
 
     Args:
         name: Icon name (e.g., 'target', 'bot', 'check-circle')
@@ -57,11 +133,9 @@ def get_icon(
     if name not in ICONS:
         return f"[{name}]"  # Fallback if icon not found
 
-    icon_path = ICONS[name]
-
     style = f"vertical-align: middle; display: inline-block; margin-right: {margin_right};"
 
-    svg = f'''<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" viewBox="0 0 24 24" fill="none" stroke="{color}" stroke-width="2" stroke-linecap="round" stroke-linejoin="round" class="{css_class}" style="{style}">{icon_path}</svg>'''
+    svg = f'''<svg width="{size}" height="{size}" stroke="{color}" class="{css_class}" style="{style}"><use href="{sprite_href()}#{SYMBOL_PREFIX}{name}"/></svg>'''
 
     return svg
 
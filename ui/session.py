@@ -0,0 +1,132 @@
+"""Session helpers tying process-wide caches to Streamlit's runtime."""
+
+import atexit
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+import streamlit as st
+from utils.artifact_store import ArtifactStore
+from utils.knowledge_store import KnowledgeStore
+from utils.version_checker import get_environment_fingerprint, get_version_info
+
+
+@st.cache_resource
+def get_artifact_store() -> ArtifactStore:
+    """
+    Get the process-wide artifact store (created once per server process).
+
+    Returns:
+        Shared ArtifactStore instance
+    """
+    store = ArtifactStore()
+    atexit.register(store.close)
+    return store
+
+
+@st.cache_resource
+def get_knowledge_store() -> KnowledgeStore:
+    """
+    Get the process-wide store for uploaded knowledge files.
+
+    Returns:
+        Shared KnowledgeStore instance
+    """
+    store = KnowledgeStore()
+    atexit.register(store.close)
+    return store
+
+
+def current_session_id() -> str:
+    """
+    Get the id of the session running the current script.
+
+    Returns:
+        Session id, or "default" outside a Streamlit script run (e.g. bare mode)
+    """
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else "default"
+
+
+def release_upload(upload: Any) -> None:
+    """
+    Drop an uploaded file's bytes from Streamlit's upload manager.
+
+    Streamlit keeps every upload in memory until its session ends; call this
+    once the file has been copied elsewhere. A no-op outside a script run.
+
+    Args:
+        upload: UploadedFile returned by st.file_uploader
+    """
+    from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    if ctx is not None and isinstance(ctx.uploaded_file_mgr, MemoryUploadedFileManager):
+        ctx.uploaded_file_mgr.remove_file(session_id=ctx.session_id, file_id=upload.file_id)
+
+
+def is_session_active(session_id: str) -> bool:
+    """
+    Check whether a session is still connected to this server.
+
+    Returns:
+        False once the session has ended; True when it cannot be determined
+    """
+    from streamlit import runtime
+
+    if not runtime.exists():
+        return True
+    return runtime.get_instance().is_active_session(session_id)
+
+
+def config_digest(config: Dict[str, Any]) -> str:
+    """
+    Hash a generation configuration so cached artifacts can be matched to it.
+
+    Args:
+        config: JSON-serializable configuration (non-serializable values use str())
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _cached_version_info(
+    fingerprint: Tuple[Tuple[str, int], ...],
+    tested_versions: Tuple[str, ...],
+    latest_tested: str,
+) -> Tuple[Optional[str], bool, str]:
+    """Compute get_version_info() once per environment fingerprint."""
+    return get_version_info(list(tested_versions), latest_tested)
+
+
+def get_cached_version_info(
+    tested_versions: List[str],
+    latest_tested: str,
+    refresh: bool = False,
+) -> Tuple[Optional[str], bool, str]:
+    """
+    Get CrewAI version info, detected once per process.
+
+    The result is shared by all sessions and recomputed only when the
+    installed packages change or a refresh is requested.
+
+    Args:
+        tested_versions: List of tested version strings
+        latest_tested: The latest tested version string
+        refresh: Discard the cached result and detect again
+
+    Returns:
+        Tuple of (version, is_compatible, message) as from get_version_info()
+    """
+    if refresh:
+        _cached_version_info.clear()
+    return _cached_version_info(
+        get_environment_fingerprint(), tuple(tested_versions), latest_tested
+    )
@@ -0,0 +1,92 @@
+"""
+Theme injection for the Gunny Streamlit app.
+
+The stylesheet lives in `static/theme.css`. When Streamlit's static file
+serving is enabled (see `.streamlit/config.toml`) each rerun only sends a
+`<link>` tag and the browser fetches, caches and parses the stylesheet once.
+Otherwise the stylesheet is inlined as a fallback.
+
+Fonts are self-hosted from `static/fonts/` (see fetch_fonts.py) and preloaded;
+the stylesheet's fallback font stack is used until they arrive, or if they are
+not bundled at all.
+"""
+
+import hashlib
+import os
+from functools import lru_cache
+
+import streamlit as st
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static")
+THEME_FILE = "theme.css"
+FONT_FILES = ["fonts/outfit-latin.woff2", "fonts/fira-code-latin.woff2"]
+
+
+@lru_cache(maxsize=None)
+def _read_static(filename: str) -> str:
+    """Read a file from the static directory (once per process)."""
+    with open(os.path.join(STATIC_DIR, filename), encoding="utf-8") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def static_url(filename: str) -> str:
+    """
+    Get the URL of a static file with a content hash for cache busting.
+
+    Args:
+        filename: File name relative to the static directory
+
+    Returns:
+        Relative URL (e.g. "app/static/theme.css?v=1a2b3c4d5e6f")
+    """
+    digest = hashlib.sha256(_read_static(filename).encode("utf-8")).hexdigest()[:12]
+    return f"app/static/{filename}?v={digest}"
+
+
+def static_serving_available(extension: str = ".css") -> bool:
+    """
+    Check whether files in static/ with the given extension are served with
+    their correct content type.
+
+    Older (Tornado-based) Streamlit servers only serve an allow-list of
+    extensions and send everything else as text/plain, which browsers refuse
+    to apply as a stylesheet or SVG.
+
+    Args:
+        extension: File extension, including the dot
+
+    Returns:
+        True if referencing such files from static/ will work
+    """
+    if not st.get_option("server.enableStaticServing"):
+        return False
+    try:
+        from streamlit.web.server.app_static_file_handler import SAFE_APP_STATIC_FILE_EXTENSIONS
+    except ImportError:
+        return True
+    return extension in SAFE_APP_STATIC_FILE_EXTENSIONS
+
+
+@lru_cache(maxsize=None)
+def _theme_head() -> str:
+    """Build the theme markup sent on every rerun (once per process)."""
+    tags = []
+    if static_serving_available(".woff2"):
+        tags.extend(
+            f'<link rel="preload" href="app/static/{font}" as="font" type="font/woff2" crossorigin>'
+            for font in FONT_FILES
+            if os.path.exists(os.path.join(STATIC_DIR, font))
+        )
+    if static_serving_available():
+        tags.append(f'<link rel="stylesheet" href="{static_url(THEME_FILE)}">')
+    else:
+        # Inlined CSS resolves url()s against the page, not against static/
+        css = _read_static(THEME_FILE).replace("url('fonts/", "url('app/static/fonts/")
+        tags.append(f"<style>\n{css}\n</style>")
+    return "\n".join(tags)
+
+
+def inject_theme() -> None:
+    """Apply the Gunny theme: a cached `<link>` when possible, inline CSS otherwise."""
+    st.markdown(_theme_head(), unsafe_allow_html=True)
@@ -0,0 +1,292 @@
+"""
+Bounded, expiring storage for generated artifacts.
+
+Each Streamlit session generates project files, a ZIP archive and preview
+strings. This module keeps them in a single process-wide store with:
+
+- a per-session in-memory byte budget (overflow spills to a temp directory)
+- a global in-memory budget and a disk budget, enforced with LRU eviction
+  across all sessions
+- a TTL after which idle artifacts are dropped
+- explicit cleanup when a session ends
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple, Union
+
+Artifact = Union[bytes, str]
+
+MIB = 1024 * 1024
+
+
+class _Entry:
+    """A stored artifact, held either in memory or in a spill file."""
+
+    __slots__ = ("size", "is_text", "version", "data", "path", "last_access")
+
+    def __init__(self, size: int, is_text: bool, version: Optional[str]):
+        self.size = size
+        self.is_text = is_text
+        self.version = version
+        self.data: Optional[bytes] = None
+        self.path: Optional[str] = None
+        self.last_access = time.monotonic()
+
+
+class ArtifactStore:
+    """
+    Process-wide artifact store shared by all sessions.
+
+    Artifacts are addressed by (session_id, key) and may carry a version tag
+    (e.g. a digest of the configuration that produced them); a lookup with a
+    different version is a miss.
+    """
+
+    def __init__(
+        self,
+        session_budget_bytes: int = 2 * MIB,
+        memory_budget_bytes: int = 64 * MIB,
+        disk_budget_bytes: int = 1024 * MIB,
+        spill_threshold_bytes: int = 512 * 1024,
+        ttl_seconds: float = 3600.0,
+        sweep_interval_seconds: float = 30.0,
+        spill_dir: Optional[str] = None,
+    ):
+        """
+        Args:
+            session_budget_bytes: In-memory bytes one session may hold before spilling
+            memory_budget_bytes: In-memory bytes across all sessions
+            disk_budget_bytes: Spilled bytes across all sessions
+            spill_threshold_bytes: Artifacts at least this large go straight to disk
+            ttl_seconds: Idle time after which an artifact expires
+            sweep_interval_seconds: Minimum time between automatic sweeps
+            spill_dir: Directory for spill files (default: a private temp dir)
+        """
+        self.session_budget_bytes = session_budget_bytes
+        self.memory_budget_bytes = memory_budget_bytes
+        self.disk_budget_bytes = disk_budget_bytes
+        self.spill_threshold_bytes = spill_threshold_bytes
+        self.ttl_seconds = ttl_seconds
+        self.sweep_interval_seconds = sweep_interval_seconds
+
+        self._spill_dir = spill_dir
+        self._owns_spill_dir = spill_dir is None
+        self._entries: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()
+        self._session_memory: Dict[str, int] = {}
+        self._memory_bytes = 0
+        self._disk_bytes = 0
+        self._last_sweep = time.monotonic()
+        self._lock = threading.RLock()
+        self._stats = {"hits": 0, "misses": 0, "spills": 0, "evictions": 0, "expired": 0}
+
+    # Public API ------------------------------------------------------------
+
+    def put(self, session_id: str, key: str, data: Artifact, version: Optional[str] = None) -> None:
+        """
+        Store an artifact, replacing any previous one under the same key.
+
+        Args:
+            session_id: Owning session
+            key: Artifact name within the session (e.g. "project_zip")
+            data: Artifact content (bytes or str)
+            version: Optional version tag checked by get()
+        """
+        is_text = isinstance(data, str)
+        payload = data.encode("utf-8") if is_text else bytes(data)
+        entry = _Entry(len(payload), is_text, version)
+
+        with self._lock:
+            self._remove((session_id, key))
+            spill = (
+                entry.size >= self.spill_threshold_bytes
+                or entry.size > self.session_budget_bytes
+            )
+            if spill:
+                self._write_spill(entry, payload)
+            else:
+                self._make_room_in_session(session_id, entry.size)
+                entry.data = payload
+                self._account_memory(session_id, entry.size)
+            self._entries[(session_id, key)] = entry
+            self._enforce_global_budgets()
+
+    def get(self, session_id: str, key: str, version: Optional[str] = None) -> Optional[Artifact]:
+        """
+        Fetch an artifact, refreshing its LRU position.
+
+        Returns:
+            The artifact, or None if missing, expired or of a different version
+        """
+        with self._lock:
+            entry = self._entries.get((session_id, key))
+            if entry is None or (version is not None and entry.version != version):
+                self._stats["misses"] += 1
+                return None
+            if self._is_expired(entry, time.monotonic()):
+                self._remove((session_id, key))
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return None
+
+            payload = entry.data if entry.data is not None else self._read_spill(entry)
+            if payload is None:
+                self._remove((session_id, key))
+                self._stats["misses"] += 1
+                return None
+
+            entry.last_access = time.monotonic()
+            self._entries.move_to_end((session_id, key))
+            self._stats["hits"] += 1
+            return payload.decode("utf-8") if entry.is_text else payload
+
+    def drop_session(self, session_id: str) -> None:
+        """Remove every artifact belonging to a session (e.g. when it ends)."""
+        with self._lock:
+            for entry_key in [k for k in self._entries if k[0] == session_id]:
+                self._remove(entry_key)
+            self._session_memory.pop(session_id, None)
+
+    def sweep(self, is_session_alive: Optional[Callable[[str], bool]] = None) -> int:
+        """
+        Drop expired artifacts and artifacts of sessions that have ended.
+
+        Args:
+            is_session_alive: Callback returning False for ended sessions
+
+        Returns:
+            Number of artifacts removed
+        """
+        now = time.monotonic()
+        removed = 0
+        with self._lock:
+            self._last_sweep = now
+            dead_sessions = set()
+            if is_session_alive is not None:
+                for session_id in {k[0] for k in self._entries}:
+                    if not is_session_alive(session_id):
+                        dead_sessions.add(session_id)
+
+            for entry_key, entry in list(self._entries.items()):
+                if entry_key[0] in dead_sessions:
+                    self._remove(entry_key)
+                    removed += 1
+                elif self._is_expired(entry, now):
+                    self._remove(entry_key)
+                    self._stats["expired"] += 1
+                    removed += 1
+            for session_id in dead_sessions:
+                self._session_memory.pop(session_id, None)
+        return removed
+
+    def maybe_sweep(self, is_session_alive: Optional[Callable[[str], bool]] = None) -> int:
+        """Run sweep() if at least sweep_interval_seconds have passed since the last one."""
+        if time.monotonic() - self._last_sweep < self.sweep_interval_seconds:
+            return 0
+        return self.sweep(is_session_alive)
+
+    def stats(self) -> Dict[str, int]:
+        """Return counters and current memory/disk usage."""
+        with self._lock:
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "sessions": len({k[0] for k in self._entries}),
+                "memory_bytes": self._memory_bytes,
+                "disk_bytes": self._disk_bytes,
+            }
+
+    def close(self) -> None:
+        """Drop every artifact and remove the private spill directory."""
+        with self._lock:
+            for entry_key in list(self._entries):
+                self._remove(entry_key)
+            self._session_memory.clear()
+            if self._owns_spill_dir and self._spill_dir and os.path.isdir(self._spill_dir):
+                shutil.rmtree(self._spill_dir, ignore_errors=True)
+                self._spill_dir = None
+
+    # Internals (callers hold self._lock) -------------------------------------
+
+    def _is_expired(self, entry: _Entry, now: float) -> bool:
+        return self.ttl_seconds > 0 and now - entry.last_access > self.ttl_seconds
+
+    def _account_memory(self, session_id: str, delta: int) -> None:
+        self._memory_bytes += delta
+        usage = self._session_memory.get(session_id, 0) + delta
+        if usage > 0:
+            self._session_memory[session_id] = usage
+        else:
+            self._session_memory.pop(session_id, None)
+
+    def _remove(self, entry_key: Tuple[str, str]) -> None:
+        entry = self._entries.pop(entry_key, None)
+        if entry is None:
+            return
+        if entry.data is not None:
+            self._account_memory(entry_key[0], -entry.size)
+            entry.data = None
+        if entry.path is not None:
+            self._delete_spill(entry)
+
+    def _ensure_spill_dir(self) -> str:
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix="gunny-artifacts-")
+        os.makedirs(self._spill_dir, exist_ok=True)
+        return self._spill_dir
+
+    def _write_spill(self, entry: _Entry, payload: bytes) -> None:
+        fd, path = tempfile.mkstemp(dir=self._ensure_spill_dir(), suffix=".bin")
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        entry.path = path
+        self._disk_bytes += entry.size
+        self._stats["spills"] += 1
+
+    def _read_spill(self, entry: _Entry) -> Optional[bytes]:
+        try:
+            with open(entry.path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _delete_spill(self, entry: _Entry) -> None:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+        self._disk_bytes -= entry.size
+        entry.path = None
+
+    def _spill_entry(self, entry_key: Tuple[str, str], entry: _Entry) -> None:
+        payload = entry.data
+        self._account_memory(entry_key[0], -entry.size)
+        entry.data = None
+        self._write_spill(entry, payload)
+
+    def _make_room_in_session(self, session_id: str, incoming: int) -> None:
+        """Spill this session's least recently used in-memory artifacts until `incoming` fits."""
+        for entry_key, entry in list(self._entries.items()):
+            if self._session_memory.get(session_id, 0) + incoming <= self.session_budget_bytes:
+                return
+            if entry_key[0] == session_id and entry.data is not None:
+                self._spill_entry(entry_key, entry)
+
+    def _enforce_global_budgets(self) -> None:
+        """Spill LRU artifacts past the memory budget, then evict LRU spills past the disk budget."""
+        for entry_key, entry in list(self._entries.items()):
+            if self._memory_bytes <= self.memory_budget_bytes:
+                break
+            if entry.data is not None:
+                self._spill_entry(entry_key, entry)
+
+        for entry_key, entry in list(self._entries.items()):
+            if self._disk_bytes <= self.disk_budget_bytes:
+                break
+            if entry.path is not None:
+                self._remove(entry_key)
+                self._stats["evictions"] += 1
@@ -0,0 +1,254 @@
+"""
+CrewAI catalog data: tools, embedder providers, LLM providers and more.
+
+The catalog lives in `utils/data/catalog.json` rather than in Python code so it
+can be updated without touching code. It is loaded on first use, cached for the
+lifetime of the process, and indexed by tool name for fast lookups.
+"""
+
+import json
+import os
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
+
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "catalog.json")
+
+# Top-level sections of catalog.json, in the order they are written
+CATALOG_SECTIONS = [
+    "tools",
+    "embedder_providers",
+    "embedder_models",
+    "local_embedders",
+    "tool_cache_ttls",
+    "uncached_tools",
+    "llm_providers",
+    "knowledge_source_types",
+    "enterprise_apps",
+]
+
+
+@lru_cache(maxsize=None)
+def load_catalog(path: str = CATALOG_PATH) -> Dict[str, Any]:
+    """
+    Load the catalog data file (once per process and path).
+
+    Args:
+        path: Path to the catalog JSON file
+
+    Returns:
+        Dictionary with the sections listed in CATALOG_SECTIONS
+    """
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def get_catalog_index() -> Dict[str, Any]:
+    """
+    Build the in-memory index of the tools catalog (once per process).
+
+    Returns:
+        Dictionary with:
+        - by_name: tool name -> tool entry including its "category"
+        - tool_names: all tool names in catalog order
+        - env_requirements: tool name -> env vars, for tools that need any
+        - tool_count: number of tools
+    """
+    by_name = {}
+    for category, tools in get_tools_catalog().items():
+        for tool in tools:
+            by_name[tool["name"]] = {"category": category, **tool}
+
+    return {
+        "by_name": by_name,
+        "tool_names": list(by_name),
+        "env_requirements": {
+            name: list(tool["env_vars"]) for name, tool in by_name.items() if tool.get("env_vars")
+        },
+        "tool_count": len(by_name),
+    }
+
+
+def get_tools_catalog() -> Dict[str, List[Dict[str, Any]]]:
+    """Get the tools catalog grouped by category."""
+    return load_catalog()["tools"]
+
+
+def get_tool(name: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up a tool by name.
+
+    Returns:
+        Tool entry (with "category") or None if the tool is unknown
+    """
+    return get_catalog_index()["by_name"].get(name)
+
+
+def get_tool_names() -> List[str]:
+    """Get every tool name in catalog order."""
+    return get_catalog_index()["tool_names"]
+
+
+def get_tool_count() -> int:
+    """Get the number of tools in the catalog."""
+    return get_catalog_index()["tool_count"]
+
+
+def get_tool_env_requirements() -> Dict[str, List[str]]:
+    """Get the env vars required by each tool that needs any."""
+    return get_catalog_index()["env_requirements"]
+
+
+def get_env_vars_for_tools(tool_names: Iterable[str]) -> Dict[str, List[str]]:
+    """
+    Map each env var needed by the given tools to the tools that need it.
+
+    Args:
+        tool_names: Names of selected tools
+
+    Returns:
+        Dictionary mapping env var name to a list of tool names
+    """
+    requirements = get_tool_env_requirements()
+    env_map: Dict[str, List[str]] = {}
+    for name in tool_names:
+        for env_var in requirements.get(name, []):
+            env_map.setdefault(env_var, []).append(name)
+    return env_map
+
+
+def get_embedder_providers() -> List[str]:
+    """Get the supported embedder provider names."""
+    return load_catalog()["embedder_providers"]
+
+
+def get_embedder_default_model(provider: str) -> Optional[str]:
+    """Get a provider's default embedding model (None if it takes no model)."""
+    return load_catalog()["embedder_models"].get(provider, {}).get("default")
+
+
+def get_embedder_config(provider: str, model: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Build the embedder configuration passed to Crew(embedder=...).
+
+    The model goes under the provider's own config key ("model_name" for
+    most CrewAI providers, "model" for voyageai, "model_id" for watsonx).
+
+    Args:
+        provider: Embedder provider name (see get_embedder_providers())
+        model: Embedding model (default: the provider's default model, if it has one)
+
+    Returns:
+        Dictionary with "provider" and "config"
+    """
+    entry = load_catalog()["embedder_models"].get(provider)
+    model = model or get_embedder_default_model(provider)
+    return {"provider": provider, "config": {entry["key"]: model} if entry and model else {}}
+
+
+def get_local_embedder_providers() -> List[str]:
+    """Get the embedder providers that can run without network access."""
+    return list(load_catalog()["local_embedders"])
+
+
+def get_local_embedder_config(
+    provider: str,
+    model: Optional[str] = None,
+    batch_size: int = 32,
+    threads: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Build a fully local embedder configuration (no network round-trips).
+
+    Args:
+        provider: Local embedder provider (see get_local_embedder_providers())
+        model: Model directory, or the model name for Ollama (default: catalog default)
+        batch_size: Texts embedded per model call
+        threads: CPU threads for inference (default: the runtime's choice)
+
+    Returns:
+        Dictionary with "provider", "config", "local": True and the extra
+        packages the provider needs ("dependencies", name -> version constraint)
+    """
+    entry = load_catalog()["local_embedders"][provider]
+    config = {"model": model or entry["model"], "batch_size": batch_size}
+    if threads:
+        config["threads"] = threads
+    return {"provider": provider, "config": config, "local": True, "dependencies": entry["dependencies"]}
+
+
+def get_tool_cache_ttls(tool_names: Iterable[str]) -> Dict[str, int]:
+    """
+    Get how long each tool's results may be reused from a persistent cache.
+
+    Args:
+        tool_names: Names of selected tools
+
+    Returns:
+        Dictionary mapping tool name to TTL in seconds (0 = never cache, for
+        tools with side effects); the TTL comes from the tool's category
+    """
+    catalog = load_catalog()
+    ttls_by_category = catalog["tool_cache_ttls"]
+    uncached = set(catalog["uncached_tools"])
+    by_name = get_catalog_index()["by_name"]
+    ttls = {}
+    for name in tool_names:
+        if name in uncached:
+            ttls[name] = 0
+        elif name in by_name:
+            ttls[name] = ttls_by_category.get(by_name[name]["category"], ttls_by_category["default"])
+        else:
+            ttls[name] = ttls_by_category["default"]
+    return ttls
+
+
+def get_llm_providers() -> Dict[str, List[str]]:
+    """Get LLM provider names mapped to preset model names."""
+    return load_catalog()["llm_providers"]
+
+
+def get_knowledge_source_types() -> List[str]:
+    """Get the supported knowledge source types."""
+    return load_catalog()["knowledge_source_types"]
+
+
+def get_enterprise_apps() -> List[str]:
+    """Get the enterprise app integrations."""
+    return load_catalog()["enterprise_apps"]
+
+
+def dump_catalog(catalog: Dict[str, Any], path: str = CATALOG_PATH) -> None:
+    """
+    Write a catalog in the compact, diff-friendly layout (one tool per line).
+
+    Args:
+        catalog: Dictionary with the sections listed in CATALOG_SECTIONS
+        path: Destination file
+    """
+    def compact(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+    lines = ["{"]
+    sections = [section for section in CATALOG_SECTIONS if section in catalog]
+    for s_index, section in enumerate(sections):
+        value = catalog[section]
+        section_end = "," if s_index < len(sections) - 1 else ""
+        if section == "tools":
+            lines.append('"tools":{')
+            categories = list(value.items())
+            for c_index, (category, tools) in enumerate(categories):
+                lines.append(f"{compact(category)}:[")
+                for t_index, tool in enumerate(tools):
+                    lines.append(compact(tool) + ("," if t_index < len(tools) - 1 else ""))
+                lines.append("]" + ("," if c_index < len(categories) - 1 else ""))
+            lines.append("}" + section_end)
+        else:
+            lines.append(f"{compact(section)}:{compact(value)}{section_end}")
+    lines.append("}")
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+    load_catalog.cache_clear()
+    get_catalog_index.cache_clear()
@@ -0,0 +1,262 @@
+"""
+Content-addressed temp storage for uploaded knowledge files.
+
+Uploads are copied to disk in fixed-size chunks while being hashed, so no
+session ever holds a whole file; sessions keep only small manifest entries
+({"name", "digest", "size"}). Identical content uploaded by any session is
+stored once and reference-counted, and blobs are deleted when the last
+session referencing them ends. Project archives that bundle knowledge files
+are written next to the blobs, streaming each file from disk (see
+generators.archive.write_archive), up to MAX_BUNDLE_BYTES of knowledge.
+"""
+
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, List, Optional, Set
+
+MIB = 1024 * 1024
+CHUNK_SIZE = MIB
+
+# Largest total of knowledge files bundled into one download. Streamlit holds
+# a download's bytes in memory while serving it, so larger corpora are left
+# out of the archive (their knowledge sources are still generated).
+MAX_BUNDLE_BYTES = 128 * MIB
+
+# File extension -> knowledge source type (see get_knowledge_source_types())
+KNOWLEDGE_FILE_TYPES = {
+    "pdf": "PDF",
+    "txt": "TextFile",
+    "md": "TextFile",
+    "csv": "CSV",
+    "json": "JSON",
+    "xlsx": "Excel",
+    "xls": "Excel",
+}
+
+
+class KnowledgeStoreFull(Exception):
+    """Raised when storing an upload would exceed the disk budget."""
+
+
+def safe_knowledge_name(name: str) -> str:
+    """
+    Reduce an uploaded file name to a safe file name inside knowledge/.
+
+    Args:
+        name: Name reported by the browser
+
+    Returns:
+        Base name with path separators and unusual characters replaced
+    """
+    base = os.path.basename(name.replace("\\", "/")).strip()
+    base = re.sub(r"[^A-Za-z0-9._ -]", "_", base).lstrip(".")
+    return base or "knowledge_file"
+
+
+def unique_knowledge_name(name: str, taken: Set[str]) -> str:
+    """Suffix a file name ("report-2.pdf") until it does not clash with `taken`."""
+    stem, dot, extension = name.rpartition(".")
+    if not dot:
+        stem, extension = name, ""
+    candidate = name
+    counter = 2
+    while candidate in taken:
+        candidate = f"{stem}-{counter}{dot}{extension}"
+        counter += 1
+    return candidate
+
+
+def knowledge_source_type(name: str) -> str:
+    """Get the knowledge source type for a file name (TextFile if unknown)."""
+    return KNOWLEDGE_FILE_TYPES.get(name.rsplit(".", 1)[-1].lower(), "TextFile")
+
+
+class KnowledgeStore:
+    """Process-wide, deduplicating store for knowledge uploads and the archives that bundle them."""
+
+    def __init__(self, root: Optional[str] = None, disk_budget_bytes: int = 4096 * MIB):
+        """
+        Args:
+            root: Storage directory (default: a private temp dir)
+            disk_budget_bytes: Bytes of unique uploads kept across all sessions
+        """
+        self.disk_budget_bytes = disk_budget_bytes
+        self._root = root
+        self._owns_root = root is None
+        self._refs: Dict[str, Set[str]] = {}
+        self._sizes: Dict[str, int] = {}
+        self._archives: Dict[str, str] = {}
+        self._disk_bytes = 0
+        self._lock = threading.RLock()
+        self._stats = {"uploads": 0, "deduplicated": 0}
+
+    # Public API ------------------------------------------------------------
+
+    def add(self, session_id: str, name: str, stream: IO[bytes]) -> Dict[str, Any]:
+        """
+        Copy an upload into the store in chunks and reference it from a session.
+
+        Args:
+            session_id: Owning session
+            name: Original file name
+            stream: Readable binary stream positioned at the start of the file
+
+        Returns:
+            Manifest entry {"name", "digest", "size"} for the session state
+
+        Raises:
+            KnowledgeStoreFull: If the upload does not fit in the disk budget
+        """
+        blob_dir = self._ensure_dir("blobs")
+        digest = hashlib.sha256()
+        size = 0
+        fd, temp_path = tempfile.mkstemp(dir=blob_dir, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                while True:
+                    chunk = stream.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    size += len(chunk)
+                    f.write(chunk)
+
+            key = digest.hexdigest()
+            with self._lock:
+                self._stats["uploads"] += 1
+                if key in self._sizes:
+                    self._stats["deduplicated"] += 1
+                else:
+                    if self._disk_bytes + size > self.disk_budget_bytes:
+                        raise KnowledgeStoreFull(
+                            f"Knowledge storage is full ({self.disk_budget_bytes // MIB} MiB)"
+                        )
+                    os.replace(temp_path, self.path(key))
+                    self._sizes[key] = size
+                    self._disk_bytes += size
+                self._refs.setdefault(key, set()).add(session_id)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        return {"name": safe_knowledge_name(name), "digest": key, "size": size}
+
+    def path(self, digest: str) -> Path:
+        """Get the on-disk path of a stored upload."""
+        return Path(self._ensure_dir("blobs")) / digest
+
+    def release(self, session_id: str, digest: str) -> None:
+        """Drop a session's reference to an upload, deleting it if unused."""
+        with self._lock:
+            sessions = self._refs.get(digest)
+            if sessions is None:
+                return
+            sessions.discard(session_id)
+            if not sessions:
+                self._delete_blob(digest)
+
+    def archive_path(self, session_id: str, filename: str) -> Path:
+        """
+        Get the path for a session's bundled archive, deleting its previous one.
+
+        Each session keeps at most one archive on disk.
+
+        Args:
+            session_id: Owning session
+            filename: Archive file name (should identify its contents)
+
+        Returns:
+            Path to write the archive to (may already exist)
+        """
+        path = os.path.join(self._ensure_dir("archives"), f"{session_id}-{filename}")
+        with self._lock:
+            previous = self._archives.get(session_id)
+            if previous and previous != path:
+                self._remove_file(previous)
+            self._archives[session_id] = path
+        return Path(path)
+
+    def drop_session(self, session_id: str) -> None:
+        """Release every upload and archive belonging to a session."""
+        with self._lock:
+            for digest in [d for d, sessions in self._refs.items() if session_id in sessions]:
+                self.release(session_id, digest)
+            archive = self._archives.pop(session_id, None)
+            if archive:
+                self._remove_file(archive)
+
+    def sweep(self, is_session_alive: Callable[[str], bool]) -> int:
+        """
+        Drop the uploads and archives of sessions that have ended.
+
+        Returns:
+            Number of sessions dropped
+        """
+        with self._lock:
+            sessions = {s for refs in self._refs.values() for s in refs} | set(self._archives)
+            dead = [session_id for session_id in sessions if not is_session_alive(session_id)]
+            for session_id in dead:
+                self.drop_session(session_id)
+        return len(dead)
+
+    def stats(self) -> Dict[str, int]:
+        """Return upload counters and current disk usage."""
+        with self._lock:
+            return {**self._stats, "blobs": len(self._sizes), "disk_bytes": self._disk_bytes}
+
+    def close(self) -> None:
+        """Forget everything and remove the private storage directory."""
+        with self._lock:
+            self._refs.clear()
+            self._sizes.clear()
+            self._archives.clear()
+            self._disk_bytes = 0
+            if self._owns_root and self._root and os.path.isdir(self._root):
+                shutil.rmtree(self._root, ignore_errors=True)
+                self._root = None
+
+    # Internals -------------------------------------------------------------
+
+    def _ensure_dir(self, name: str) -> str:
+        with self._lock:
+            if self._root is None:
+                self._root = tempfile.mkdtemp(prefix="gunny-knowledge-")
+            path = os.path.join(self._root, name)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def _delete_blob(self, digest: str) -> None:
+        self._refs.pop(digest, None)
+        self._disk_bytes -= self._sizes.pop(digest, 0)
+        self._remove_file(str(self.path(digest)))
+
+    @staticmethod
+    def _remove_file(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def knowledge_archive_entries(
+    files: List[Dict[str, Any]],
+    store: KnowledgeStore,
+    knowledge_dir: str,
+) -> Dict[str, Path]:
+    """
+    Map a session's uploaded knowledge files to archive entries.
+
+    Args:
+        files: Manifest entries from KnowledgeStore.add()
+        store: Store holding the uploads
+        knowledge_dir: Directory inside the project (e.g. "knowledge", at its root)
+
+    Returns:
+        Dictionary mapping archive paths to on-disk paths (streamed, never loaded)
+    """
+    return {f"{knowledge_dir}/{entry['name']}": store.path(entry["digest"]) for entry in files}
@@ -1,6 +1,7 @@
 """Validation functions for CrewAI configurations."""
 
 from typing import Dict, List, Any, Tuple
+from utils.catalog import get_env_vars_for_tools, get_tool
 
 
 def validate_agent_config(agent_config: Dict[str, Any]) -> Tuple[bool, List[str]]:
@@ -174,12 +175,8 @@ def check_required_env_vars(agents_config: List[Dict[str, Any]], tasks_tools: Li
             required_vars.add("AZURE_OPENAI_API_KEY")
             required_vars.add("AZURE_OPENAI_ENDPOINT")
 
-    # Check tool requirements - primary source is TOOLS_CATALOG
-    from utils.constants import TOOLS_CATALOG
-    for category, tools in TOOLS_CATALOG.items():
-        for tool in tools:
-            if tool["name"] in tasks_tools and tool.get("env_vars"):
-                required_vars.update(tool["env_vars"])
+    # Check tool requirements - primary source is the tools catalog
+    required_vars.update(get_env_vars_for_tools(tasks_tools))
 
     # Check LangSmith requirements
     if enable_langsmith:
@@ -233,16 +230,16 @@ def get_detailed_env_requirements(agents_config: List[Dict[str, Any]], tasks_too
                 env_details[var]["required_by"].append(f"Agent: {agent_role}")
 
     # Check tool requirements
-    from utils.constants import TOOLS_CATALOG
-    for category, tools in TOOLS_CATALOG.items():
-        for tool in tools:
-            if tool["name"] in tasks_tools and tool.get("env_vars"):
-                for env_var in tool["env_vars"]:
-                    if env_var not in env_details:
-                        env_details[env_var] = {"required_by": [], "category": "Tool"}
-                    env_details[env_var]["required_by"].append(f"Tool: {tool['name']}")
-                    if tool.get("auth_note"):
-                        env_details[env_var]["auth_note"] = tool["auth_note"]
+    for tool_name in tasks_tools:
+        tool = get_tool(tool_name)
+        if not tool or not tool.get("env_vars"):
+            continue
+        for env_var in tool["env_vars"]:
+            if env_var not in env_details:
+                env_details[env_var] = {"required_by": [], "category": "Tool"}
+            env_details[env_var]["required_by"].append(f"Tool: {tool['name']}")
+            if tool.get("auth_note"):
+                env_details[env_var]["auth_note"] = tool["auth_note"]
 
     # Check LangSmith requirements
     if enable_langsmith:
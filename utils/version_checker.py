@@ -6,18 +6,23 @@ and check compatibility with Gunny's tested versions.
 """
 
 import importlib.metadata
+import os
+import sys
 from typing import Tuple, Optional
 
 
-def get_crewai_version() -> Optional[str]:
+def get_crewai_version(package: str = 'crewai') -> Optional[str]:
     """
     Get the installed CrewAI version.
 
+    Args:
+        package: Distribution to look up (default: crewai; e.g. crewai-tools)
+
     Returns:
         Version string (e.g., "0.4.0") or None if CrewAI is not installed
     """
     try:
-        version = importlib.metadata.version('crewai')
+        version = importlib.metadata.version(package)
         return version
     except importlib.metadata.PackageNotFoundError:
         return None
@@ -26,6 +31,27 @@ def get_crewai_version() -> Optional[str]:
         return None
 
 
+def get_environment_fingerprint() -> Tuple[Tuple[str, int], ...]:
+    """
+    Get a cheap fingerprint of the Python environment's installed packages.
+
+    Installing, upgrading or removing a distribution adds or removes a
+    `*.dist-info` directory, which changes the modification time of the
+    directory on sys.path that holds it. Stat-ing those directories is far
+    cheaper than the metadata scan done by importlib.metadata.version().
+
+    Returns:
+        Tuple of (sys.path entry, modification time in ns) pairs
+    """
+    fingerprint = []
+    for entry in sys.path:
+        try:
+            fingerprint.append((entry, os.stat(entry or ".").st_mtime_ns))
+        except OSError:
+            fingerprint.append((entry, 0))
+    return tuple(fingerprint)
+
+
 def parse_version(version_str: str) -> Tuple[int, ...]:
     """
     Parse a version string into a tuple of integers for comparison.